@@ -3,6 +3,7 @@ import os
 from logging.config import fileConfig
 from alembic import context
 from sqlalchemy import engine_from_config, pool
+from sqlalchemy.engine import make_url
 
 # ensure src is on path so imports work
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -22,6 +23,7 @@ if config.config_file_name is not None:
 # Import the app's metadata
 try:
     from event_service.database import Base
+    from event_service.models.event import SQLITE_ONLY_METADATA
     from event_service.core.config import settings
 except Exception as e:
     # Import errors should be logged
@@ -36,9 +38,17 @@ if hasattr(settings, 'DATABASE_URL') and settings.DATABASE_URL:
 target_metadata = Base.metadata
 
 
+def _target_metadata(dialect_name):
+    # Tables such as event_participants only exist on SQLite
+    if dialect_name == 'sqlite':
+        return [target_metadata, SQLITE_ONLY_METADATA]
+    return target_metadata
+
+
 def run_migrations_offline() -> None:
     url = config.get_main_option('sqlalchemy.url')
-    context.configure(url=url, target_metadata=target_metadata, literal_binds=True)
+    dialect_name = make_url(url).get_backend_name() if url else None
+    context.configure(url=url, target_metadata=_target_metadata(dialect_name), literal_binds=True)
 
     with context.begin_transaction():
         context.run_migrations()
@@ -52,7 +62,7 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(connection=connection, target_metadata=_target_metadata(connection.dialect.name))
 
         with context.begin_transaction():
             context.run_migrations()
@@ -0,0 +1,82 @@
+"""Auto-generated Alembic migration script."""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '003ae4be3308'
+down_revision = 'd89cbf963ba3'
+branch_labels = None
+depends_on = None
+
+
+POSTGRES_SEARCH_VECTOR = """
+    ALTER TABLE events ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(name, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(location, '')), 'B')
+        || setweight(to_tsvector('english', coalesce(description, '')), 'C')
+    ) STORED
+"""
+
+SQLITE_FTS = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
+        name, description, location, content='events', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_ai AFTER INSERT ON events
+    BEGIN
+        INSERT INTO events_fts (rowid, name, description, location)
+        VALUES (NEW.id, NEW.name, NEW.description, NEW.location);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_au AFTER UPDATE OF name, description, location ON events
+    BEGIN
+        INSERT INTO events_fts (events_fts, rowid, name, description, location)
+        VALUES ('delete', OLD.id, OLD.name, OLD.description, OLD.location);
+        INSERT INTO events_fts (rowid, name, description, location)
+        VALUES (NEW.id, NEW.name, NEW.description, NEW.location);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_ad AFTER DELETE ON events
+    BEGIN
+        INSERT INTO events_fts (events_fts, rowid, name, description, location)
+        VALUES ('delete', OLD.id, OLD.name, OLD.description, OLD.location);
+    END
+    """,
+    # Index the existing rows
+    "INSERT INTO events_fts (events_fts) VALUES ('rebuild')",
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    dialect = getattr(bind, 'dialect', None)
+    dialect_name = dialect.name if dialect is not None else None
+
+    if dialect_name == 'postgresql':
+        # Weighted name (A) > location (B) > description (C); the generated column rewrites the table once
+        op.execute(POSTGRES_SEARCH_VECTOR)
+        op.create_index('ix_events_search_vector', 'events', ['search_vector'], postgresql_using='gin')
+        return
+
+    # External-content FTS5 table: stores only the index, the text stays in events
+    for statement in SQLITE_FTS:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    dialect = getattr(bind, 'dialect', None)
+    dialect_name = dialect.name if dialect is not None else None
+
+    if dialect_name == 'postgresql':
+        op.drop_index('ix_events_search_vector', table_name='events')
+        op.drop_column('events', 'search_vector')
+        return
+
+    op.execute('DROP TRIGGER IF EXISTS events_fts_ad')
+    op.execute('DROP TRIGGER IF EXISTS events_fts_au')
+    op.execute('DROP TRIGGER IF EXISTS events_fts_ai')
+    op.execute('DROP TABLE IF EXISTS events_fts')
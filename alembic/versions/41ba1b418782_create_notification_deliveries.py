@@ -0,0 +1,31 @@
+"""Auto-generated Alembic migration script."""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '41ba1b418782'
+down_revision = '08c492a90927'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'notification_deliveries',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column(
+            'outbox_id', sa.Integer(), sa.ForeignKey('notification_outbox.id', ondelete='CASCADE'), nullable=False
+        ),
+        sa.Column('recipient', sa.String(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('attempted_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+    )
+    op.create_index(
+        'ix_notification_deliveries_outbox_id_status', 'notification_deliveries', ['outbox_id', 'status']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notification_deliveries_outbox_id_status', table_name='notification_deliveries')
+    op.drop_table('notification_deliveries')
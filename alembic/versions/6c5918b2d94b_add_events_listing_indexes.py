@@ -0,0 +1,21 @@
+"""Auto-generated Alembic migration script."""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '6c5918b2d94b'
+down_revision = '580b047cd286'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # B-tree indexes backing the GET /events time-window, location and updated_since filters
+    op.create_index('ix_events_start_time_end_time', 'events', ['start_time', 'end_time'])
+    op.create_index('ix_events_location_start_time', 'events', ['location', 'start_time'])
+    op.create_index('ix_events_updated_at', 'events', ['updated_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_events_updated_at', table_name='events')
+    op.drop_index('ix_events_location_start_time', table_name='events')
+    op.drop_index('ix_events_start_time_end_time', table_name='events')
@@ -0,0 +1,41 @@
+"""Auto-generated Alembic migration script."""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'a73772bc713e'
+down_revision = '003ae4be3308'
+branch_labels = None
+depends_on = None
+
+
+POSTGRES_TIME_RANGE = """
+    ALTER TABLE events ADD COLUMN time_range tsrange GENERATED ALWAYS AS (
+        CASE WHEN end_time > start_time THEN tsrange(start_time, end_time, '[)') END
+    ) STORED
+"""
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    dialect = getattr(bind, 'dialect', None)
+    dialect_name = dialect.name if dialect is not None else None
+
+    # SQLite answers overlap queries from an in-memory interval tree; nothing to migrate
+    if dialect_name != 'postgresql':
+        return
+
+    # [start_time, end_time) as a range; GiST answers && (overlap) and can back exclusion constraints
+    op.execute(POSTGRES_TIME_RANGE)
+    op.create_index('ix_events_time_range', 'events', ['time_range'], postgresql_using='gist')
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    dialect = getattr(bind, 'dialect', None)
+    dialect_name = dialect.name if dialect is not None else None
+
+    if dialect_name != 'postgresql':
+        return
+
+    op.drop_index('ix_events_time_range', table_name='events')
+    op.drop_column('events', 'time_range')
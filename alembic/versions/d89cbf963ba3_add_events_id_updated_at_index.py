@@ -0,0 +1,17 @@
+"""Auto-generated Alembic migration script."""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'd89cbf963ba3'
+down_revision = '41ba1b418782'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Covering index for ETag revalidation: (id, updated_at) answers conditional GETs index-only
+    op.create_index('ix_events_id_updated_at', 'events', ['id', 'updated_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_events_id_updated_at', table_name='events')
@@ -0,0 +1,77 @@
+"""Auto-generated Alembic migration script."""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'db7c0d2d75f4'
+down_revision = '6c5918b2d94b'
+branch_labels = None
+depends_on = None
+
+
+SQLITE_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS events_participants_ai AFTER INSERT ON events
+    BEGIN
+        INSERT OR IGNORE INTO event_participants (event_id, email)
+        SELECT NEW.id, value FROM json_each(NEW.participants) WHERE type = 'text';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_participants_au AFTER UPDATE OF participants ON events
+    BEGIN
+        DELETE FROM event_participants WHERE event_id = OLD.id;
+        INSERT OR IGNORE INTO event_participants (event_id, email)
+        SELECT NEW.id, value FROM json_each(NEW.participants) WHERE type = 'text';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_participants_ad AFTER DELETE ON events
+    BEGIN
+        DELETE FROM event_participants WHERE event_id = OLD.id;
+    END
+    """,
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    dialect = getattr(bind, 'dialect', None)
+    dialect_name = dialect.name if dialect is not None else None
+
+    if dialect_name == 'postgresql':
+        # participants is a varchar[]; a GIN index answers participants @> ARRAY[...]
+        op.create_index('ix_events_participants_gin', 'events', ['participants'], postgresql_using='gin')
+        return
+
+    # JSON participants cannot be indexed by member: mirror them into a side table kept in sync by triggers
+    op.create_table(
+        'event_participants',
+        sa.Column('event_id', sa.Integer(), sa.ForeignKey('events.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('email', sa.String(), primary_key=True),
+    )
+    op.create_index('ix_event_participants_email', 'event_participants', ['email', 'event_id'])
+    for statement in SQLITE_TRIGGERS:
+        op.execute(statement)
+    op.execute(
+        """
+        INSERT OR IGNORE INTO event_participants (event_id, email)
+        SELECT events.id, j.value FROM events, json_each(events.participants) AS j WHERE j.type = 'text'
+        """
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    dialect = getattr(bind, 'dialect', None)
+    dialect_name = dialect.name if dialect is not None else None
+
+    if dialect_name == 'postgresql':
+        op.drop_index('ix_events_participants_gin', table_name='events')
+        return
+
+    op.execute('DROP TRIGGER IF EXISTS events_participants_ad')
+    op.execute('DROP TRIGGER IF EXISTS events_participants_au')
+    op.execute('DROP TRIGGER IF EXISTS events_participants_ai')
+    op.drop_index('ix_event_participants_email', table_name='event_participants')
+    op.drop_table('event_participants')
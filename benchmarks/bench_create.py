@@ -0,0 +1,132 @@
+"""Creates/sec of POST /events: ORM add + commit + refresh vs INSERT ... RETURNING.
+
+``orm`` is the previous create_event body (add, commit, refresh) followed by
+the EventResponse serialization FastAPI applied to the returned object.
+``returning`` calls the current create_event handler, which inserts with
+RETURNING and encodes the returned columns directly.
+
+Runs against a temporary SQLite file, and also against Postgres when
+--postgres-url (or BENCH_POSTGRES_URL) is given. Use a scratch database
+there: the events table is created if missing and rows are left behind.
+
+    PYTHONPATH=src python benchmarks/bench_create.py -n 2000 [--postgres-url URL] [--json out.json]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+from sqlalchemy import create_engine, event as sa_event
+from sqlalchemy.orm import Session, sessionmaker
+
+from event_service.api.event import create_event
+from event_service.database import Base
+from event_service.models.event import Event
+from event_service.schemas.event import EventCreate, EventResponse
+
+
+def _payload(i: int) -> EventCreate:
+    return EventCreate(
+        name=f"Bench {i}",
+        description="benchmark event",
+        location=f"Room {i % 20}",
+        participants=[f"p{i % 50}@example.com", "shared@example.com"],
+    )
+
+
+def orm_create(db: Session, event_in: EventCreate) -> bytes:
+    ev = Event(**event_in.model_dump())
+    db.add(ev)
+    db.commit()
+    db.refresh(ev)
+    return EventResponse.model_validate(ev).model_dump_json().encode()
+
+
+def returning_create(db: Session, event_in: EventCreate) -> bytes:
+    return create_event(event_in, db=db).body
+
+
+PATHS: Dict[str, Callable[[Session, EventCreate], bytes]] = {"orm": orm_create, "returning": returning_create}
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def run(url: str, count: int, warmup: int = 50) -> Dict[str, Dict[str, float]]:
+    connect_args = {"check_same_thread": False} if url.startswith("sqlite") else {}
+    engine = create_engine(url, connect_args=connect_args)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    statements = 0
+
+    def _count(*args):
+        nonlocal statements
+        statements += 1
+
+    sa_event.listen(engine, "before_cursor_execute", _count)
+    results: Dict[str, Dict[str, float]] = {}
+    try:
+        for name, create in PATHS.items():
+            for i in range(warmup):
+                with factory() as db:
+                    create(db, _payload(i))
+            statements = 0
+            latencies = []
+            started = time.perf_counter()
+            for i in range(count):
+                event_in = _payload(i)
+                with factory() as db:
+                    t0 = time.perf_counter()
+                    create(db, event_in)
+                    latencies.append(time.perf_counter() - t0)
+            elapsed = time.perf_counter() - started
+            results[name] = {
+                "creates_per_sec": count / elapsed,
+                "p50_ms": statistics.median(latencies) * 1000,
+                "p99_ms": _percentile(latencies, 99) * 1000,
+                "statements_per_create": statements / count,
+            }
+    finally:
+        engine.dispose()
+    results["speedup"] = {"creates_per_sec": results["returning"]["creates_per_sec"] / results["orm"]["creates_per_sec"]}
+    return results
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--count", type=int, default=2000, help="creates per path")
+    parser.add_argument("--postgres-url", default=os.environ.get("BENCH_POSTGRES_URL"))
+    parser.add_argument("--json", dest="json_path", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    report: Dict[str, Dict] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        report["sqlite"] = run(f"sqlite:///{os.path.join(tmp, 'bench.db')}", args.count)
+    if args.postgres_url:
+        report["postgresql"] = run(args.postgres_url, args.count)
+
+    for backend, results in report.items():
+        print(f"{backend}: {results['speedup']['creates_per_sec']:.2f}x")
+        for name in PATHS:
+            r = results[name]
+            print(
+                f"  {name:<10} {r['creates_per_sec']:9.1f} creates/s  p50 {r['p50_ms']:.3f} ms  "
+                f"p99 {r['p99_ms']:.3f} ms  {r['statements_per_create']:.1f} statements/create"
+            )
+    if args.json_path:
+        with open(args.json_path, "w") as fh:
+            json.dump(report, fh, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+"""Fixtures for the pytest-benchmark suite.
+
+    pytest benchmarks --benchmark-autosave
+    pytest benchmarks --benchmark-compare --benchmark-compare-fail=median:10%
+    pytest benchmarks --benchmark-json=bench.json
+
+BENCH_DATABASE_URL selects the database (default: a temporary SQLite file)
+and BENCH_SEED_EVENTS the number of events seeded before the run (1000).
+"""
+import os
+
+import pytest
+
+import harness
+
+harness.use_database()
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from smtp_stub import StubSMTPServer  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def app_client():
+    from event_service.main import app
+
+    with TestClient(app) as client:
+        harness.prepare_schema()
+        yield client
+
+
+@pytest.fixture(scope="session")
+def seeded_ids(app_client):
+    return harness.seed(int(os.environ.get("BENCH_SEED_EVENTS", "1000")))
+
+
+@pytest.fixture(scope="session")
+def smtp_stub():
+    with StubSMTPServer() as server:
+        yield server
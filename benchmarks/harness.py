@@ -0,0 +1,129 @@
+"""Shared pieces of the benchmark suite: database selection, seeding and result files.
+
+The application binds its engine when event_service.database is imported,
+so use_database() has to run before any event_service import. The database
+comes from BENCH_DATABASE_URL, and otherwise is a fresh SQLite file in a
+temporary directory; the checked-in local.db is never touched.
+"""
+from __future__ import annotations
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def use_database(url: Optional[str] = None) -> str:
+    """Point DATABASE_URL at the benchmark database and return its URL."""
+    url = url or os.environ.get("BENCH_DATABASE_URL")
+    if not url:
+        url = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='event-bench-'), 'bench.db')}"
+    os.environ["DATABASE_URL"] = url
+    # Benchmarks measure the request path, not SMTP delivery triggered by updates
+    os.environ.setdefault("NOTIFICATION_OUTBOX_INLINE", "false")
+    return url
+
+
+def prepare_schema() -> None:
+    from event_service.database import Base, engine
+    import event_service.models  # noqa: F401  registers the tables
+
+    Base.metadata.create_all(bind=engine)
+
+
+def seed(count: int, participants: int = 3, location_count: int = 20) -> List[int]:
+    """Insert `count` events in one executemany and return their ids."""
+    from sqlalchemy import insert, select
+
+    from event_service.database import SessionLocal
+    from event_service.models.event import Event
+
+    now = datetime.utcnow()
+    start = datetime(2030, 1, 1)
+    rows = [
+        {
+            "name": f"Seeded {i}",
+            "description": "seeded event " * 8,
+            "start_time": start + timedelta(hours=i),
+            "end_time": start + timedelta(hours=i + 1),
+            "location": f"Room {i % location_count}",
+            "participants": [f"user{(i + j) % 500}@example.com" for j in range(participants)],
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(count)
+    ]
+    db = SessionLocal()
+    try:
+        first = db.execute(select(Event.id).order_by(Event.id.desc()).limit(1)).scalar() or 0
+        if rows:
+            db.execute(insert(Event), rows)
+        db.commit()
+        return list(db.execute(select(Event.id).where(Event.id > first).order_by(Event.id)).scalars())
+    finally:
+        db.close()
+
+
+def summarize(latencies: Sequence[float], elapsed: float, errors: int = 0) -> Dict[str, float]:
+    """p50/p90/p99/mean latency in milliseconds plus throughput for one scenario."""
+    ordered = sorted(latencies)
+
+    def _pct(p: float) -> float:
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))] * 1000
+
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "rps": len(ordered) / elapsed if elapsed else 0.0,
+        "p50_ms": _pct(50),
+        "p90_ms": _pct(90),
+        "p99_ms": _pct(99),
+        "mean_ms": statistics.fmean(ordered) * 1000 if ordered else 0.0,
+    }
+
+
+def git_revision() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def metadata(**extra) -> Dict[str, object]:
+    return {
+        "commit": git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        **extra,
+    }
+
+
+def write_results(path: str, results: Dict[str, object]) -> None:
+    with open(path, "w") as fh:
+        json.dump(results, fh, indent=2, sort_keys=True)
+
+
+def compare(baseline: Dict, current: Dict, threshold: float = 0.10) -> List[str]:
+    """List scenarios whose p99 grew or whose RPS fell by more than `threshold`."""
+    regressions = []
+    for backend, scenarios in current.get("results", {}).items():
+        for name, stats in scenarios.items():
+            old = baseline.get("results", {}).get(backend, {}).get(name)
+            if not old:
+                continue
+            if old["p99_ms"] and stats["p99_ms"] > old["p99_ms"] * (1 + threshold):
+                regressions.append(f"{backend}/{name}: p99 {old['p99_ms']:.2f} -> {stats['p99_ms']:.2f} ms")
+            if old["rps"] and stats["rps"] < old["rps"] * (1 - threshold):
+                regressions.append(f"{backend}/{name}: rps {old['rps']:.1f} -> {stats['rps']:.1f}")
+    return regressions
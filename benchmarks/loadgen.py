@@ -0,0 +1,248 @@
+"""Load generator: p50/p90/p99 latency and requests/sec per API scenario.
+
+Each backend runs in its own process. It seeds --seed events, serves the
+app with uvicorn on a local port and drives every scenario with
+--concurrency client threads, each holding a keep-alive connection. The
+notification fan-out is measured against a stub SMTP server. Results are
+written as JSON (with the git commit) so runs can be compared:
+
+    PYTHONPATH=src python benchmarks/loadgen.py --output before.json
+    PYTHONPATH=src python benchmarks/loadgen.py --output after.json --compare before.json
+
+SQLite always runs, on a temporary file. Postgres runs too when
+--postgres-url or BENCH_POSTGRES_URL names a scratch database.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+import harness
+
+SCENARIOS = ("create", "get", "get_not_modified", "list", "list_sparse", "update", "patch", "delete")
+FANOUT_RECIPIENTS = 100
+
+PAYLOAD = {
+    "name": "Load",
+    "description": "load generated event " * 8,
+    "start_time": "2030-06-01T10:00:00",
+    "end_time": "2030-06-01T11:00:00",
+    "location": "Room 1",
+    "participants": ["a@example.com", "b@example.com", "c@example.com"],
+}
+
+
+def _serve(app) -> tuple:
+    """Start uvicorn on a free local port in a background thread."""
+    import uvicorn
+
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    server = uvicorn.Server(uvicorn.Config(app, log_level="warning", access_log=False))
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    return server, thread, f"http://127.0.0.1:{sock.getsockname()[1]}"
+
+
+def _drive(base_url: str, requests: int, concurrency: int, make_request: Callable) -> Dict[str, float]:
+    """Issue `requests` calls of make_request(client, i) over `concurrency` threads."""
+    import httpx
+
+    counter = itertools.count()
+    latencies: List[float] = []
+    errors = 0
+    lock = threading.Lock()
+
+    def _worker() -> None:
+        nonlocal errors
+        with httpx.Client(base_url=base_url, timeout=30) as client:
+            while (i := next(counter)) < requests:
+                t0 = time.perf_counter()
+                try:
+                    ok = make_request(client, i).status_code < 400
+                except httpx.HTTPError:
+                    ok = False
+                elapsed = time.perf_counter() - t0
+                with lock:
+                    latencies.append(elapsed)
+                    errors += not ok
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for future in [executor.submit(_worker) for _ in range(concurrency)]:
+            future.result()
+    return harness.summarize(latencies, time.perf_counter() - started, errors)
+
+
+def _scenarios(base_url: str, ids: List[int], deletes: int) -> Dict[str, Callable]:
+    import httpx
+
+    with httpx.Client(base_url=base_url) as client:
+        etags = {event_id: client.get(f"/events/{event_id}").headers["ETag"] for event_id in ids[:100]}
+        # Fresh events for the delete scenario (warm-up included), each deleted once
+        doomed = iter([client.post("/events", json=PAYLOAD).json()["id"] for _ in range(deletes)])
+    hot = list(etags)
+
+    return {
+        "create": lambda c, i: c.post("/events", json=PAYLOAD),
+        "get": lambda c, i: c.get(f"/events/{random.choice(ids)}"),
+        "get_not_modified": lambda c, i: c.get(f"/events/{hot[i % len(hot)]}", headers={"If-None-Match": etags[hot[i % len(hot)]]}),
+        "list": lambda c, i: c.get("/events", params={"limit": 50, "location": f"Room {i % 20}"}),
+        "list_sparse": lambda c, i: c.get("/events", params={"limit": 50, "fields": "id,name,start_time,end_time"}),
+        "update": lambda c, i: c.put(f"/events/{random.choice(ids)}", json={"name": f"Updated {i}"}),
+        "patch": lambda c, i: c.patch(f"/events/{random.choice(ids)}", json={"name": f"Patched {i}"}),
+        "delete": lambda c, i: c.delete(f"/events/{next(doomed)}"),
+    }
+
+
+def _fanout(runs: int) -> Dict[str, Dict[str, float]]:
+    from smtp_stub import StubSMTPServer
+
+    from event_service.services.fanout import FANOUT_BCC, FANOUT_PER_RECIPIENT, fan_out, fan_out_async
+
+    recipients = [f"user{i}@example.com" for i in range(FANOUT_RECIPIENTS)]
+    results = {}
+    with StubSMTPServer() as stub:
+        for mode in (FANOUT_PER_RECIPIENT, FANOUT_BCC):
+            for backend in ("sync", "async"):
+                service = stub.sync_service() if backend == "sync" else stub.async_service()
+                latencies = []
+                stub.reset()
+                started = time.perf_counter()
+                for _ in range(runs):
+                    t0 = time.perf_counter()
+                    options = dict(mode=mode, chunk_size=25, concurrency=4)
+                    if backend == "sync":
+                        fan_out(service, recipients, "Event Update", "body", **options)
+                    else:
+                        asyncio.run(fan_out_async(service, recipients, "Event Update", "body", **options))
+                    latencies.append(time.perf_counter() - t0)
+                elapsed = time.perf_counter() - started
+                if backend == "sync":
+                    service.close()
+                stats = harness.summarize(latencies, elapsed)
+                stats["messages_per_sec"] = stub.messages / elapsed
+                results[f"fanout_{backend}_{mode}"] = stats
+    return results
+
+
+def run_backend(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    """Child process body: benchmark the database named by --database-url."""
+    harness.use_database(args.database_url)
+    from event_service.main import app
+
+    harness.prepare_schema()
+    ids = harness.seed(args.seed)
+    server, thread, base_url = _serve(app)
+    try:
+        deletes = args.requests + min(args.warmup, args.requests) if "delete" in args.scenarios else 0
+        scenarios = _scenarios(base_url, ids, deletes)
+        results = {}
+        for name in args.scenarios:
+            _drive(base_url, min(args.warmup, args.requests), args.concurrency, scenarios[name])
+            results[name] = _drive(base_url, args.requests, args.concurrency, scenarios[name])
+            print(f"  {name}: {results[name]['rps']:.0f} req/s", file=sys.stderr)
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
+    if args.fanout_runs:
+        results.update(_fanout(args.fanout_runs))
+    return results
+
+
+def _print(report: Dict) -> None:
+    for backend, scenarios in report["results"].items():
+        print(f"\n{backend}")
+        print(f"  {'scenario':<28} {'req/s':>9} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'errors':>7}")
+        for name, s in scenarios.items():
+            print(
+                f"  {name:<28} {s['rps']:9.1f} {s['p50_ms']:9.2f} {s['p90_ms']:9.2f} {s['p99_ms']:9.2f} {s['errors']:7d}"
+            )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=1000, help="events seeded before the run")
+    parser.add_argument("--requests", type=int, default=1000, help="requests per scenario")
+    parser.add_argument("--warmup", type=int, default=50, help="unmeasured requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="comma-separated subset of: " + ", ".join(SCENARIOS))
+    parser.add_argument("--fanout-runs", type=int, default=20, help=f"fan-outs to {FANOUT_RECIPIENTS} recipients per mode (0 skips)")
+    parser.add_argument("--postgres-url", default=os.environ.get("BENCH_POSTGRES_URL"))
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument("--compare", help="earlier JSON report to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed p99/RPS change before a regression is reported")
+    # Internal: run one backend and write its results to --child-output
+    parser.add_argument("--database-url", help=argparse.SUPPRESS)
+    parser.add_argument("--child-output", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    args.scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    if args.child_output:
+        harness.write_results(args.child_output, run_backend(args))
+        return 0
+
+    backends = {"sqlite": f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='event-bench-'), 'bench.db')}"}
+    if args.postgres_url:
+        backends["postgresql"] = args.postgres_url
+
+    report = {
+        "meta": harness.metadata(
+            seed=args.seed, requests=args.requests, concurrency=args.concurrency, fanout_recipients=FANOUT_RECIPIENTS
+        ),
+        "results": {},
+    }
+    for backend, url in backends.items():
+        print(f"{backend}:", file=sys.stderr)
+        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as out:
+            child_output = out.name
+        try:
+            cmd = [sys.executable, os.path.abspath(__file__), *_child_args(args), "--database-url", url, "--child-output", child_output]
+            subprocess.run(cmd, check=True)
+            with open(child_output) as fh:
+                report["results"][backend] = json.load(fh)
+        finally:
+            os.unlink(child_output)
+
+    _print(report)
+    if args.output:
+        harness.write_results(args.output, report)
+    if args.compare:
+        with open(args.compare) as fh:
+            regressions = harness.compare(json.load(fh), report, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+def _child_args(args: argparse.Namespace) -> List[str]:
+    return [
+        "--seed", str(args.seed),
+        "--requests", str(args.requests),
+        "--warmup", str(args.warmup),
+        "--concurrency", str(args.concurrency),
+        "--scenarios", ",".join(args.scenarios),
+        "--fanout-runs", str(args.fanout_runs),
+    ]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
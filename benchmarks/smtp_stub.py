@@ -0,0 +1,130 @@
+"""Stub ESMTP server for benchmarking the notification path.
+
+Runs an asyncio server on its own thread so both the smtplib-based
+SMTPService and AsyncSMTPService can connect to it. Every login is
+accepted and messages are counted, not stored. `latency` adds a delay to
+each reply to stand in for the network round trip to a real relay.
+"""
+from __future__ import annotations
+
+import asyncio
+import smtplib
+import threading
+from typing import Optional
+
+from event_service.services.smtp import SMTPService
+from event_service.services.smtp_async import AsyncSMTPService
+
+USERNAME = "bench@example.com"
+PASSWORD = "bench"
+
+
+class StubSMTPServer:
+    def __init__(self, latency: float = 0.0, host: str = "127.0.0.1") -> None:
+        self.latency = latency
+        self.host = host
+        self.port: Optional[int] = None
+        self.connections = 0
+        self.messages = 0
+        self.recipients = 0
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="smtp-stub", daemon=True)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> "StubSMTPServer":
+        self._thread.start()
+        future = asyncio.run_coroutine_threadsafe(asyncio.start_server(self._handle, self.host, 0), self._loop)
+        self._server = future.result(timeout=5)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    def stop(self) -> None:
+        async def _close() -> None:
+            self._server.close()
+            await self._server.wait_closed()
+
+        if self._server is not None:
+            asyncio.run_coroutine_threadsafe(_close(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+    def __enter__(self) -> "StubSMTPServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.connections = self.messages = self.recipients = 0
+
+    def sync_service(self, pool_size: int = 4) -> SMTPService:
+        # Plain SMTP: the default factory would use implicit TLS on a port other than 587
+        return SMTPService(
+            host=self.host,
+            port=self.port,
+            username=USERNAME,
+            password=PASSWORD,
+            client_factory=lambda host, port, timeout=10: smtplib.SMTP(host=host, port=port, timeout=timeout),
+            pool_size=pool_size,
+            pool_max_messages=1_000_000,
+        )
+
+    def async_service(self) -> AsyncSMTPService:
+        return AsyncSMTPService(
+            host=self.host, port=self.port, username=USERNAME, password=PASSWORD, use_tls=False, start_tls=False
+        )
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        with self._lock:
+            self.connections += 1
+        rcpts = 0
+
+        async def reply(*lines: str) -> None:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            writer.write(b"".join(line.encode() + b"\r\n" for line in lines))
+            await writer.drain()
+
+        try:
+            await reply("220 stub ESMTP")
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                verb = line.split(b" ", 1)[0].strip().upper()
+                if verb in (b"EHLO", b"HELO"):
+                    await reply("250-stub", "250-8BITMIME", "250 AUTH PLAIN LOGIN")
+                elif verb == b"AUTH":
+                    if line.strip().upper() == b"AUTH LOGIN":
+                        await reply("334 VXNlcm5hbWU6")
+                        await reader.readline()
+                        await reply("334 UGFzc3dvcmQ6")
+                        await reader.readline()
+                    await reply("235 2.7.0 Authentication successful")
+                elif verb == b"RCPT":
+                    rcpts += 1
+                    await reply("250 2.1.5 OK")
+                elif verb == b"DATA":
+                    await reply("354 End data with <CR><LF>.<CR><LF>")
+                    while (await reader.readline()) not in (b".\r\n", b".\n", b""):
+                        pass
+                    with self._lock:
+                        self.messages += 1
+                        self.recipients += rcpts
+                    rcpts = 0
+                    await reply("250 2.0.0 OK")
+                elif verb == b"RSET":
+                    rcpts = 0
+                    await reply("250 2.0.0 OK")
+                elif verb == b"QUIT":
+                    await reply("221 2.0.0 Bye")
+                    break
+                else:
+                    # MAIL, NOOP and anything else
+                    await reply("250 OK")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
@@ -0,0 +1,84 @@
+import itertools
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from event_service.services.cache import event_cache  # noqa: E402
+
+PAYLOAD = {
+    "name": "Benchmark",
+    "description": "benchmark event " * 8,
+    "start_time": "2030-06-01T10:00:00",
+    "end_time": "2030-06-01T11:00:00",
+    "location": "Room 1",
+    "participants": ["a@example.com", "b@example.com", "c@example.com"],
+}
+
+
+def _create(client) -> int:
+    res = client.post("/events", json=PAYLOAD)
+    assert res.status_code == 201
+    return res.json()["id"]
+
+
+def test_create_event(benchmark, app_client):
+    res = benchmark(app_client.post, "/events", json=PAYLOAD)
+    assert res.status_code == 201
+
+
+def test_get_event_cached(benchmark, app_client, seeded_ids):
+    ids = itertools.cycle(seeded_ids[:100])
+    res = benchmark(lambda: app_client.get(f"/events/{next(ids)}"))
+    assert res.status_code == 200
+
+
+def test_get_event_uncached(benchmark, app_client, seeded_ids):
+    ids = itertools.cycle(seeded_ids)
+
+    def _setup():
+        event_id = next(ids)
+        event_cache.invalidate(event_id)
+        return (f"/events/{event_id}",), {}
+
+    res = benchmark.pedantic(app_client.get, setup=_setup, rounds=500)
+    assert res.status_code == 200
+
+
+def test_get_event_not_modified(benchmark, app_client, seeded_ids):
+    url = f"/events/{seeded_ids[0]}"
+    etag = app_client.get(url).headers["ETag"]
+    res = benchmark(app_client.get, url, headers={"If-None-Match": etag})
+    assert res.status_code == 304
+
+
+@pytest.mark.parametrize("limit", [20, 100])
+def test_list_events(benchmark, app_client, seeded_ids, limit):
+    res = benchmark(app_client.get, "/events", params={"limit": limit, "location": "Room 3"})
+    assert res.status_code == 200
+
+
+def test_list_events_sparse_fields(benchmark, app_client, seeded_ids):
+    params = {"limit": 100, "fields": "id,name,start_time,end_time"}
+    res = benchmark(app_client.get, "/events", params=params)
+    assert res.status_code == 200
+
+
+def test_update_event_put(benchmark, app_client, seeded_ids):
+    ids = itertools.cycle(seeded_ids)
+    res = benchmark(lambda: app_client.put(f"/events/{next(ids)}", json={"name": "Renamed"}))
+    assert res.status_code == 200
+
+
+def test_update_event_patch(benchmark, app_client, seeded_ids):
+    ids = itertools.cycle(seeded_ids)
+    res = benchmark(lambda: app_client.patch(f"/events/{next(ids)}", json={"name": "Patched"}))
+    assert res.status_code == 200
+
+
+def test_delete_event(benchmark, app_client):
+    def _setup():
+        return (f"/events/{_create(app_client)}",), {}
+
+    res = benchmark.pedantic(app_client.delete, setup=_setup, rounds=300)
+    assert res.status_code == 204
@@ -0,0 +1,34 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from event_service.services.fanout import FANOUT_BCC, FANOUT_PER_RECIPIENT, fan_out, fan_out_async  # noqa: E402
+
+RECIPIENTS = [f"user{i}@example.com" for i in range(100)]
+SUBJECT = "Event Update: Benchmark"
+BODY = "Event 'Benchmark' has been updated.\n\nLocation: Room 2\n"
+
+
+@pytest.mark.parametrize("mode", [FANOUT_PER_RECIPIENT, FANOUT_BCC])
+def test_fan_out_sync(benchmark, smtp_stub, mode):
+    service = smtp_stub.sync_service(pool_size=4)
+    try:
+        report = benchmark(fan_out, service, RECIPIENTS, SUBJECT, BODY, mode=mode, chunk_size=25, concurrency=4)
+    finally:
+        service.close()
+    assert len(report.sent) == len(RECIPIENTS)
+
+
+@pytest.mark.parametrize("mode", [FANOUT_PER_RECIPIENT, FANOUT_BCC])
+def test_fan_out_async(benchmark, smtp_stub, mode):
+    service = smtp_stub.async_service()
+
+    def _run():
+        return asyncio.run(
+            fan_out_async(service, RECIPIENTS, SUBJECT, BODY, mode=mode, chunk_size=25, concurrency=4)
+        )
+
+    report = benchmark(_run)
+    assert len(report.sent) == len(RECIPIENTS)
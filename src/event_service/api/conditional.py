@@ -0,0 +1,103 @@
+"""HTTP validators (ETag / Last-Modified) and conditional request evaluation.
+
+ETags are strong and derived from (id, updated_at) pairs only, so they can
+be computed from a narrow query on the (id, updated_at) index without
+loading or serializing rows.
+"""
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from fastapi import Response, status
+
+ETAG_HEADER = "ETag"
+LAST_MODIFIED_HEADER = "Last-Modified"
+# Clients must revalidate instead of reusing responses heuristically from Last-Modified
+CACHE_CONTROL = "no-cache"
+
+
+def event_etag(event_id: int, updated_at: datetime, variant: str = "") -> str:
+    return collection_etag([(event_id, updated_at)], variant)
+
+
+def collection_etag(keys: Iterable[Tuple[int, datetime]], variant: str = "") -> str:
+    """Strong ETag over the (id, updated_at) pairs of the rows in a response.
+
+    variant tells apart different representations of the same rows (e.g. a
+    ?fields= projection); strong ETags must differ when the bytes do.
+    """
+    digest = hashlib.sha1(variant.encode())
+    for event_id, updated_at in keys:
+        digest.update(f"{event_id}@{updated_at.isoformat()};".encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def http_date(value: datetime) -> str:
+    """Format a naive-UTC (or aware) datetime as an IMF-fixdate."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime]) -> Dict[str, str]:
+    headers = {ETAG_HEADER: etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers[LAST_MODIFIED_HEADER] = http_date(last_modified)
+    return headers
+
+
+def _parse_etags(header: str) -> List[str]:
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+def _opaque(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def none_match(if_none_match: Optional[str], etag: str) -> bool:
+    """True if If-None-Match lists `etag` (weak comparison) or is "*"."""
+    if not if_none_match:
+        return False
+    tags = _parse_etags(if_none_match)
+    return "*" in tags or any(_opaque(tag) == etag for tag in tags)
+
+
+def match(if_match: str, etag: str) -> bool:
+    """True if If-Match lists `etag` (strong comparison) or is "*"."""
+    tags = _parse_etags(if_match)
+    return "*" in tags or etag in tags
+
+
+def not_modified_since(if_modified_since: Optional[str], last_modified: Optional[datetime]) -> bool:
+    """True if the resource is unchanged since the If-Modified-Since date (invalid dates are ignored)."""
+    if not if_modified_since or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    # HTTP dates have one-second resolution
+    return last_modified.replace(microsecond=0) <= since
+
+
+def is_not_modified(
+    etag: str,
+    last_modified: Optional[datetime],
+    if_none_match: Optional[str],
+    if_modified_since: Optional[str] = None,
+) -> bool:
+    """Evaluate GET preconditions; If-Modified-Since only counts without If-None-Match (RFC 9110 13.2.2)."""
+    if if_none_match:
+        return none_match(if_none_match, etag)
+    return not_modified_since(if_modified_since, last_modified)
+
+
+def not_modified_response(headers: Dict[str, str]) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
@@ -0,0 +1,23 @@
+from typing import Any, Dict, List
+
+from fastapi import APIRouter, HTTPException, Query
+
+from event_service.core.profiling import profile_store
+
+# Included by main only when PROFILING_ENABLED is set
+router = APIRouter(prefix="/debug", tags=["debug"])
+
+
+@router.get("/profiles")
+def list_profiles() -> List[Dict[str, Any]]:
+    """Summaries of the retained request profiles, newest first."""
+    return [profile.summary() for profile in profile_store.list()]
+
+
+@router.get("/profiles/{profile_id}")
+def get_profile(profile_id: str, top: int = Query(20, ge=1, le=500)) -> Dict[str, Any]:
+    """The `top` most sampled stacks and every recorded SQL statement (slowest first) of one profile."""
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return profile.report(top)
@@ -1,29 +1,95 @@
-from typing import List
+from datetime import datetime
+from typing import Annotated, List, Optional, Tuple
 import logging
-import copy
+from types import SimpleNamespace
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status, BackgroundTasks
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status, BackgroundTasks
+from sqlalchemy import insert, select, update
 from sqlalchemy.orm import Session
 
-from event_service.database import get_db, SessionLocal
-from event_service.models.event import Event
-from event_service.schemas.event import EventCreate, EventUpdate, EventResponse
-from event_service.services.smtp import SMTPService
-from event_service.core.config import Settings, settings
+from event_service.database import get_db
+from event_service.models.event import Event, naive_utc, naive_utc_times
+from event_service.schemas.event import EventCreate, EventPatch, EventUpdate, EventResponse
+from event_service.services.notifications import NOTIFY_FIELDS, notify_fields_changed, snapshot_notify_fields
+from event_service.services.cache import event_cache
+from event_service.services.intervals import event_intervals
+from event_service.core.config import settings
+from event_service.core.query_monitor import query_budget
+from event_service.api.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor, resolve_page_size
+from event_service.api.filters import EventFilters, event_filters
+from event_service.api.event_overlaps import overlapping_events
+from event_service.api.outbox import queue_event_update_email
+from event_service.api.serialization import (
+    EVENT_COLUMNS,
+    EVENT_FIELDS,
+    FIELDS_DESCRIPTION,
+    dump_event,
+    dump_events,
+    fields_variant,
+    json_response,
+    parse_fields,
+    project_cached,
+    query_columns,
+)
+from event_service.api.conditional import (
+    collection_etag,
+    event_etag,
+    is_not_modified,
+    match,
+    not_modified_response,
+    validator_headers,
+)
 
 router = APIRouter(prefix="/events", tags=["events"])
 
 
-@router.post("", response_model=EventResponse, status_code=status.HTTP_201_CREATED)
-def create_event(event_in: EventCreate, db: Session = Depends(get_db)) -> Event:
+CONFLICTS_DESCRIPTION = "Reject the event with 409 if it overlaps an existing event of any of its participants"
+
+
+async def _create_budget(check_conflicts: bool = False) -> None:
+    # The INSERT, plus the overlap query (and SQLite's interval index sync) of a conflict check
+    await query_budget(3 if check_conflicts else 1)()
+
+
+def _conflicting_events(db: Session, event_in: EventCreate) -> list:
+    start, end = naive_utc(event_in.start_time), naive_utc(event_in.end_time)
+    if not event_in.participants or start is None or end is None or not end > start:
+        return []
+    stmt = overlapping_events(db, start, end, event_in.participants).limit(settings.EVENTS_PAGE_SIZE_DEFAULT)
+    return db.execute(stmt).all()
+
+
+def _conflict_response(conflicts: list) -> Response:
+    # {"detail": ..., "conflicts": [EventResponse, ...]}, the events encoded like a listing page
+    detail = b'{"detail":"Event overlaps existing events of its participants","conflicts":'
+    return json_response(detail + dump_events(conflicts) + b"}", status_code=status.HTTP_409_CONFLICT)
+
+
+# Statement budgets (see core.query_monitor) hold each endpoint to its intended round trips
+@router.post(
+    "", response_model=EventResponse, status_code=status.HTTP_201_CREATED, dependencies=[Depends(_create_budget)]
+)
+def create_event(
+    event_in: EventCreate,
+    db: Session = Depends(get_db),
+    check_conflicts: Annotated[bool, Query(description=CONFLICTS_DESCRIPTION)] = False,
+) -> Response:
     try:
-        payload = event_in.model_dump()
-        ev = Event(**payload)
-        db.add(ev)
+        # Advisory: a concurrent create can still slip in between the check and the INSERT
+        if check_conflicts:
+            conflicts = _conflicting_events(db, event_in)
+            if conflicts:
+                return _conflict_response(conflicts)
+
+        # One round trip: the id and timestamps come back with the INSERT instead of a refresh
+        stmt = insert(Event.__table__).values(**naive_utc_times(event_in.model_dump())).returning(*EVENT_COLUMNS)
+        row = db.execute(stmt).one()
         db.commit()
-        db.refresh(ev)
-        return ev
+        # Ids can be reused after a delete (SQLite without AUTOINCREMENT)
+        event_cache.invalidate(row.id)
+        return json_response(
+            dump_event(row), status_code=status.HTTP_201_CREATED, headers=_event_headers(row.id, row.updated_at)
+        )
     except Exception as e:
         logging.error(e, exc_info=True)
         try:
@@ -33,147 +99,249 @@ def create_event(event_in: EventCreate, db: Session = Depends(get_db)) -> Event:
         raise HTTPException(status_code=500, detail="Failed to create event")
 
 
-@router.get("", response_model=List[EventResponse])
-def list_events(db: Session = Depends(get_db)) -> List[Event]:
-    try:
-        stmt = select(Event)
-        results = db.execute(stmt).scalars().all()
-        return results
-    except Exception as e:
-        logging.error(e, exc_info=True)
-        raise HTTPException(status_code=500, detail="Failed to list events")
+# The validator query of a conditional request, then the page
+@router.get("", response_model=List[EventResponse], dependencies=[Depends(query_budget(2))])
+def list_events(
+    limit: Optional[int] = Query(None, ge=1, description="Page size; clamped to the server maximum"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+    filters: EventFilters = Depends(event_filters),
+    db: Session = Depends(get_db),
+    if_none_match: Annotated[Optional[str], Header()] = None,
+    fields: Annotated[Optional[str], Query(description=FIELDS_DESCRIPTION)] = None,
+) -> Response:
+    page_size = resolve_page_size(limit, settings)
+    selected = _selected_fields(fields)
+    after_id = None
+    if cursor:
+        try:
+            after_id = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
 
+    def _page(columns):
+        # Keyset pagination on the primary key: fetch one extra row to detect a next page
+        stmt = filters.apply(select(*columns), db.get_bind().dialect.name).order_by(Event.id).limit(page_size + 1)
+        if after_id is not None:
+            stmt = stmt.where(Event.id > after_id)
+        return stmt
+
+    def _page_headers(keys) -> dict:
+        # The ETag covers the extra row too, so it changes whenever X-Next-Cursor would
+        etag = collection_etag(keys, fields_variant(selected))
+        headers = validator_headers(etag, max((k[1] for k in keys[:page_size]), default=None))
+        if len(keys) > page_size:
+            headers[NEXT_CURSOR_HEADER] = encode_cursor(keys[page_size - 1][0])
+        return headers
 
-@router.get("/{event_id}", response_model=EventResponse)
-def get_event(event_id: int, db: Session = Depends(get_db)) -> Event:
     try:
-        stmt = select(Event).where(Event.id == event_id)
-        ev = db.execute(stmt).scalar_one_or_none()
-        if ev is None:
-            raise HTTPException(status_code=404, detail="Event not found")
-        return ev
-    except HTTPException:
-        raise
+        if if_none_match:
+            # Revalidate from (id, updated_at) alone, answered by ix_events_id_updated_at
+            keys = db.execute(_page([Event.id, Event.updated_at])).all()
+            headers = _page_headers(keys)
+            if is_not_modified(headers["ETag"], None, if_none_match):
+                return not_modified_response(headers)
+
+        # Column tuples encoded straight to JSON: no ORM objects or per-row validation
+        rows = db.execute(_page(query_columns(selected))).all()
+        headers = _page_headers([(row.id, row.updated_at) for row in rows])
+        return json_response(dump_events(rows[:page_size], selected), headers=headers)
     except Exception as e:
         logging.error(e, exc_info=True)
-        raise HTTPException(status_code=500, detail="Failed to retrieve event")
+        raise HTTPException(status_code=500, detail="Failed to list events")
 
 
-def _participants_changed(orig: List[str] | None, new: List[str] | None) -> bool:
-    # Normalize None vs empty list semantics: None != []
+def _selected_fields(fields: Optional[str]) -> Tuple[str, ...]:
     try:
-        if orig is None and new is None:
-            return False
-        if orig is None and new is not None:
-            return True
-        if orig is not None and new is None:
-            return True
-        # both lists: compare sorted values
-        return sorted(orig) != sorted(new)
-    except Exception as e:
-        logging.error(e, exc_info=True)
-        # If comparison fails, assume changed to be safe
-        return True
+        return parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
-def _field_changed(orig, new) -> bool:
-    try:
-        return orig != new
-    except Exception as e:
-        logging.error(e, exc_info=True)
-        return True
+def _event_headers(event_id: int, updated_at: datetime, selected: Tuple[str, ...] = EVENT_FIELDS) -> dict:
+    return validator_headers(event_etag(event_id, updated_at, fields_variant(selected)), updated_at)
 
 
-def _send_event_update_email_task(event_id: int, db: Session, settings: Settings) -> None:
-    """Background task: fetch latest event and send update emails to participants."""
-    try:
+# The (id, updated_at) validator query of a conditional request, then the row
+@router.get("/{event_id}", response_model=EventResponse, dependencies=[Depends(query_budget(2))])
+def get_event(
+    event_id: int,
+    db: Session = Depends(get_db),
+    if_none_match: Annotated[Optional[str], Header()] = None,
+    if_modified_since: Annotated[Optional[str], Header()] = None,
+    fields: Annotated[Optional[str], Query(description=FIELDS_DESCRIPTION)] = None,
+) -> Response:
+    selected = _selected_fields(fields)
+    # Served from the read-through cache of serialized EventResponse bodies when possible
+    cached = event_cache.get(event_id)
+    if cached is not None:
         try:
-            stmt = select(Event).where(Event.id == event_id)
-            ev = db.execute(stmt).scalar_one_or_none()
-            if ev is None:
-                logging.info("Event not found in background task: %s", event_id)
-                return
-
-            participants = ev.participants or []
-            if not participants:
-                logging.info("No participants to notify for event %s", event_id)
-                return
-
-            smtp_service = SMTPService.from_settings(settings)
-
-            subject = f"Event Update: {ev.name}"
-            # Build a concise body summarizing key fields
-            body_lines = [f"Event '{ev.name}' has been updated.", "", "Updated details:"]
-            body_lines.append(f"Description: {ev.description}")
-            body_lines.append(f"Start time: {ev.start_time}")
-            body_lines.append(f"End time: {ev.end_time}")
-            body_lines.append(f"Location: {ev.location}")
-            body_lines.append(f"Participants: {', '.join(participants)}")
-            body = "\n".join(body_lines)
-
-            try:
-                smtp_service.send_email(to_emails=participants, subject=subject, body=body)
-                logging.info("Sent event update email for event %s to %s", event_id, participants)
-            except Exception as e:
-                logging.error(e, exc_info=True)
+            headers = _event_headers(event_id, cached.updated_at, selected)
+            if is_not_modified(headers["ETag"], cached.updated_at, if_none_match, if_modified_since):
+                return not_modified_response(headers)
+            return json_response(project_cached(cached.payload, selected), headers=headers)
         except Exception as e:
+            # A bad entry must not fail the request; the database answers instead
             logging.error(e, exc_info=True)
-    finally:
-        try:
-            db.close()
-        except Exception:
-            logging.error("Failed to close DB session in background task", exc_info=True)
+    try:
+        if if_none_match or if_modified_since:
+            # Revalidate without loading the row
+            stmt = select(Event.id, Event.updated_at).where(Event.id == event_id)
+            key = db.execute(stmt).one_or_none()
+            if key is None:
+                raise HTTPException(status_code=404, detail="Event not found")
+            headers = _event_headers(event_id, key.updated_at, selected)
+            if is_not_modified(headers["ETag"], key.updated_at, if_none_match, if_modified_since):
+                return not_modified_response(headers)
+
+        stmt = select(*query_columns(selected)).where(Event.id == event_id)
+        row = db.execute(stmt).one_or_none()
+        if row is None:
+            raise HTTPException(status_code=404, detail="Event not found")
+        payload = dump_event(row, selected)
+        # Only full representations are cached; projections are cut from them on later hits
+        if selected == EVENT_FIELDS:
+            event_cache.set(event_id, payload, row.updated_at)
+        return json_response(payload, headers=_event_headers(row.id, row.updated_at, selected))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logging.error(e, exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to retrieve event")
 
 
-@router.put("/{event_id}", response_model=EventResponse)
-def update_event(event_id: int, event_in: EventUpdate, background_tasks: BackgroundTasks, db: Session = Depends(get_db)) -> Event:
+# SELECT, UPDATE and the outbox INSERT
+@router.put("/{event_id}", response_model=EventResponse, dependencies=[Depends(query_budget(3))])
+def update_event(
+    event_id: int,
+    event_in: EventUpdate,
+    background_tasks: BackgroundTasks,
+    response: Response,
+    db: Session = Depends(get_db),
+    if_match: Annotated[Optional[str], Header()] = None,
+) -> EventResponse:
     try:
         # Retrieve existing event and snapshot fields for comparison
         stmt = select(Event).where(Event.id == event_id)
+        if if_match:
+            # Hold the row until commit so the precondition cannot go stale on Postgres
+            stmt = stmt.with_for_update()
         ev = db.execute(stmt).scalar_one_or_none()
         if ev is None:
             raise HTTPException(status_code=404, detail="Event not found")
+        if if_match and not match(if_match, event_etag(ev.id, ev.updated_at)):
+            raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED, detail="Event has been modified")
 
-        # Make deep copies of list fields to avoid mutation issues
-        orig_start = copy.deepcopy(ev.start_time)
-        orig_end = copy.deepcopy(ev.end_time)
-        orig_location = copy.deepcopy(ev.location)
-        orig_participants = copy.deepcopy(ev.participants)
+        orig = snapshot_notify_fields(ev)
 
-        update_data = event_in.model_dump(exclude_none=True)
+        # Stored as naive UTC, so the comparison below needs no re-read of the row
+        update_data = naive_utc_times(event_in.model_dump(exclude_none=True))
         for key, value in update_data.items():
             setattr(ev, key, value)
 
-        db.add(ev)
+        # The UPDATE; the Python-side updated_at default is applied to ev without a refresh
+        db.flush()
+
+        # Compare relevant fields to decide whether to queue emails, atomically with the update
+        if notify_fields_changed(orig, ev):
+            queue_event_update_email(db, background_tasks, ev.id)
+
+        # Built before commit expires ev, which would cost another SELECT
+        result = EventResponse.model_validate(ev)
+        db.commit()
+        event_cache.invalidate(event_id)
+        response.headers.update(_event_headers(result.id, result.updated_at))
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        logging.error(e, exc_info=True)
+        try:
+            db.rollback()
+        except Exception:
+            logging.error("Failed to rollback session", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to update event")
+
+
+def _notify_columns(source) -> list:
+    return [source.c[name] for name in NOTIFY_FIELDS]
+
+
+# UPDATE ... RETURNING, the narrow SELECT outside Postgres and the outbox INSERT;
+# a write landing between the SELECT and the UPDATE costs one more of each
+@router.patch("/{event_id}", response_model=EventResponse, dependencies=[Depends(query_budget(5))])
+def patch_event(
+    event_id: int,
+    event_in: EventPatch,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+) -> Response:
+    """Apply a partial update with one UPDATE ... RETURNING.
+
+    Only the fields present in the body are written, so an explicit null
+    clears a nullable field. With expected_updated_at the UPDATE only matches
+    that version of the row, and a concurrent change is reported as 409. On
+    Postgres the previous notification fields come back from the same
+    statement, read from a FOR UPDATE subquery. Other dialects read them,
+    with updated_at, in a narrow SELECT first and the UPDATE only matches
+    that version. If a write lands in between, the read and the UPDATE are
+    retried once without the version check, so the patch still applies; with
+    expected_updated_at the lost race is reported as 409 instead.
+    """
+    values = naive_utc_times(event_in.model_dump(exclude_unset=True, exclude={"expected_updated_at"}))
+    if "name" in values and values["name"] is None:
+        raise HTTPException(status_code=400, detail="name cannot be null")
+    # Set explicitly so even an empty patch moves the version
+    values["updated_at"] = datetime.utcnow()
+
+    table = Event.__table__
+    stmt = update(table).where(table.c.id == event_id).values(**values)
+    if event_in.expected_updated_at is not None:
+        stmt = stmt.where(table.c.updated_at == naive_utc(event_in.expected_updated_at))
+    try:
+        if db.get_bind().dialect.name == "postgresql":
+            old = (
+                select(table.c.id, *_notify_columns(table))
+                .where(table.c.id == event_id)
+                .with_for_update()
+                .subquery("old")
+            )
+            old_columns = [old.c[name].label(f"old_{name}") for name in NOTIFY_FIELDS]
+            stmt = stmt.where(table.c.id == old.c.id).returning(*EVENT_COLUMNS, *old_columns)
+            result = db.execute(stmt).one_or_none()
+            orig = dict(zip(NOTIFY_FIELDS, result[len(EVENT_COLUMNS):])) if result is not None else None
+            exists = result is not None or db.execute(select(table.c.id).where(table.c.id == event_id)).first() is not None
+        else:
+            pinned = event_in.expected_updated_at is not None
+            for attempt in range(2):
+                previous = db.execute(
+                    select(*_notify_columns(table), table.c.updated_at).where(table.c.id == event_id)
+                ).one_or_none()
+                exists = previous is not None
+                result = None
+                if not exists:
+                    break
+                attempt_stmt = stmt
+                if pinned or attempt == 0:
+                    attempt_stmt = stmt.where(table.c.updated_at == previous.updated_at)
+                result = db.execute(attempt_stmt.returning(*EVENT_COLUMNS)).one_or_none()
+                if result is not None or pinned:
+                    break
+            orig = {name: previous._mapping[name] for name in NOTIFY_FIELDS} if exists else None
+
+        if result is None:
+            db.rollback()
+            if not exists:
+                raise HTTPException(status_code=404, detail="Event not found")
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Event has been modified")
+
+        # zip stops at the EVENT_COLUMNS part of the Postgres result
+        row = dict(zip(EVENT_FIELDS, result))
+        if notify_fields_changed(orig, SimpleNamespace(**row)):
+            queue_event_update_email(db, background_tasks, event_id)
+
         db.commit()
-        db.refresh(ev)
-
-        # Compare relevant fields to decide whether to schedule emails
-        changed = False
-        if _field_changed(orig_start, ev.start_time):
-            changed = True
-        if _field_changed(orig_end, ev.end_time):
-            changed = True
-        if _field_changed(orig_location, ev.location):
-            changed = True
-        if _participants_changed(orig_participants, ev.participants):
-            changed = True
-
-        if changed:
-            # Provide a separate DB session for the background task
-            db_task_session = None
-            try:
-                db_task_session = SessionLocal()
-                background_tasks.add_task(_send_event_update_email_task, ev.id, db_task_session, settings)
-            except Exception as e:
-                logging.error(e, exc_info=True)
-                if db_task_session is not None:
-                    try:
-                        db_task_session.close()
-                    except Exception:
-                        logging.error("Failed to close db_task_session after scheduling failure", exc_info=True)
-
-        return ev
+        event_cache.invalidate(event_id)
+        return json_response(dump_event(result), headers=_event_headers(event_id, row["updated_at"]))
     except HTTPException:
         raise
     except Exception as e:
@@ -185,7 +353,8 @@ def update_event(event_id: int, event_in: EventUpdate, background_tasks: Backgro
         raise HTTPException(status_code=500, detail="Failed to update event")
 
 
-@router.delete("/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
+# SELECT and DELETE
+@router.delete("/{event_id}", status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(query_budget(2))])
 def delete_event(event_id: int, db: Session = Depends(get_db)) -> Response:
     try:
         stmt = select(Event).where(Event.id == event_id)
@@ -195,6 +364,8 @@ def delete_event(event_id: int, db: Session = Depends(get_db)) -> Response:
 
         db.delete(ev)
         db.commit()
+        event_cache.invalidate(event_id)
+        event_intervals.discard(event_id)
         return Response(status_code=status.HTTP_204_NO_CONTENT)
     except HTTPException:
         raise
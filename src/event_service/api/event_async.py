@@ -0,0 +1,103 @@
+"""Async variants of the events CRUD endpoints.
+
+Mounted ahead of the sync router when DATABASE_ASYNC is enabled. Each
+handler is an ``async def`` that runs the shared sync handler body on the
+AsyncSession's connection via ``run_sync``: the SQL round trips are awaited
+on the event loop by the asyncio driver instead of holding a threadpool
+worker for the whole request.
+"""
+from typing import Annotated, List, Optional
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from event_service.database import get_async_db
+from event_service.schemas.event import EventCreate, EventPatch, EventUpdate, EventResponse
+from event_service.api import event as event_api
+from event_service.api.filters import EventFilters, event_filters
+from event_service.api.serialization import FIELDS_DESCRIPTION
+from event_service.core.query_monitor import query_budget
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+# Path ids use the int convertor so these routes never shadow static
+# /events/... paths registered on the sync router. Statement budgets match
+# the sync routes.
+
+
+@router.post(
+    "",
+    response_model=EventResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(event_api._create_budget)],
+)
+async def create_event(
+    event_in: EventCreate,
+    db: AsyncSession = Depends(get_async_db),
+    check_conflicts: Annotated[bool, Query(description=event_api.CONFLICTS_DESCRIPTION)] = False,
+) -> Response:
+    return await db.run_sync(
+        lambda session: event_api.create_event(event_in, db=session, check_conflicts=check_conflicts)
+    )
+
+
+@router.get("", response_model=List[EventResponse], dependencies=[Depends(query_budget(2))])
+async def list_events(
+    limit: Optional[int] = Query(None, ge=1, description="Page size; clamped to the server maximum"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+    filters: EventFilters = Depends(event_filters),
+    db: AsyncSession = Depends(get_async_db),
+    if_none_match: Annotated[Optional[str], Header()] = None,
+    fields: Annotated[Optional[str], Query(description=FIELDS_DESCRIPTION)] = None,
+) -> Response:
+    return await db.run_sync(
+        lambda session: event_api.list_events(
+            limit=limit, cursor=cursor, filters=filters, db=session, if_none_match=if_none_match, fields=fields
+        )
+    )
+
+
+@router.get("/{event_id:int}", response_model=EventResponse, dependencies=[Depends(query_budget(2))])
+async def get_event(
+    event_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    if_none_match: Annotated[Optional[str], Header()] = None,
+    if_modified_since: Annotated[Optional[str], Header()] = None,
+    fields: Annotated[Optional[str], Query(description=FIELDS_DESCRIPTION)] = None,
+) -> Response:
+    return await db.run_sync(
+        lambda session: event_api.get_event(
+            event_id, db=session, if_none_match=if_none_match, if_modified_since=if_modified_since, fields=fields
+        )
+    )
+
+
+@router.put("/{event_id:int}", response_model=EventResponse, dependencies=[Depends(query_budget(3))])
+async def update_event(
+    event_id: int,
+    event_in: EventUpdate,
+    background_tasks: BackgroundTasks,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    if_match: Annotated[Optional[str], Header()] = None,
+) -> EventResponse:
+    return await db.run_sync(
+        lambda session: event_api.update_event(
+            event_id, event_in, background_tasks, db=session, response=response, if_match=if_match
+        )
+    )
+
+
+@router.patch("/{event_id:int}", response_model=EventResponse, dependencies=[Depends(query_budget(5))])
+async def patch_event(
+    event_id: int,
+    event_in: EventPatch,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    return await db.run_sync(lambda session: event_api.patch_event(event_id, event_in, background_tasks, db=session))
+
+
+@router.delete("/{event_id:int}", status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(query_budget(2))])
+async def delete_event(event_id: int, db: AsyncSession = Depends(get_async_db)) -> Response:
+    return await db.run_sync(lambda session: event_api.delete_event(event_id, db=session))
@@ -0,0 +1,160 @@
+from typing import Dict, List
+import logging
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from event_service.database import get_db
+from event_service.models.event import Event, naive_utc_times
+from event_service.schemas.event import (
+    EventBatchDelete,
+    EventBatchItemResult,
+    EventBatchResponse,
+    EventBatchUpdate,
+    EventCreate,
+    EventResponse,
+)
+from event_service.core.config import settings
+from event_service.services.cache import event_cache
+from event_service.services.intervals import event_intervals
+from event_service.services.notifications import notify_fields_changed, snapshot_notify_fields
+from event_service.core.query_monitor import query_budget
+from event_service.api.outbox import queue_event_update_emails
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+
+def _check_batch_size(size: int) -> None:
+    if size > settings.EVENTS_BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch too large: at most {settings.EVENTS_BATCH_MAX_SIZE} items per request",
+        )
+
+
+def _rollback(db: Session) -> None:
+    try:
+        db.rollback()
+    except Exception:
+        logging.error("Failed to rollback session", exc_info=True)
+
+
+# SQLite cannot return the ids of a multi-row INSERT in parameter order, so
+# SQLAlchemy inserts row by row there and the count grows with the batch
+@router.post(":batch", response_model=EventBatchResponse, dependencies=[Depends(query_budget(None))])
+def create_events_batch(items: List[EventCreate], db: Session = Depends(get_db)) -> EventBatchResponse:
+    """Create many events with a multi-row INSERT ... RETURNING in one transaction."""
+    _check_batch_size(len(items))
+    if not items:
+        return EventBatchResponse(results=[])
+    try:
+        stmt = insert(Event).returning(Event, sort_by_parameter_order=True)
+        created = db.scalars(stmt, [naive_utc_times(item.model_dump()) for item in items]).all()
+        # Serialize before commit: committing expires the instances and would reload each one
+        results = [
+            EventBatchItemResult(index=i, id=ev.id, status=status.HTTP_201_CREATED, event=EventResponse.model_validate(ev))
+            for i, ev in enumerate(created)
+        ]
+        db.commit()
+        event_cache.invalidate(*(result.id for result in results))
+        return EventBatchResponse(results=results)
+    except Exception as e:
+        logging.error(e, exc_info=True)
+        _rollback(db)
+        raise HTTPException(status_code=500, detail="Failed to create events")
+
+
+# The SELECT, then one UPDATE per changed row and the outbox INSERT (one per
+# entry on SQLite, as for POST :batch), so the count grows with the batch
+@router.patch(":batch", response_model=EventBatchResponse, dependencies=[Depends(query_budget(None))])
+def update_events_batch(
+    items: List[EventBatchUpdate],
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+) -> EventBatchResponse:
+    """Apply partial updates to many events in one transaction.
+
+    Targets are loaded with one SELECT and written in a single flush. An
+    event listed several times gets its updates applied in order and at most
+    one notification; the notifications are queued in the same transaction.
+    """
+    _check_batch_size(len(items))
+    if not items:
+        return EventBatchResponse(results=[])
+    try:
+        ids = {item.id for item in items}
+        existing: Dict[int, Event] = {
+            ev.id: ev for ev in db.execute(select(Event).where(Event.id.in_(ids))).scalars().all()
+        }
+
+        snapshots: Dict[int, dict] = {}
+        for item in items:
+            ev = existing.get(item.id)
+            if ev is None:
+                continue
+            if item.id not in snapshots:
+                snapshots[item.id] = snapshot_notify_fields(ev)
+            for key, value in naive_utc_times(item.model_dump(exclude_none=True, exclude={"id"})).items():
+                setattr(ev, key, value)
+
+        # Times were converted to the stored naive UTC form above, so the
+        # in-memory values compare equal to what the flush writes
+        db.flush()
+        changed = [event_id for event_id, orig in snapshots.items() if notify_fields_changed(orig, existing[event_id])]
+        queue_event_update_emails(db, background_tasks, changed)
+
+        # Serialize before commit: committing expires the instances and would reload each one
+        results: List[EventBatchItemResult] = []
+        for i, item in enumerate(items):
+            ev = existing.get(item.id)
+            if ev is None:
+                results.append(
+                    EventBatchItemResult(index=i, id=item.id, status=status.HTTP_404_NOT_FOUND, detail="Event not found")
+                )
+            else:
+                results.append(
+                    EventBatchItemResult(index=i, id=ev.id, status=status.HTTP_200_OK, event=EventResponse.model_validate(ev))
+                )
+
+        db.commit()
+        event_cache.invalidate(*snapshots.keys())
+        return EventBatchResponse(results=results)
+    except Exception as e:
+        logging.error(e, exc_info=True)
+        _rollback(db)
+        raise HTTPException(status_code=500, detail="Failed to update events")
+
+
+# DELETE ... RETURNING
+@router.delete(":batch", response_model=EventBatchResponse, dependencies=[Depends(query_budget(1))])
+def delete_events_batch(body: EventBatchDelete, db: Session = Depends(get_db)) -> EventBatchResponse:
+    """Delete many events with a single DELETE ... RETURNING id."""
+    _check_batch_size(len(body.ids))
+    if not body.ids:
+        return EventBatchResponse(results=[])
+    try:
+        stmt = (
+            delete(Event)
+            .where(Event.id.in_(set(body.ids)))
+            .returning(Event.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = set(db.execute(stmt).scalars().all())
+        db.commit()
+        event_cache.invalidate(*deleted)
+        event_intervals.discard(*deleted)
+
+        results = []
+        for i, event_id in enumerate(body.ids):
+            if event_id in deleted:
+                results.append(EventBatchItemResult(index=i, id=event_id, status=status.HTTP_204_NO_CONTENT))
+            else:
+                results.append(
+                    EventBatchItemResult(index=i, id=event_id, status=status.HTTP_404_NOT_FOUND, detail="Event not found")
+                )
+        return EventBatchResponse(results=results)
+    except Exception as e:
+        logging.error(e, exc_info=True)
+        _rollback(db)
+        raise HTTPException(status_code=500, detail="Failed to delete events")
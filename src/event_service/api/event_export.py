@@ -0,0 +1,111 @@
+"""Streaming export of the events table.
+
+Rows are fetched through a server-side cursor (stream_results + yield_per)
+as plain column tuples and written out one partition at a time, so memory
+use does not grow with the table and the first bytes are sent as soon as
+the first partition arrives.
+"""
+import csv
+import io
+import json
+import logging
+from datetime import datetime
+from typing import Iterator, Literal, Sequence
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+
+from event_service.database import SessionLocal
+from event_service.models.event import Event
+from event_service.core.config import settings
+from event_service.api.filters import EventFilters, event_filters
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+# Same fields, in the same order, as EventResponse
+EXPORT_COLUMNS = (
+    "id",
+    "name",
+    "description",
+    "start_time",
+    "end_time",
+    "location",
+    "participants",
+    "created_at",
+    "updated_at",
+)
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _ndjson_chunk(rows: Sequence[tuple]) -> str:
+    return "".join(
+        json.dumps(dict(zip(EXPORT_COLUMNS, row)), default=_json_default, separators=(",", ":")) + "\n" for row in rows
+    )
+
+
+def _csv_cell(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        # Lossless and unambiguous for addresses containing separators
+        return json.dumps(value)
+    return value
+
+
+def iter_export(fmt: str, filters: EventFilters, batch_size: int) -> Iterator[str]:
+    """Yield the export in `fmt`, one chunk of up to `batch_size` rows at a time.
+
+    Opens its own session: the response body is produced after the request
+    dependencies (and their sessions) have been closed.
+    """
+    db = SessionLocal()
+    try:
+        columns = [Event.__table__.c[name] for name in EXPORT_COLUMNS]
+        stmt = (
+            filters.apply(select(*columns), db.get_bind().dialect.name)
+            .order_by(Event.id)
+            .execution_options(stream_results=True, yield_per=batch_size)
+        )
+        result = db.execute(stmt)
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\r\n")
+        if fmt == "csv":
+            writer.writerow(EXPORT_COLUMNS)
+            yield buffer.getvalue()
+
+        for rows in result.partitions():
+            if fmt == "ndjson":
+                yield _ndjson_chunk(rows)
+            else:
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows([_csv_cell(value) for value in row] for row in rows)
+                yield buffer.getvalue()
+    except Exception as e:
+        # Headers are already sent; the client sees a truncated body
+        logging.error(e, exc_info=True)
+        raise
+    finally:
+        db.close()
+
+
+@router.get("/export")
+def export_events(
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Output format"),
+    filters: EventFilters = Depends(event_filters),
+) -> StreamingResponse:
+    """Stream every event matching the listing filters, ordered by id, as NDJSON or CSV."""
+    return StreamingResponse(
+        iter_export(format, filters, settings.EVENTS_EXPORT_BATCH_SIZE),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="events.{format}"'},
+    )
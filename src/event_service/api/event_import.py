@@ -0,0 +1,232 @@
+"""Bulk streaming import of events (the counterpart of GET /events/export).
+
+The request body is consumed as it arrives and cut into chunks of
+EVENTS_IMPORT_CHUNK_SIZE records. Each chunk is validated with EventCreate
+and inserted in its own transaction on a threadpool worker: through COPY on
+Postgres (psycopg2) and a batched INSERT ... RETURNING elsewhere. Invalid lines
+are reported and skipped; they do not abort the import. The inserted ids are
+invalidated in the event cache after each commit, like every other write path.
+"""
+import codecs
+import csv
+import io
+import json
+import logging
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Literal, Optional, Tuple
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from event_service.database import SessionLocal
+from event_service.models.event import Event, naive_utc_times
+from event_service.schemas.event import EventCreate, EventImportError, EventImportSummary
+from event_service.core.config import settings
+from event_service.core.query_monitor import query_budget
+from event_service.services.cache import event_cache
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+IMPORT_COLUMNS = (
+    "name",
+    "description",
+    "start_time",
+    "end_time",
+    "location",
+    "participants",
+    "created_at",
+    "updated_at",
+)
+
+# (line number, raw record): a JSON text for NDJSON, a field mapping for CSV
+Record = Tuple[int, object]
+
+
+async def _lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, str]]:
+    """Split a byte stream into numbered text lines, keeping line endings."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    lineno = 0
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *complete, pending = pending.split("\n")
+        for line in complete:
+            lineno += 1
+            yield lineno, line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield lineno + 1, pending
+
+
+async def _ndjson_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[Record]:
+    async for lineno, line in _lines(chunks):
+        if line.strip():
+            yield lineno, line
+
+
+async def _csv_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[Record]:
+    header: Optional[List[str]] = None
+    record, start = "", 0
+    async for lineno, line in _lines(chunks):
+        if not record:
+            start = lineno
+        record += line
+        # Quoted fields may span lines; a record is complete once its quotes balance
+        if record.count('"') % 2:
+            continue
+        fields = next(csv.reader([record]), [])
+        record = ""
+        if not any(field.strip() for field in fields):
+            continue
+        if header is None:
+            header = [name.strip() for name in fields]
+            continue
+        yield start, dict(zip(header, fields))
+    if record:
+        yield start, ValueError("Unterminated quoted field")
+
+
+def _csv_payload(fields: Dict[str, str]) -> dict:
+    payload = {key: (value if value != "" else None) for key, value in fields.items() if key in EventCreate.model_fields}
+    participants = payload.get("participants")
+    if participants is not None:
+        # JSON array as written by the export, or a ;-separated list
+        if participants.lstrip().startswith("["):
+            payload["participants"] = json.loads(participants)
+        else:
+            payload["participants"] = [p.strip() for p in participants.split(";") if p.strip()]
+    return payload
+
+
+def _describe(e: Exception) -> str:
+    if isinstance(e, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" if err["loc"] else err["msg"] for err in e.errors()
+        )
+    if isinstance(e, json.JSONDecodeError):
+        return f"Invalid JSON: {e.msg}"
+    return str(e)
+
+
+def _validate(records: List[Record], fmt: str, now: datetime) -> Tuple[List[Tuple[int, dict]], List[EventImportError]]:
+    rows: List[Tuple[int, dict]] = []
+    errors: List[EventImportError] = []
+    for lineno, raw in records:
+        try:
+            if isinstance(raw, Exception):
+                raise raw
+            if fmt == "ndjson":
+                event_in = EventCreate.model_validate_json(raw)
+            else:
+                event_in = EventCreate.model_validate(_csv_payload(raw))
+        except (ValidationError, ValueError) as e:
+            errors.append(EventImportError(line=lineno, error=_describe(e)))
+            continue
+        row = naive_utc_times(event_in.model_dump())
+        # Set explicitly: COPY bypasses the model's Python-side defaults
+        row["created_at"] = row["updated_at"] = now
+        rows.append((lineno, row))
+    return rows, errors
+
+
+def _copy_cell(value) -> str:
+    # Quoted values are never NULL in COPY csv format, so only None is left unquoted
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    elif isinstance(value, list):
+        items = ('"' + str(item).replace("\\", "\\\\").replace('"', '\\"') + '"' for item in value)
+        value = "{" + ",".join(items) + "}"
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _copy_rows(db: Session, rows: List[dict]) -> Optional[List[int]]:
+    """COPY rows into events and return their ids; None when the driver has no COPY support.
+
+    COPY cannot return generated keys, so the ids are drawn from the events
+    sequence first (one statement) and copied with the rows.
+    """
+    cursor = db.connection().connection.dbapi_connection.cursor()
+    try:
+        if not hasattr(cursor, "copy_expert"):
+            return None
+        sequence = func.pg_get_serial_sequence("events", "id")
+        ids = list(db.scalars(select(func.nextval(sequence)).select_from(func.generate_series(1, len(rows)))))
+        buffer = io.StringIO()
+        for event_id, row in zip(ids, rows):
+            buffer.write(",".join([str(event_id), *(_copy_cell(row[name]) for name in IMPORT_COLUMNS)]))
+            buffer.write("\n")
+        buffer.seek(0)
+        cursor.copy_expert(f"COPY events (id, {', '.join(IMPORT_COLUMNS)}) FROM STDIN WITH (FORMAT csv)", buffer)
+        return ids
+    finally:
+        cursor.close()
+
+
+def _insert_chunk(records: List[Record], fmt: str) -> Tuple[int, List[EventImportError]]:
+    """Validate and insert one chunk in its own transaction; returns (inserted, errors)."""
+    rows, errors = _validate(records, fmt, datetime.utcnow())
+    if not rows:
+        return 0, errors
+    db = SessionLocal()
+    try:
+        values = [row for _, row in rows]
+        ids = _copy_rows(db, values) if db.get_bind().dialect.name == "postgresql" else None
+        if ids is None:
+            ids = list(db.scalars(insert(Event).returning(Event.id), values))
+        db.commit()
+        # New ids can still have entries, e.g. a reused SQLite rowid of a row deleted outside the API
+        event_cache.invalidate(*ids)
+        return len(rows), errors
+    except Exception as e:
+        logging.error(e, exc_info=True)
+        try:
+            db.rollback()
+        except Exception:
+            logging.error("Failed to rollback session", exc_info=True)
+        first, last = rows[0][0], rows[-1][0]
+        errors.append(EventImportError(line=first, error=f"Failed to insert the {len(rows)} valid rows of lines {first}-{last}"))
+        return 0, errors
+    finally:
+        db.close()
+
+
+# One statement per chunk, so the count grows with the upload
+@router.post("/import", response_model=EventImportSummary, dependencies=[Depends(query_budget(None))])
+async def import_events(
+    request: Request,
+    format: Optional[Literal["ndjson", "csv"]] = Query(
+        None, description="Body format; defaults from Content-Type (text/csv means csv, anything else ndjson)"
+    ),
+) -> EventImportSummary:
+    """Import events from a streamed NDJSON or CSV body and summarize the rejected lines."""
+    fmt = format or ("csv" if request.headers.get("content-type", "").startswith("text/csv") else "ndjson")
+    records = _csv_records(request.stream()) if fmt == "csv" else _ndjson_records(request.stream())
+    chunk_size = settings.EVENTS_IMPORT_CHUNK_SIZE
+    max_errors = settings.EVENTS_IMPORT_MAX_ERRORS
+
+    summary = EventImportSummary(received=0, inserted=0, failed=0, errors=[])
+
+    async def _flush(chunk: List[Record]) -> None:
+        inserted, errors = await run_in_threadpool(_insert_chunk, chunk, fmt)
+        summary.inserted += inserted
+        summary.failed += len(chunk) - inserted
+        room = max_errors - len(summary.errors)
+        summary.errors.extend(errors[:room])
+        if len(errors) > room:
+            summary.errors_truncated = True
+
+    chunk: List[Record] = []
+    async for record in records:
+        summary.received += 1
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            await _flush(chunk)
+            chunk = []
+    if chunk:
+        await _flush(chunk)
+    return summary
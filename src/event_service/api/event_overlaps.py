@@ -0,0 +1,91 @@
+"""GET /events/overlaps: events whose time window overlaps [start, end).
+
+Windows are half-open, so back-to-back events do not overlap, and events
+without both start_time and end_time (or with end_time <= start_time) never
+match. Postgres tests the generated time_range column with && on its GiST
+index. SQLite takes candidate ids from the in-memory interval tree of
+services.intervals, then reads and re-checks just those rows.
+"""
+import json
+import logging
+from datetime import datetime
+from typing import Annotated, List, Optional, Sequence
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import Select, bindparam, func, literal, literal_column, select
+from sqlalchemy.orm import Session
+
+from event_service.api.filters import any_participant_predicate
+from event_service.api.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor, resolve_page_size
+from event_service.api.serialization import EVENT_COLUMNS, dump_events, json_response
+from event_service.core.config import settings
+from event_service.core.query_monitor import query_budget
+from event_service.database import get_db
+from event_service.models.event import Event, naive_utc
+from event_service.schemas.event import EventResponse
+from event_service.services.intervals import event_intervals
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+
+def overlapping_events(
+    db: Session, start: datetime, end: datetime, participants: Optional[Sequence[str]] = None
+) -> Select:
+    """EVENT_COLUMNS of the events overlapping [start, end) (naive UTC), ordered by id.
+
+    With participants, only events listing at least one of them. On SQLite
+    this first syncs the interval index, which is one more statement.
+    """
+    dialect_name = db.get_bind().dialect.name
+    if dialect_name == "postgresql":
+        window = func.tsrange(start, end, literal("[)"))
+        stmt = select(*EVENT_COLUMNS).where(literal_column("events.time_range").op("&&")(window))
+    else:
+        event_intervals.sync(db)
+        # The ids travel as one JSON array parameter, however many there are
+        ids = json.dumps(event_intervals.overlapping(start, end))
+        candidates = func.json_each(bindparam("candidate_ids", ids)).table_valued("value")
+        # The re-check drops candidates another process has moved or deleted since the sync
+        stmt = select(*EVENT_COLUMNS).where(
+            Event.id.in_(select(candidates.c.value)), Event.start_time < end, Event.end_time > start
+        )
+    if participants:
+        stmt = stmt.where(any_participant_predicate(participants, dialect_name))
+    return stmt.order_by(Event.id)
+
+
+# SQLite: the interval index sync, then the page
+@router.get("/overlaps", response_model=List[EventResponse], dependencies=[Depends(query_budget(2))])
+def list_overlapping_events(
+    start: Annotated[datetime, Query(description="Window start (inclusive)")],
+    end: Annotated[datetime, Query(description="Window end (exclusive)")],
+    participant: Annotated[Optional[str], Query(description="Only events listing this participant address")] = None,
+    limit: Optional[int] = Query(None, ge=1, description="Page size; clamped to the server maximum"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+    db: Session = Depends(get_db),
+) -> Response:
+    """Events overlapping [start, end), optionally only one participant's, ordered by id."""
+    start, end = naive_utc(start), naive_utc(end)
+    if not end > start:
+        raise HTTPException(status_code=400, detail="end must be after start")
+    page_size = resolve_page_size(limit, settings)
+    after_id = None
+    if cursor:
+        try:
+            after_id = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    try:
+        stmt = overlapping_events(db, start, end, [participant] if participant is not None else None)
+        if after_id is not None:
+            stmt = stmt.where(Event.id > after_id)
+        # One extra row tells whether there is a next page
+        rows = db.execute(stmt.limit(page_size + 1)).all()
+        headers = {}
+        if len(rows) > page_size:
+            headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[page_size - 1].id)
+        return json_response(dump_events(rows[:page_size]), headers=headers)
+    except Exception as e:
+        logging.error(e, exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to list overlapping events")
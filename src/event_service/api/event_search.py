@@ -0,0 +1,130 @@
+"""GET /events/search: ranked, paginated keyword search with highlights.
+
+Postgres matches websearch_to_tsquery() against the generated search_vector
+column (GIN index) and ranks with ts_rank_cd; SQLite matches the FTS5
+events_fts table and ranks with bm25. Both weight name over location over
+description. Pages use a keyset cursor on (rank, id), and highlights are
+computed only for the rows of the page: on Postgres in an outer query over
+the ranked page, on SQLite by re-matching just the page's rowids.
+"""
+import logging
+import re
+from typing import Annotated, List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import Select, and_, bindparam, column, func, literal_column, or_, select, table
+from sqlalchemy.orm import Session
+
+from event_service.api.pagination import NEXT_CURSOR_HEADER, decode_rank_cursor, encode_rank_cursor, resolve_page_size
+from event_service.api.serialization import EVENT_COLUMNS, EVENT_FIELDS, dump_search_hits, json_response
+from event_service.core.config import settings
+from event_service.core.query_monitor import query_budget
+from event_service.database import get_db
+from event_service.models.event import SEARCH_CONFIG, Event
+from event_service.schemas.event import EventSearchResult
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+SNIPPET_ELLIPSIS = "…"
+# Tokens of a description snippet (SQLite) / words of a headline fragment (Postgres)
+SNIPPET_TOKENS = 24
+# bm25 column weights in events_fts column order (name, description, location)
+SQLITE_WEIGHTS = (10.0, 1.0, 4.0)
+MAX_QUERY_LENGTH = 256
+
+_WORD = re.compile(r"\w+")
+_events_fts = table("events_fts", column("rowid"))
+_fts = literal_column("events_fts")
+
+
+def _sqlite_match_query(q: str) -> str:
+    """FTS5 query matching every word of q; quoting keeps FTS5 operators in user input literal."""
+    return " ".join(f'"{word}"' for word in _WORD.findall(q))
+
+
+def _after(rank, row_id, after: Optional[Tuple[float, int]]):
+    """Keyset predicate for rank DESC, id ASC."""
+    last_rank, last_id = after
+    return or_(rank < last_rank, and_(rank == last_rank, row_id > last_id))
+
+
+def _sqlite_search(q: str, size: int, after: Optional[Tuple[float, int]]) -> Select:
+    match = _fts.op("MATCH")(bindparam("match", _sqlite_match_query(q)))
+    # bm25 is lower for better matches; negated so that rank is "higher is better" on both backends
+    rank = -func.bm25(_fts, *SQLITE_WEIGHTS)
+    page = select(_events_fts.c.rowid).where(match).order_by(rank.desc(), _events_fts.c.rowid).limit(size)
+    if after is not None:
+        page = page.where(_after(rank, _events_fts.c.rowid, after))
+    return (
+        select(
+            *EVENT_COLUMNS,
+            rank.label("rank"),
+            func.highlight(_fts, 0, HIGHLIGHT_START, HIGHLIGHT_STOP).label("name_highlight"),
+            func.snippet(_fts, 1, HIGHLIGHT_START, HIGHLIGHT_STOP, SNIPPET_ELLIPSIS, SNIPPET_TOKENS).label(
+                "description_highlight"
+            ),
+            func.highlight(_fts, 2, HIGHLIGHT_START, HIGHLIGHT_STOP).label("location_highlight"),
+        )
+        .select_from(_events_fts.join(Event.__table__, Event.id == _events_fts.c.rowid))
+        # Auxiliary functions need a full-text query, so the page's rowids are matched again
+        .where(match, _events_fts.c.rowid.in_(page))
+        .order_by(rank.desc(), Event.id)
+    )
+
+
+def _postgres_search(q: str, size: int, after: Optional[Tuple[float, int]]) -> Select:
+    config = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+    query = func.websearch_to_tsquery(config, bindparam("q", q))
+    vector = literal_column("events.search_vector")
+    rank = func.ts_rank_cd(vector, query)
+    hits = select(*EVENT_COLUMNS, rank.label("rank")).where(vector.op("@@")(query))
+    if after is not None:
+        hits = hits.where(_after(rank, Event.id, after))
+    hits = hits.order_by(rank.desc(), Event.id).limit(size).subquery("hits")
+
+    def _headline(value, options: str):
+        return func.ts_headline(config, value, query, f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, {options}")
+
+    return select(
+        *[hits.c[name] for name in EVENT_FIELDS],
+        hits.c.rank,
+        _headline(hits.c.name, "HighlightAll=true").label("name_highlight"),
+        _headline(
+            hits.c.description, f"MaxWords={SNIPPET_TOKENS}, MinWords=8, MaxFragments=2, FragmentDelimiter={SNIPPET_ELLIPSIS}"
+        ).label("description_highlight"),
+        _headline(hits.c.location, "HighlightAll=true").label("location_highlight"),
+    ).order_by(hits.c.rank.desc(), hits.c.id)
+
+
+@router.get("/search", response_model=List[EventSearchResult], dependencies=[Depends(query_budget(1))])
+def search_events(
+    q: Annotated[str, Query(min_length=1, max_length=MAX_QUERY_LENGTH, description="Words to look for")],
+    limit: Optional[int] = Query(None, ge=1, description="Page size; clamped to the server maximum"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+    db: Session = Depends(get_db),
+) -> Response:
+    """Events matching every word of q in name, description or location, best matches first."""
+    if not _WORD.search(q):
+        raise HTTPException(status_code=400, detail="Search query must contain at least one word")
+    page_size = resolve_page_size(limit, settings)
+    after = None
+    if cursor:
+        try:
+            after = decode_rank_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    try:
+        search = _postgres_search if db.get_bind().dialect.name == "postgresql" else _sqlite_search
+        # One extra row tells whether there is a next page
+        rows = db.execute(search(q, page_size + 1, after)).all()
+        headers = {}
+        if len(rows) > page_size:
+            last = rows[page_size - 1]
+            headers[NEXT_CURSOR_HEADER] = encode_rank_cursor(last.rank, last.id)
+        return json_response(dump_search_hits(rows[:page_size]), headers=headers)
+    except Exception as e:
+        logging.error(e, exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to search events")
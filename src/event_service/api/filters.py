@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Sequence
+
+from fastapi import Query
+from sqlalchemy import Select, String, cast, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY as PG_ARRAY
+
+from event_service.models.event import Event, EventParticipant, naive_utc
+
+
+def participant_predicate(email: str, dialect_name: Optional[str]):
+    """Predicate matching events that list `email` among their participants.
+
+    On Postgres this is an array containment test answered by the GIN index;
+    elsewhere it goes through the trigger-maintained event_participants table.
+    """
+    if dialect_name == "postgresql":
+        return Event.participants.op("@>")(cast(literal([email], PG_ARRAY(String())), PG_ARRAY(String())))
+    return Event.id.in_(select(EventParticipant.event_id).where(EventParticipant.email == email))
+
+
+def any_participant_predicate(emails: Sequence[str], dialect_name: Optional[str]):
+    """Predicate matching events that list at least one of `emails` (array overlap on Postgres)."""
+    if dialect_name == "postgresql":
+        return Event.participants.op("&&")(cast(literal(list(emails), PG_ARRAY(String())), PG_ARRAY(String())))
+    return Event.id.in_(select(EventParticipant.event_id).where(EventParticipant.email.in_(list(emails))))
+
+
+@dataclass
+class EventFilters:
+    """Filters accepted by the events listing.
+
+    Each filter maps to an indexed predicate on the events table so a
+    calendar-window query is answered by an index range scan.
+    """
+
+    starts_after: Optional[datetime] = None
+    ends_before: Optional[datetime] = None
+    location: Optional[str] = None
+    updated_since: Optional[datetime] = None
+    participant: Optional[str] = None
+
+    def apply(self, stmt: Select, dialect_name: Optional[str] = None) -> Select:
+        starts_after = naive_utc(self.starts_after)
+        ends_before = naive_utc(self.ends_before)
+        updated_since = naive_utc(self.updated_since)
+
+        if starts_after is not None:
+            stmt = stmt.where(Event.start_time >= starts_after)
+        if ends_before is not None:
+            stmt = stmt.where(Event.end_time <= ends_before)
+        if self.location is not None:
+            stmt = stmt.where(Event.location == self.location)
+        if updated_since is not None:
+            stmt = stmt.where(Event.updated_at >= updated_since)
+        if self.participant is not None:
+            stmt = stmt.where(participant_predicate(self.participant, dialect_name))
+        return stmt
+
+
+def event_filters(
+    starts_after: Optional[datetime] = Query(None, description="Only events starting at or after this time"),
+    ends_before: Optional[datetime] = Query(None, description="Only events ending at or before this time"),
+    location: Optional[str] = Query(None, description="Only events at this exact location"),
+    updated_since: Optional[datetime] = Query(None, description="Only events updated at or after this time"),
+    participant: Optional[str] = Query(None, description="Only events listing this participant address"),
+) -> EventFilters:
+    """FastAPI dependency collecting the listing filters from query parameters."""
+    return EventFilters(
+        starts_after=starts_after,
+        ends_before=ends_before,
+        location=location,
+        updated_since=updated_since,
+        participant=participant,
+    )
@@ -0,0 +1,87 @@
+from datetime import datetime
+from typing import Any, Dict, List
+
+from fastapi import APIRouter, Response
+from sqlalchemy import func, select
+
+from event_service import database
+from event_service.core.compression import compressed_body_cache
+from event_service.core.metrics import PROMETHEUS_CONTENT_TYPE, Gauge, HistogramFamily, registry
+from event_service.core.pool import pool_status
+from event_service.models.notification import OUTBOX_FAILED, OUTBOX_IN_PROGRESS, OUTBOX_PENDING, NotificationOutbox
+from event_service.services.cache import event_cache
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@registry.register_collector
+def _pool_wait_metrics() -> List[HistogramFamily]:
+    wait = HistogramFamily(
+        "db_pool_checkout_wait_seconds", "Time spent waiting for a pooled database connection.", ("engine",)
+    )
+    wait.bind(database.pool_metrics.wait_seconds, "sync")
+    if database.async_engine is not None:
+        wait.bind(database.async_pool_metrics.wait_seconds, "async")
+    return [wait]
+
+
+@registry.register_collector
+def _outbox_metrics() -> List[Gauge]:
+    """Notification queue depth, read on every scrape.
+
+    Only pending, in_progress and failed rows are counted: all are range scans
+    of the (status, next_attempt_at) index, while sent rows grow without bound.
+    An in_progress row counts as due once its lease has expired.
+    """
+    depth = Gauge("notification_outbox_entries", "Notification outbox rows by status.", ("status",))
+    lag = Gauge(
+        "notification_outbox_oldest_due_seconds",
+        "How long the oldest pending notification has been due (0 when the worker is keeping up).",
+    )
+    counts = {OUTBOX_PENDING: 0, OUTBOX_IN_PROGRESS: 0, OUTBOX_FAILED: 0}
+    db = database.SessionLocal()
+    try:
+        rows = db.execute(
+            select(NotificationOutbox.status, func.count())
+            .where(NotificationOutbox.status.in_(list(counts)))
+            .group_by(NotificationOutbox.status)
+        )
+        counts.update({status: count for status, count in rows})
+        oldest_due = db.execute(
+            select(func.min(NotificationOutbox.next_attempt_at)).where(
+                NotificationOutbox.status.in_((OUTBOX_PENDING, OUTBOX_IN_PROGRESS))
+            )
+        ).scalar()
+    finally:
+        db.close()
+    for status, count in counts.items():
+        depth.set(count, status)
+    lag.set(max(0.0, (datetime.utcnow() - oldest_due).total_seconds()) if oldest_due else 0.0)
+    return [depth, lag]
+
+
+@router.get("", response_class=Response)
+def prometheus_metrics() -> Response:
+    """All metrics in the Prometheus text exposition format."""
+    return Response(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@router.get("/db-pool")
+def db_pool_metrics() -> Dict[str, Any]:
+    """Live connection pool occupancy, lifecycle counters and checkout wait histogram."""
+    stats: Dict[str, Any] = {"sync": pool_status(database.engine, database.pool_metrics)}
+    if database.async_engine is not None:
+        stats["async"] = pool_status(database.async_engine.sync_engine, database.async_pool_metrics)
+    return stats
+
+
+@router.get("/cache")
+def cache_metrics() -> Dict[str, Any]:
+    """Hit/miss and invalidation counters of the GET /events/{event_id} cache."""
+    return event_cache.snapshot()
+
+
+@router.get("/compression")
+def compression_metrics() -> Dict[str, Any]:
+    """Hit/miss counters of the compressed response body cache."""
+    return compressed_body_cache.snapshot()
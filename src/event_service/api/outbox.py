@@ -0,0 +1,32 @@
+"""Queueing of participant update emails from the write routes.
+
+Entries are written to the notification outbox in the caller's transaction,
+so they commit or roll back with the change that triggered them.
+"""
+from typing import List
+
+from fastapi import BackgroundTasks
+from sqlalchemy.orm import Session
+
+from event_service.database import SessionLocal
+from event_service.core.config import settings
+from event_service.services.outbox import deliver_entry, enqueue_event_update, enqueue_event_updates
+
+
+def queue_event_update_email(db: Session, background_tasks: BackgroundTasks, event_id: int) -> None:
+    """Write an outbox entry in db's current transaction.
+
+    When NOTIFICATION_OUTBOX_INLINE is set, delivery is also attempted in a
+    background task once the response is sent; the worker retries anything
+    that task does not complete.
+    """
+    entry = enqueue_event_update(db, event_id)
+    if settings.NOTIFICATION_OUTBOX_INLINE:
+        background_tasks.add_task(deliver_entry, SessionLocal, entry.id, settings)
+
+
+def queue_event_update_emails(db: Session, background_tasks: BackgroundTasks, event_ids: List[int]) -> None:
+    """queue_event_update_email for several events, with one INSERT for all their outbox entries."""
+    for entry_id in enqueue_event_updates(db, event_ids):
+        if settings.NOTIFICATION_OUTBOX_INLINE:
+            background_tasks.add_task(deliver_entry, SessionLocal, entry_id, settings)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import base64
+import json
+import logging
+from typing import Optional, Tuple
+
+from event_service.core.config import Settings
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(last_id: int) -> str:
+    """Encode the keyset position after `last_id` as an opaque url-safe token."""
+    raw = json.dumps({"id": last_id}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """Decode a token produced by encode_cursor.
+
+    Raises ValueError if the token is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        last_id = data["id"]
+    except Exception as e:
+        logging.debug("Failed to decode cursor %r: %s", cursor, e)
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(last_id, int) or isinstance(last_id, bool):
+        raise ValueError("Invalid cursor")
+    return last_id
+
+
+def encode_rank_cursor(rank: float, last_id: int) -> str:
+    """Encode the position after (rank, last_id) in a relevance-ordered listing."""
+    raw = json.dumps({"rank": rank, "id": last_id}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_rank_cursor(cursor: str) -> Tuple[float, int]:
+    """Decode a token produced by encode_rank_cursor.
+
+    Raises ValueError if the token is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        rank, last_id = data["rank"], data["id"]
+    except Exception as e:
+        logging.debug("Failed to decode cursor %r: %s", cursor, e)
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(last_id, int) or isinstance(last_id, bool):
+        raise ValueError("Invalid cursor")
+    if not isinstance(rank, (int, float)) or isinstance(rank, bool):
+        raise ValueError("Invalid cursor")
+    return float(rank), last_id
+
+
+def resolve_page_size(limit: Optional[int], settings: Settings) -> int:
+    """Return the effective page size, clamped to the server-side maximum."""
+    if limit is None:
+        limit = settings.EVENTS_PAGE_SIZE_DEFAULT
+    return max(1, min(limit, settings.EVENTS_PAGE_SIZE_MAX))
@@ -0,0 +1,29 @@
+from typing import Annotated, List, Optional
+import dataclasses
+
+from fastapi import APIRouter, Depends, Header, Query, Response
+from sqlalchemy.orm import Session
+
+from event_service.database import get_db
+from event_service.schemas.event import EventResponse
+from event_service.api.event import list_events
+from event_service.api.filters import EventFilters, event_filters
+from event_service.api.serialization import FIELDS_DESCRIPTION
+from event_service.core.query_monitor import query_budget
+
+router = APIRouter(prefix="/participants", tags=["participants"])
+
+
+@router.get("/{email}/events", response_model=List[EventResponse], dependencies=[Depends(query_budget(2))])
+def list_participant_events(
+    email: str,
+    limit: Optional[int] = Query(None, ge=1, description="Page size; clamped to the server maximum"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+    filters: EventFilters = Depends(event_filters),
+    db: Session = Depends(get_db),
+    if_none_match: Annotated[Optional[str], Header()] = None,
+    fields: Annotated[Optional[str], Query(description=FIELDS_DESCRIPTION)] = None,
+) -> Response:
+    """List the events a participant address belongs to (same paging and filters as GET /events)."""
+    filters = dataclasses.replace(filters, participant=email)
+    return list_events(limit=limit, cursor=cursor, filters=filters, db=db, if_none_match=if_none_match, fields=fields)
@@ -0,0 +1,134 @@
+"""Fast JSON encoding of events for read endpoints.
+
+Read paths select the EventResponse columns as row tuples and encode them
+straight to JSON bytes, skipping ORM object construction, per-row
+EventResponse validation and jsonable_encoder. The output is byte-for-byte
+what FastAPI would produce through response_model=EventResponse: same
+fields, same order, same datetime format. orjson is used when installed
+(the speedups extra), otherwise a pydantic TypeAdapter over EventRow.
+"""
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import Response
+from pydantic import TypeAdapter
+from sqlalchemy import Column
+from typing_extensions import TypedDict
+
+from event_service.models.event import Event
+from event_service.schemas.event import EventResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when the speedups extra is absent
+    orjson = None
+
+# EventResponse field order, which is also the key order of the encoded objects
+EVENT_FIELDS = tuple(EventResponse.model_fields)
+EVENT_COLUMNS: List[Column] = [Event.__table__.c[name] for name in EVENT_FIELDS]
+FIELDS_DESCRIPTION = f"Comma-separated subset of fields to return ({', '.join(EVENT_FIELDS)}); all when omitted"
+
+
+class EventRow(TypedDict, total=False):
+    """Serialization-only mirror of EventResponse for plain dict rows (any subset of its fields)."""
+
+    name: str
+    description: Optional[str]
+    start_time: Optional[datetime]
+    end_time: Optional[datetime]
+    location: Optional[str]
+    participants: Optional[List[str]]
+    id: int
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+
+class SearchHit(EventRow, total=False):
+    """Serialization-only mirror of EventSearchResult."""
+
+    rank: float
+    highlights: Dict[str, Optional[str]]
+
+
+_row_adapter = TypeAdapter(EventRow)
+_rows_adapter = TypeAdapter(List[EventRow])
+_hits_adapter = TypeAdapter(List[SearchHit])
+
+
+def parse_fields(value: Optional[str]) -> Tuple[str, ...]:
+    """Validate a comma-separated ?fields= value.
+
+    Returns the requested fields in EventResponse order, or all fields when
+    value is empty. Raises ValueError naming any unknown field.
+    """
+    if not value:
+        return EVENT_FIELDS
+    requested = {name.strip() for name in value.split(",") if name.strip()}
+    unknown = requested.difference(EVENT_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(sorted(unknown))}")
+    return tuple(name for name in EVENT_FIELDS if name in requested) or EVENT_FIELDS
+
+
+def query_columns(fields: Tuple[str, ...] = EVENT_FIELDS) -> List[Column]:
+    """Columns to SELECT for `fields`, plus id and updated_at (needed for cursors and ETags)."""
+    if fields == EVENT_FIELDS:
+        return EVENT_COLUMNS
+    names = set(fields) | {"id", "updated_at"}
+    return [column for column in EVENT_COLUMNS if column.name in names]
+
+
+def fields_variant(fields: Tuple[str, ...]) -> str:
+    """Distinguishes the ETags of partial representations from the full one ("" for all fields)."""
+    return "" if fields == EVENT_FIELDS else ",".join(fields)
+
+
+def _project(row: Any, fields: Tuple[str, ...]) -> Dict[str, Any]:
+    if fields == EVENT_FIELDS:
+        return dict(zip(EVENT_FIELDS, row))
+    mapping = row._mapping
+    return {name: mapping[name] for name in fields}
+
+
+def dump_event(row: Any, fields: Tuple[str, ...] = EVENT_FIELDS) -> bytes:
+    """Encode a row selected with query_columns(fields)."""
+    data = _project(row, fields)
+    return orjson.dumps(data) if orjson is not None else _row_adapter.dump_json(data)
+
+
+def dump_events(rows: Iterable[Any], fields: Tuple[str, ...] = EVENT_FIELDS) -> bytes:
+    data = [_project(row, fields) for row in rows]
+    return orjson.dumps(data) if orjson is not None else _rows_adapter.dump_json(data)
+
+
+def dump_search_hits(rows: Iterable[Any]) -> bytes:
+    """Encode search rows: the EVENT_COLUMNS, then rank and the name/description/location highlights."""
+    data = [
+        {
+            **_project(row, EVENT_FIELDS),
+            "rank": row.rank,
+            "highlights": {
+                "name": row.name_highlight,
+                "description": row.description_highlight,
+                "location": row.location_highlight,
+            },
+        }
+        for row in rows
+    ]
+    return orjson.dumps(data) if orjson is not None else _hits_adapter.dump_json(data)
+
+
+def project_cached(payload: bytes, fields: Tuple[str, ...]) -> bytes:
+    """Narrow an encoded full event to `fields`; values are already JSON-native."""
+    if fields == EVENT_FIELDS:
+        return payload
+    full = json.loads(payload)
+    data = {name: full[name] for name in fields}
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def json_response(content: bytes, status_code: int = 200, headers: Optional[Dict[str, str]] = None) -> Response:
+    return Response(content=content, status_code=status_code, media_type="application/json", headers=headers)
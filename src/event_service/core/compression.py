@@ -0,0 +1,352 @@
+"""Response compression (zstd, brotli, gzip) negotiated from Accept-Encoding.
+
+CompressionMiddleware compresses JSON, NDJSON and text responses of at
+least COMPRESSION_MINIMUM_SIZE bytes with the first encoding in
+COMPRESSION_ENCODINGS that the client accepts. gzip is always available;
+brotli and zstd need the `compression` extra and are skipped without it.
+Streamed bodies (GET /events/export) are compressed chunk by chunk, and
+each chunk is flushed so the client can decode it as soon as it arrives.
+
+A compressed representation is a different set of bytes, so its strong
+ETag gets the encoding as a suffix ("<hash>-gzip"). The suffix is stripped
+from If-None-Match / If-Match before the application compares validators,
+and a 304 repeats the tag the client sent.
+
+Complete 200 responses to GET that carry an ETag are compressed once: the
+bytes are kept in an LRU keyed by (encoding, target, ETag), where target is
+the path and query string, so a hot page is not recompressed on every
+request.
+"""
+from __future__ import annotations
+
+import threading
+import zlib
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from event_service.core.config import Settings, settings
+from event_service.services.cache import LRUCache
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - exercised when the compression extra is absent
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised when the compression extra is absent
+    zstandard = None
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+
+class _GzipStream:
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush_block(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliStream:
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush_block(self) -> bytes:
+        return self._compressor.flush()
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdStream:
+    def __init__(self, level: int) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush_block(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+
+def available_encodings() -> Tuple[str, ...]:
+    return ("gzip",) + (("br",) if brotli is not None else ()) + (("zstd",) if zstandard is not None else ())
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Map each coding in Accept-Encoding to its q-value (missing or invalid q counts as 1)."""
+    accepted: Dict[str, float] = {}
+    for item in header.split(","):
+        coding, *params = [part.strip() for part in item.split(";")]
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 1.0
+        accepted[coding.lower()] = q
+    return accepted
+
+
+def negotiate(header: Optional[str], encodings: Sequence[str]) -> Optional[str]:
+    """Pick the coding the client weights highest, ties broken by server preference order."""
+    if not header:
+        return None
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get("*", 0.0)
+    best, best_q = None, 0.0
+    for encoding in encodings:
+        q = accepted.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def _tag_etag(etag: str, encoding: str) -> str:
+    # W/"abc" -> W/"abc-gzip"
+    return f'{etag[:-1]}-{encoding}"' if etag.endswith('"') else etag
+
+
+def _untag_etags(header: str, encodings: Sequence[str]) -> Tuple[str, Dict[str, str]]:
+    """Strip encoding suffixes from a list of entity tags; returns the new header and untagged -> sent."""
+    sent: Dict[str, str] = {}
+    tags = []
+    for tag in (t.strip() for t in header.split(",")):
+        untagged = tag
+        for encoding in encodings:
+            suffix = f'-{encoding}"'
+            if tag.endswith(suffix):
+                untagged = tag[: -len(suffix)] + '"'
+                sent[untagged.removeprefix("W/")] = tag.removeprefix("W/")
+                break
+        tags.append(untagged)
+    return ", ".join(tags), sent
+
+
+class CompressedBodyCache:
+    """LRU of compressed response bodies keyed by (encoding, request target, ETag)."""
+
+    def __init__(self, max_entries: int = 256, ttl: float = 300.0) -> None:
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lru = LRUCache(max_entries=max_entries)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(encoding: str, target: str, etag: str) -> str:
+        return f"{encoding}:{target}:{etag}"
+
+    def get(self, encoding: str, target: str, etag: str) -> Optional[bytes]:
+        value = self._lru.get(self._key(encoding, target, etag))
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, encoding: str, target: str, etag: str, body: bytes) -> None:
+        self._lru.set(self._key(encoding, target, etag), body, self.ttl)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = self.misses = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "size": len(self._lru),
+                "max_entries": self._lru.max_entries,
+                "evictions": self._lru.evictions,
+            }
+
+
+class CompressionMiddleware:
+    """ASGI middleware applying the negotiated content coding to eligible responses."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        encodings: Sequence[str] = ("zstd", "br", "gzip"),
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        zstd_level: int = 3,
+        cache: Optional[CompressedBodyCache] = None,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        supported = available_encodings()
+        self.encodings = tuple(encoding for encoding in encodings if encoding in supported)
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.zstd_level = zstd_level
+        self.cache = cache
+
+    @classmethod
+    def options_from_settings(cls, settings: Settings) -> Dict[str, Any]:
+        return {
+            "minimum_size": settings.COMPRESSION_MINIMUM_SIZE,
+            "encodings": [e.strip() for e in settings.COMPRESSION_ENCODINGS.split(",") if e.strip()],
+            "gzip_level": settings.COMPRESSION_GZIP_LEVEL,
+            "brotli_quality": settings.COMPRESSION_BROTLI_QUALITY,
+            "zstd_level": settings.COMPRESSION_ZSTD_LEVEL,
+        }
+
+    def compressor(self, encoding: str):
+        """A fresh streaming compressor with compress(data), flush_block() and flush() methods.
+
+        flush_block() emits everything compressed so far as decodable output
+        without ending the stream; flush() ends it.
+        """
+        if encoding == "gzip":
+            return _GzipStream(self.gzip_level)
+        if encoding == "br":
+            return _BrotliStream(self.brotli_quality)
+        if encoding == "zstd":
+            return _ZstdStream(self.zstd_level)
+        raise ValueError(f"Unsupported encoding: {encoding}")
+
+    def compress(self, encoding: str, data: bytes) -> bytes:
+        stream = self.compressor(encoding)
+        return stream.compress(data) + stream.flush()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        encoding = negotiate(headers.get("accept-encoding"), self.encodings)
+
+        # Let the application compare validators against its own (unsuffixed) ETags
+        sent_tags: Dict[str, str] = {}
+        raw: List[Tuple[bytes, bytes]] = []
+        for name, value in scope["headers"]:
+            if name in (b"if-none-match", b"if-match"):
+                untagged, sent = _untag_etags(value.decode("latin-1"), self.encodings)
+                sent_tags.update(sent)
+                value = untagged.encode("latin-1")
+            raw.append((name, value))
+        # Updated in place: outer middleware reads the route that routing stores in this scope
+        scope["headers"] = raw
+
+        # The same ETag can describe different pages (e.g. limit=1 and limit=2 over the same
+        # two rows), so cached bodies are keyed by the full request target
+        target = None
+        if scope["method"] == "GET":
+            target = scope["path"] + ("?" + scope["query_string"].decode("latin-1") if scope["query_string"] else "")
+        responder = _Responder(self, send, encoding, target, sent_tags)
+        await self.app(scope, receive, responder.send)
+
+
+class _Responder:
+    def __init__(self, middleware: CompressionMiddleware, send: Send, encoding: Optional[str], target: Optional[str], sent_tags: Dict[str, str]) -> None:
+        self.middleware = middleware
+        self._send = send
+        self.encoding = encoding
+        self.target = target
+        self.sent_tags = sent_tags
+        self.start: Optional[Message] = None
+        self.stream = None
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Held back until the first body chunk shows how large the response is
+            self.start = message
+            return
+        if message["type"] == "http.response.body" and self.start is not None:
+            start, self.start = self.start, None
+            await self._begin(start, message)
+            return
+        if message["type"] == "http.response.body" and self.stream is not None:
+            more_body = message.get("more_body", False)
+            body = message.get("body", b"")
+            if more_body:
+                # Flushed per chunk, otherwise slow streams sit in the compressor's buffer
+                chunk = self.stream.compress(body) + self.stream.flush_block() if body else b""
+            else:
+                chunk = self.stream.compress(body) + self.stream.flush()
+            if chunk or not more_body:
+                await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+            return
+        await self._send(message)
+
+    async def _begin(self, start: Message, message: Message) -> None:
+        headers = MutableHeaders(raw=start["headers"])
+        status = start["status"]
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        content_type = headers.get("content-type", "")
+        eligible = content_type.startswith(COMPRESSIBLE_TYPES) and "content-encoding" not in headers
+        if eligible:
+            headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+
+        if status == 304 and etag is not None:
+            # Repeat the tag the client holds, which may carry an encoding suffix
+            sent = self.sent_tags.get(etag.removeprefix("W/"))
+            if sent is not None:
+                headers["etag"] = ("W/" if etag.startswith("W/") else "") + sent
+
+        if (
+            not eligible
+            or self.encoding is None
+            or status in (204, 304)
+            or (not more_body and len(body) < self.middleware.minimum_size)
+        ):
+            await self._send(start)
+            await self._send(message)
+            return
+
+        encoding = self.encoding
+        headers["content-encoding"] = encoding
+        if etag is not None:
+            headers["etag"] = _tag_etag(etag, encoding)
+
+        if more_body:
+            del headers["content-length"]
+            self.stream = self.middleware.compressor(encoding)
+            await self._send(start)
+            chunk = self.stream.compress(body) + self.stream.flush_block() if body else b""
+            await self._send({"type": "http.response.body", "body": chunk, "more_body": True})
+            return
+
+        cacheable = self.middleware.cache is not None and self.target is not None and status == 200 and etag is not None
+        compressed = self.middleware.cache.get(encoding, self.target, etag) if cacheable else None
+        if compressed is None:
+            compressed = self.middleware.compress(encoding, body)
+            if cacheable:
+                self.middleware.cache.set(encoding, self.target, etag, compressed)
+        headers["content-length"] = str(len(compressed))
+        await self._send(start)
+        await self._send({"type": "http.response.body", "body": compressed, "more_body": False})
+
+
+# Process-wide store of compressed bodies used by the app's CompressionMiddleware
+compressed_body_cache = CompressedBodyCache(
+    max_entries=settings.COMPRESSION_CACHE_MAX_ENTRIES, ttl=settings.COMPRESSION_CACHE_TTL
+)
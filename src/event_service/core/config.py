@@ -9,6 +9,21 @@ class Settings(BaseSettings):
     """
 
     DATABASE_URL: str
+    # Serve the events CRUD endpoints from async handlers on an AsyncEngine
+    # (asyncpg for Postgres, aiosqlite for SQLite). ASYNC_DATABASE_URL overrides
+    # the driver URL derived from DATABASE_URL. Not supported with EVENT_CACHE_BACKEND=redis.
+    DATABASE_ASYNC: bool = False
+    ASYNC_DATABASE_URL: str | None = None
+
+    # Connection pool (QueuePool) tuning; size/overflow/timeout are ignored for in-memory SQLite
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    # Seconds after which a connection is replaced on checkout (-1 disables recycling)
+    DB_POOL_RECYCLE: int = 1800
+    # Test connections with a lightweight ping on checkout to drop stale ones
+    DB_POOL_PRE_PING: bool = True
+
     SERVICE_HOST: str | None = None
     SERVICE_PORT: int | None = None
 
@@ -17,6 +32,95 @@ class Settings(BaseSettings):
     SMTP_PORT: int | None = None
     SMTP_USERNAME: str | None = None
     SMTP_PASSWORD: str | None = None
+    # Pooled, authenticated SMTP sessions shared by SMTPService.from_settings (0 disables pooling)
+    SMTP_POOL_SIZE: int = 4
+    # Recycle a session after this many messages or seconds
+    SMTP_POOL_MAX_MESSAGES: int = 100
+    SMTP_POOL_MAX_AGE: float = 300.0
+    # Sessions idle longer than this are checked with NOOP before reuse
+    SMTP_POOL_CHECK_AFTER: float = 5.0
+
+    # Keyset pagination for GET /events; limits above the maximum are clamped
+    EVENTS_PAGE_SIZE_DEFAULT: int = 100
+    EVENTS_PAGE_SIZE_MAX: int = 500
+
+    # Read-through cache for GET /events/{event_id}: "memory" (per-process LRU),
+    # "redis" (shared, needs EVENT_CACHE_REDIS_URL and the cache extra; not with DATABASE_ASYNC) or "none".
+    # Entries are invalidated on writes and expire after EVENT_CACHE_TTL seconds.
+    EVENT_CACHE_BACKEND: str = "memory"
+    EVENT_CACHE_TTL: float = 30.0
+    EVENT_CACHE_MAX_ENTRIES: int = 10000
+    EVENT_CACHE_REDIS_URL: str | None = None
+
+    # Overlap queries on SQLite use a per-process interval tree over (start_time, end_time),
+    # caught up before each query from rows with updated_at newer than the last sync minus
+    # EVENT_INTERVAL_SYNC_LAG seconds, so commits that land late (or from other processes) are seen
+    EVENT_INTERVAL_SYNC_LAG: float = 5.0
+
+    # Response compression: JSON/NDJSON/text bodies of at least COMPRESSION_MINIMUM_SIZE bytes
+    # use the first of COMPRESSION_ENCODINGS the client accepts (br and zstd need the
+    # compression extra). Compressed bodies of ETag-ed GET responses are cached.
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_ENCODINGS: str = "zstd,br,gzip"
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+    COMPRESSION_CACHE_MAX_ENTRIES: int = 256
+    COMPRESSION_CACHE_TTL: float = 300.0
+
+    # Request profiling (off by default): requests carrying PROFILING_HEADER, plus a random
+    # PROFILING_SAMPLE_RATE fraction of all requests, have their stacks sampled every
+    # PROFILING_INTERVAL seconds and their SQL timed. Profiles of requests slower than
+    # PROFILING_SLOW_THRESHOLD seconds (and all header-requested ones) are kept in a ring
+    # buffer of PROFILING_BUFFER_SIZE entries served by GET /debug/profiles.
+    PROFILING_ENABLED: bool = False
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_HEADER: str = "X-Profile"
+    PROFILING_INTERVAL: float = 0.005
+    PROFILING_SLOW_THRESHOLD: float = 0.0
+    PROFILING_BUFFER_SIZE: int = 100
+
+    # SQL statement checks (core.query_monitor): statements slower than SQL_SLOW_QUERY_THRESHOLD
+    # seconds (0 disables) and requests issuing more than their route's budget, or
+    # SQL_MAX_QUERIES_PER_REQUEST (0 disables), are logged; SQL_QUERY_MONITOR_STRICT raises instead
+    SQL_SLOW_QUERY_THRESHOLD: float = 0.5
+    SQL_MAX_QUERIES_PER_REQUEST: int = 50
+    SQL_QUERY_MONITOR_STRICT: bool = False
+
+    # Rows fetched per server-side cursor round trip (and written per chunk) by GET /events/export
+    EVENTS_EXPORT_BATCH_SIZE: int = 1000
+
+    # POST /events/import: rows validated and inserted (COPY on Postgres) per transaction,
+    # and the number of per-line errors reported back
+    EVENTS_IMPORT_CHUNK_SIZE: int = 5000
+    EVENTS_IMPORT_MAX_ERRORS: int = 1000
+
+    # Maximum number of items accepted by one /events:batch request
+    EVENTS_BATCH_MAX_SIZE: int = 5000
+
+    # Notification outbox: rows are written with the event change and drained by
+    # `event-service-worker`. With NOTIFICATION_OUTBOX_INLINE the API process also
+    # attempts delivery right after the response; disable it when workers run.
+    NOTIFICATION_OUTBOX_INLINE: bool = True
+    NOTIFICATION_OUTBOX_BATCH_SIZE: int = 100
+    NOTIFICATION_OUTBOX_MAX_ATTEMPTS: int = 8
+    NOTIFICATION_OUTBOX_BACKOFF_BASE: float = 30.0
+    NOTIFICATION_OUTBOX_BACKOFF_MAX: float = 3600.0
+    # Seconds a claimed entry stays leased to its worker; past it, another worker may retry it
+    NOTIFICATION_OUTBOX_LEASE: float = 300.0
+    NOTIFICATION_WORKER_POLL_INTERVAL: float = 2.0
+
+    # How update emails are addressed: "single" (one message, all participants in To),
+    # "per_recipient" (one message each) or "bcc" (BCC chunks of NOTIFICATION_BCC_CHUNK_SIZE)
+    NOTIFICATION_FANOUT_MODE: str = "single"
+    NOTIFICATION_BCC_CHUNK_SIZE: int = 50
+    # Messages delivered in parallel (bounded further by SMTP_POOL_SIZE) and messages/second (0 = unlimited)
+    NOTIFICATION_SEND_CONCURRENCY: int = 4
+    NOTIFICATION_RATE_LIMIT: float = 0.0
+    # "sync" sends from worker threads with smtplib; "async" drives all messages of a
+    # notification from one asyncio loop (AsyncSMTPService), one session per concurrent task
+    NOTIFICATION_SMTP_BACKEND: str = "sync"
 
     # ignore extra env vars so alembic import does not fail when env contains unrelated keys
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
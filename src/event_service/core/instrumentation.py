@@ -0,0 +1,150 @@
+"""Per-request latency and SQL accounting exported through GET /metrics.
+
+RequestMetricsMiddleware times every HTTP request and labels it with the
+route template (e.g. /events/{event_id}) rather than the raw path, so the
+number of series stays bounded. SQL statements are timed by cursor-execute
+listeners on each engine and, while a request is in flight, also added to
+that request's RequestStats, found through a context variable that follows
+the request into the threadpool and into async-engine greenlets.
+"""
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar
+from typing import Optional, Union
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from event_service.core.metrics import registry
+
+UNMATCHED_ROUTE = "<unmatched>"
+# Statements per request: a jump from the low buckets to 50+ usually means an N+1 loop
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+
+http_requests = registry.counter(
+    "http_requests_total", "HTTP requests by method, route template and status code.", ("method", "route", "status")
+)
+http_request_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "Time from receiving the request to sending the last body chunk.",
+    ("method", "route", "status"),
+)
+http_request_db_queries = registry.histogram(
+    "http_request_db_queries", "SQL statements executed per request.", ("method", "route"), QUERY_COUNT_BUCKETS
+)
+http_request_db_seconds = registry.histogram(
+    "http_request_db_seconds", "Time spent executing SQL statements per request.", ("method", "route")
+)
+db_query_seconds = registry.histogram(
+    "db_query_duration_seconds", "Execution time of one SQL statement (cursor execute).", ("engine",)
+)
+
+
+class RequestStats:
+    """SQL statements issued on behalf of the current request."""
+
+    __slots__ = ("scope", "queries", "db_seconds", "finished", "profile", "max_queries", "over_budget")
+
+    def __init__(self, scope: Scope) -> None:
+        self.scope = scope
+        self.queries = 0
+        self.db_seconds = 0.0
+        # Set once the last body chunk is sent; background tasks may still run statements
+        self.finished = False
+        # Set by ProfilingMiddleware on sampled requests
+        self.profile = None
+        # Statement budget declared by the route (see core.query_monitor); None uses the default
+        self.max_queries: Optional[Union[int, float]] = None
+        self.over_budget = False
+
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def request_stats() -> Optional[RequestStats]:
+    """Stats of the request being served, or None outside a request (worker, scripts)."""
+    return _request_stats.get()
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """Time every statement on `engine` (a sync Engine or AsyncEngine.sync_engine)."""
+    statement_seconds = db_query_seconds.labels(name)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany) -> None:
+        stats = _request_stats.get()
+        if stats is not None and stats.profile is not None:
+            stats.profile.attach_current_thread()
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany) -> None:
+        started = conn.info.get("query_started")
+        if not started:
+            return
+        elapsed = time.perf_counter() - started.pop()
+        statement_seconds.observe(elapsed)
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_seconds += elapsed
+            if stats.profile is not None:
+                stats.profile.record_statement(statement, elapsed)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context) -> None:
+        # A failed statement never reaches after_cursor_execute
+        conn = context.connection
+        if conn is not None and conn.info.get("query_started"):
+            conn.info["query_started"].pop()
+
+
+def route_label(scope: Scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class RequestMetricsMiddleware:
+    """Count and time HTTP requests per route template and status, with their SQL totals."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(scope)
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+        status = 500
+        recorded = False
+
+        def _record() -> None:
+            nonlocal recorded
+            recorded = True
+            stats.finished = True
+            method, route = scope["method"], route_label(scope)
+            http_requests.inc(method, route, status)
+            http_request_seconds.observe(time.perf_counter() - started, method, route, status)
+            http_request_db_queries.observe(stats.queries, method, route)
+            http_request_db_seconds.observe(stats.db_seconds, method, route)
+
+        async def _send(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+            # Recorded at the last body chunk: background tasks run afterwards and are not request latency
+            if message["type"] == "http.response.body" and not message.get("more_body", False) and not recorded:
+                _record()
+
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            _request_stats.reset(token)
+            if not recorded:
+                _record()
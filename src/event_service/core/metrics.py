@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import bisect
+import logging
+import threading
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+# Latency buckets in seconds, from sub-millisecond pool checkouts to slow SMTP sends
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """Thread-safe cumulative histogram with fixed upper bounds (Prometheus semantics)."""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets: List[float] = sorted(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[idx] += 1
+            self._sum += value
+            self._count += 1
+
+    def snapshot(self) -> Dict[str, object]:
+        """Return count, sum and cumulative bucket counts keyed by upper bound."""
+        with self._lock:
+            counts = list(self._counts)
+            total = self._count
+            value_sum = self._sum
+
+        cumulative: Dict[str, int] = {}
+        running = 0
+        for bound, count in zip(self.buckets, counts):
+            running += count
+            cumulative[repr(bound)] = running
+        cumulative["+Inf"] = total
+        return {"count": total, "sum": value_sum, "buckets": cumulative}
+
+
+# Metric families rendered by GET /metrics in the Prometheus text format (version 0.0.4)
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(pairs: Sequence[Tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Family:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames: LabelValues = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labelvalues: Sequence[object]) -> LabelValues:
+        if len(labelvalues) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labelvalues)}")
+        return tuple(str(value) for value in labelvalues)
+
+    def _pairs(self, key: LabelValues) -> List[Tuple[str, str]]:
+        return list(zip(self.labelnames, key))
+
+    def samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.kind}"
+        yield from self.samples()
+
+
+class Counter(_Family):
+    """Monotonic counter per label combination."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labelvalues: object, amount: float = 1) -> None:
+        key = self._key(labelvalues)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, *labelvalues: object) -> float:
+        return self._values.get(self._key(labelvalues), 0)
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        for key, value in values:
+            yield f"{self.name}{_format_labels(self._pairs(key))} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    """Point-in-time value per label combination, usually filled in by a scrape-time collector."""
+
+    kind = "gauge"
+
+    def set(self, value: float, *labelvalues: object) -> None:
+        key = self._key(labelvalues)
+        with self._lock:
+            self._values[key] = value
+
+
+class HistogramFamily(_Family):
+    """One Histogram per label combination."""
+
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._children: Dict[LabelValues, Histogram] = {}
+
+    def labels(self, *labelvalues: object) -> Histogram:
+        key = self._key(labelvalues)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, Histogram(self.buckets))
+        return child
+
+    def observe(self, value: float, *labelvalues: object) -> None:
+        self.labels(*labelvalues).observe(value)
+
+    def bind(self, histogram: Histogram, *labelvalues: object) -> None:
+        """Expose an existing Histogram (e.g. PoolMetrics.wait_seconds) under these labels."""
+        with self._lock:
+            self._children[self._key(labelvalues)] = histogram
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            children = sorted(self._children.items())
+        for key, histogram in children:
+            pairs = self._pairs(key)
+            snapshot = histogram.snapshot()
+            for bound, count in snapshot["buckets"].items():
+                yield f"{self.name}_bucket{_format_labels(pairs + [('le', bound)])} {count}"
+            yield f"{self.name}_sum{_format_labels(pairs)} {_format_value(snapshot['sum'])}"
+            yield f"{self.name}_count{_format_labels(pairs)} {snapshot['count']}"
+
+
+Collector = Callable[[], Iterable[_Family]]
+
+
+class Registry:
+    """Metric families created at import time plus collectors evaluated on every scrape."""
+
+    def __init__(self) -> None:
+        self._families: Dict[str, _Family] = {}
+        self._collectors: List[Collector] = []
+        self._lock = threading.Lock()
+
+    def _register(self, family: _Family) -> _Family:
+        with self._lock:
+            existing = self._families.get(family.name)
+            if existing is not None:
+                if type(existing) is not type(family) or existing.labelnames != family.labelnames:
+                    raise ValueError(f"Metric {family.name} is already registered with a different type or labels")
+                return existing
+            self._families[family.name] = family
+            return family
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))  # type: ignore[return-value]
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))  # type: ignore[return-value]
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS
+    ) -> HistogramFamily:
+        return self._register(HistogramFamily(name, documentation, labelnames, buckets))  # type: ignore[return-value]
+
+    def register_collector(self, collector: Collector) -> Collector:
+        """Call `collector` on every scrape; it returns freshly filled families (e.g. queue depth gauges)."""
+        with self._lock:
+            self._collectors.append(collector)
+        return collector
+
+    def render(self) -> str:
+        with self._lock:
+            families = list(self._families.values())
+            collectors = list(self._collectors)
+        for collector in collectors:
+            try:
+                families.extend(collector())
+            except Exception as e:
+                # A failing collector (e.g. the database is down) must not hide the other metrics
+                logging.error(e, exc_info=True)
+        lines: List[str] = []
+        for family in families:
+            lines.extend(family.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
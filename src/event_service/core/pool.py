@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, Type
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import Pool
+
+from event_service.core.config import Settings
+from event_service.core.metrics import Histogram
+
+
+class PoolMetrics:
+    """Counters and checkout wait-time histogram for one connection pool."""
+
+    def __init__(self) -> None:
+        self.wait_seconds = Histogram()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self._lock = threading.Lock()
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def attach(self, engine: Engine) -> None:
+        """Count pool lifecycle events on `engine` (a sync Engine or AsyncEngine.sync_engine)."""
+        event.listen(engine, "connect", lambda *args: self.incr("connects"))
+        event.listen(engine, "checkout", lambda *args: self.incr("checkouts"))
+        event.listen(engine, "checkin", lambda *args: self.incr("checkins"))
+        event.listen(engine, "invalidate", lambda *args: self.incr("invalidations"))
+
+
+def instrumented_pool_class(base: Type[Pool], metrics: PoolMetrics) -> Type[Pool]:
+    """Subclass `base` so every checkout records how long the caller waited for a connection.
+
+    Pool.recreate() instantiates self.__class__, so the instrumentation survives engine.dispose().
+    """
+
+    class InstrumentedPool(base):  # type: ignore[misc, valid-type]
+        def connect(self):
+            start = time.perf_counter()
+            try:
+                return super().connect()
+            except exc.TimeoutError:
+                metrics.incr("timeouts")
+                raise
+            finally:
+                metrics.wait_seconds.observe(time.perf_counter() - start)
+
+    InstrumentedPool.__name__ = InstrumentedPool.__qualname__ = f"Instrumented{base.__name__}"
+    return InstrumentedPool
+
+
+def is_sqlite_memory(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:")
+
+
+def pool_options(url: str, settings: Settings) -> Dict[str, Any]:
+    """create_engine/create_async_engine keyword arguments for the configured pool."""
+    options: Dict[str, Any] = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    # In-memory SQLite uses a per-thread singleton pool that has no size or overflow
+    if not is_sqlite_memory(url):
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+        )
+    return options
+
+
+def pool_status(engine: Engine, metrics: PoolMetrics) -> Dict[str, Any]:
+    """Live pool occupancy plus the counters collected by `metrics`."""
+    pool = engine.pool
+
+    def _call(name: str):
+        fn = getattr(pool, name, None)
+        return fn() if callable(fn) else None
+
+    return {
+        "pool_class": type(pool).__name__,
+        "size": _call("size"),
+        "checked_out": _call("checkedout"),
+        "checked_in": _call("checkedin"),
+        "overflow": _call("overflow"),
+        "connects": metrics.connects,
+        "checkouts": metrics.checkouts,
+        "checkins": metrics.checkins,
+        "invalidations": metrics.invalidations,
+        "timeouts": metrics.timeouts,
+        "wait_seconds": metrics.wait_seconds.snapshot(),
+    }
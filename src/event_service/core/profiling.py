@@ -0,0 +1,292 @@
+"""Opt-in sampling profiler for individual requests (PROFILING_ENABLED).
+
+A request is profiled when it carries the PROFILING_HEADER header or wins a
+PROFILING_SAMPLE_RATE draw; every other request costs one random() call.
+While profiled requests are in flight, one daemon thread reads the stacks
+of the threads they run on every PROFILING_INTERVAL seconds
+(sys._current_frames, so the request itself is not slowed by tracing).
+A request runs on the event-loop thread and, for sync handlers, on a
+threadpool thread: one that executes the request's SQL, or one whose stack
+holds the routed endpoint (concurrent requests to the same route can be
+attributed too). Statements are recorded with their timings but without
+parameters. Finished profiles of requests slower than
+PROFILING_SLOW_THRESHOLD (or explicitly requested ones) are kept in a ring
+buffer served by GET /debug/profiles.
+"""
+from __future__ import annotations
+
+import inspect
+import itertools
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, Set
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from event_service.core.config import Settings, settings
+from event_service.core.instrumentation import request_stats, route_label
+
+PROFILE_ID_HEADER = "X-Profile-Id"
+# Frames kept per sampled stack, counted from the innermost one
+MAX_STACK_DEPTH = 64
+# Statements kept per profile; later ones are only counted
+MAX_STATEMENTS = 500
+
+# A thread whose innermost frames are waits in these modules, called straight from the
+# event loop or a threadpool worker loop, is waiting for work rather than serving the request
+_WAIT_MODULES = ("selectors.py", "threading.py", "queue.py")
+_IDLE_CALLERS = {("base_events.py", "_run_once"), ("_asyncio.py", "run")}
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}"
+
+
+def _collapsed_stack(frame) -> Optional[str]:
+    """Root-to-leaf "file:function:line;..." (flame graph collapsed format), None when idle."""
+    caller = frame
+    while caller is not None and os.path.basename(caller.f_code.co_filename) in _WAIT_MODULES:
+        caller = caller.f_back
+    if caller is not frame and caller is not None:
+        if (os.path.basename(caller.f_code.co_filename), caller.f_code.co_name) in _IDLE_CALLERS:
+            return None
+    labels: List[str] = []
+    while frame is not None and len(labels) < MAX_STACK_DEPTH:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+class RequestProfile:
+    """Stack samples and SQL statements collected for one request."""
+
+    def __init__(self, profile_id: str, scope: Scope, forced: bool) -> None:
+        self.id = profile_id
+        self.scope = scope
+        self.method = scope["method"]
+        self.path = scope["path"]
+        self.forced = forced
+        self.route: Optional[str] = None
+        self.status: Optional[int] = None
+        self.started_at = datetime.now(timezone.utc)
+        self.duration = 0.0
+        self.samples = 0
+        self.stacks: Counter = Counter()
+        self.statements: List[Dict[str, Any]] = []
+        self.statement_count = 0
+        self.sql_seconds = 0.0
+        self.threads: Set[int] = {threading.get_ident()}
+        self._lock = threading.Lock()
+
+    def attach_current_thread(self) -> None:
+        self.threads.add(threading.get_ident())
+
+    def record_statement(self, statement: str, elapsed: float) -> None:
+        with self._lock:
+            self.statement_count += 1
+            self.sql_seconds += elapsed
+            if len(self.statements) < MAX_STATEMENTS:
+                self.statements.append({"statement": _WHITESPACE.sub(" ", statement).strip(), "seconds": elapsed})
+
+    def _endpoint_code(self):
+        # Routing stores the endpoint in the scope; None until the request has been routed
+        endpoint = self.scope.get("endpoint")
+        return getattr(inspect.unwrap(endpoint), "__code__", None) if endpoint is not None else None
+
+    def _attach_endpoint_threads(self, frames: Dict[int, Any]) -> None:
+        code = self._endpoint_code()
+        if code is None:
+            return
+        for ident, frame in frames.items():
+            if ident in self.threads:
+                continue
+            depth = 0
+            while frame is not None and depth < MAX_STACK_DEPTH:
+                if frame.f_code is code:
+                    self.threads.add(ident)
+                    break
+                frame = frame.f_back
+                depth += 1
+
+    def sample(self, frames: Dict[int, Any]) -> None:
+        self._attach_endpoint_threads(frames)
+        with self._lock:
+            for ident in list(self.threads):
+                frame = frames.get(ident)
+                stack = _collapsed_stack(frame) if frame is not None else None
+                if stack is not None:
+                    self.stacks[stack] += 1
+                    self.samples += 1
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "status": self.status,
+            "started_at": self.started_at.isoformat(),
+            "duration": self.duration,
+            "forced": self.forced,
+            "samples": self.samples,
+            "statement_count": self.statement_count,
+            "sql_seconds": self.sql_seconds,
+        }
+
+    def report(self, top: int) -> Dict[str, Any]:
+        with self._lock:
+            stacks = [{"stack": stack, "samples": count} for stack, count in self.stacks.most_common(top)]
+            statements = sorted(self.statements, key=lambda s: s["seconds"], reverse=True)
+        return {**self.summary(), "stacks": stacks, "statements": statements}
+
+
+class SamplingProfiler:
+    """One daemon thread sampling the threads of every active RequestProfile."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._active: Set[RequestProfile] = set()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, profile: RequestProfile) -> None:
+        with self._cond:
+            self._active.add(profile)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def stop(self, profile: RequestProfile) -> None:
+        with self._cond:
+            self._active.discard(profile)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._active:
+                    self._cond.wait()
+                active = list(self._active)
+            frames = sys._current_frames()
+            for profile in active:
+                profile.sample(frames)
+            del frames
+            time.sleep(self.interval)
+
+
+class ProfileStore:
+    """Ring buffer of the most recent finished profiles."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._profiles: Deque[RequestProfile] = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+
+    def add(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._profiles.append(profile)
+
+    def list(self) -> List[RequestProfile]:
+        """Newest first."""
+        with self._lock:
+            return list(reversed(self._profiles))
+
+    def get(self, profile_id: str) -> Optional[RequestProfile]:
+        with self._lock:
+            return next((p for p in self._profiles if p.id == profile_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._profiles.clear()
+
+
+class ProfilingMiddleware:
+    """Profile sampled or explicitly requested HTTP requests.
+
+    Must run inside RequestMetricsMiddleware, whose per-request stats carry
+    the profile to the SQL listeners.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: ProfileStore,
+        sample_rate: float = 0.0,
+        header: Optional[str] = "X-Profile",
+        interval: float = 0.005,
+        slow_threshold: float = 0.0,
+    ) -> None:
+        self.app = app
+        self.store = store
+        self.sample_rate = sample_rate
+        self.header = header.lower() if header else None
+        self.profiler = SamplingProfiler(interval)
+        self.slow_threshold = slow_threshold
+        self._ids = itertools.count(1)
+
+    @staticmethod
+    def options_from_settings(settings: Settings) -> Dict[str, Any]:
+        return {
+            "sample_rate": settings.PROFILING_SAMPLE_RATE,
+            "header": settings.PROFILING_HEADER,
+            "interval": settings.PROFILING_INTERVAL,
+            "slow_threshold": settings.PROFILING_SLOW_THRESHOLD,
+        }
+
+    def _forced(self, scope: Scope) -> bool:
+        if self.header is None:
+            return False
+        value = Headers(scope=scope).get(self.header)
+        return value is not None and value.lower() not in ("", "0", "false", "no")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        forced = self._forced(scope)
+        stats = request_stats()
+        if stats is None or not (forced or (self.sample_rate > 0 and random.random() < self.sample_rate)):
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(f"{os.getpid()}-{next(self._ids)}", scope, forced)
+        stats.profile = profile
+        started = time.perf_counter()
+        finished = False
+
+        def _finish() -> None:
+            nonlocal finished
+            finished = True
+            self.profiler.stop(profile)
+            profile.duration = time.perf_counter() - started
+            profile.route = route_label(scope)
+            if profile.forced or profile.duration >= self.slow_threshold:
+                self.store.add(profile)
+
+        async def _send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                profile.status = message["status"]
+                MutableHeaders(scope=message).append(PROFILE_ID_HEADER, profile.id)
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False) and not finished:
+                _finish()
+
+        self.profiler.start(profile)
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            stats.profile = None
+            if not finished:
+                _finish()
+            profile.scope = {}
+
+
+profile_store = ProfileStore(settings.PROFILING_BUFFER_SIZE)
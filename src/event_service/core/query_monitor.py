@@ -0,0 +1,133 @@
+"""Slow statement and per-request statement budget checks on the database engines.
+
+Statements that take longer than SQL_SLOW_QUERY_THRESHOLD seconds, and
+requests that issue more statements than their budget, are logged with the
+normalized SQL, redacted parameters (types only), the elapsed time and the
+originating route. A request's budget is SQL_MAX_QUERIES_PER_REQUEST unless
+its route declares one with `dependencies=[Depends(query_budget(n))]`.
+Statements issued by background tasks after the response has been sent are
+not counted against the request.
+
+With SQL_QUERY_MONITOR_STRICT (enabled by the test suite) a violation raises
+QueryPolicyViolation instead, so an extra round trip fails CI.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import re
+import time
+from typing import Any, Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from event_service.core.config import Settings
+from event_service.core.instrumentation import RequestStats, request_stats, route_label
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\?|%\(\w+\)s|%s|:\w+|\$\d+)(?:\s*,\s*(?:\?|%\(\w+\)s|%s|:\w+|\$\d+))+\s*\)")
+
+
+class QueryPolicyViolation(Exception):
+    """Raised in strict mode for a slow statement or a request over its statement budget."""
+
+
+def normalize_sql(statement: str) -> str:
+    """Collapse whitespace, replace literals with ? and expanded IN lists with (...)."""
+    sql = _WHITESPACE.sub(" ", statement).strip()
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    return _PLACEHOLDER_LIST.sub("(...)", sql)
+
+
+def redact_parameters(parameters: Any, executemany: bool = False) -> Any:
+    """Parameter shape with every value replaced by its type name."""
+    if executemany:
+        rows = list(parameters or ())
+        return {"rows": len(rows), "first": redact_parameters(rows[0]) if rows else None}
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def query_budget(max_queries: Optional[int]) -> Callable[[], Any]:
+    """Route dependency setting the statement budget of the request (None: no limit)."""
+
+    async def _query_budget() -> None:
+        stats = request_stats()
+        if stats is not None:
+            stats.max_queries = math.inf if max_queries is None else max_queries
+
+    return _query_budget
+
+
+class QueryMonitor:
+    def __init__(self, slow_threshold: float = 0.5, max_queries: Optional[int] = 50, strict: bool = False) -> None:
+        self.slow_threshold = slow_threshold
+        self.max_queries = max_queries
+        self.strict = strict
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "QueryMonitor":
+        return cls(
+            slow_threshold=settings.SQL_SLOW_QUERY_THRESHOLD,
+            max_queries=settings.SQL_MAX_QUERIES_PER_REQUEST or None,
+            strict=settings.SQL_QUERY_MONITOR_STRICT,
+        )
+
+    def _budget(self, stats: RequestStats) -> Optional[float]:
+        return stats.max_queries if stats.max_queries is not None else self.max_queries
+
+    def _violation(self, message: str, *args: Any) -> None:
+        logging.warning(message, *args)
+        if self.strict:
+            raise QueryPolicyViolation(message % args)
+
+    def attach(self, engine: Engine) -> None:
+        """Check every statement on `engine` (a sync Engine or AsyncEngine.sync_engine)."""
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def _before(conn, cursor, statement, parameters, context, executemany) -> None:
+            conn.info.setdefault("monitor_started", []).append(time.perf_counter())
+            stats = request_stats()
+            if stats is None or stats.finished:
+                return
+            budget = self._budget(stats)
+            # stats.queries counts completed statements, so this one would be number queries + 1
+            if budget is not None and stats.queries >= budget and not stats.over_budget:
+                stats.over_budget = True
+                self._violation(
+                    "Request %s %s exceeded its budget of %d SQL statements with: %s params=%s",
+                    stats.scope["method"],
+                    route_label(stats.scope),
+                    budget,
+                    normalize_sql(statement),
+                    redact_parameters(parameters, executemany),
+                )
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def _after(conn, cursor, statement, parameters, context, executemany) -> None:
+            started = conn.info.get("monitor_started")
+            if not started:
+                return
+            elapsed = time.perf_counter() - started.pop()
+            if self.slow_threshold and elapsed >= self.slow_threshold:
+                stats = request_stats()
+                self._violation(
+                    "Slow SQL statement (%.3fs) on %s: %s params=%s",
+                    elapsed,
+                    f"{stats.scope['method']} {route_label(stats.scope)}" if stats is not None else "no request",
+                    normalize_sql(statement),
+                    redact_parameters(parameters, executemany),
+                )
+
+        @event.listens_for(engine, "handle_error")
+        def _error(context) -> None:
+            conn = context.connection
+            if conn is not None and conn.info.get("monitor_started"):
+                conn.info["monitor_started"].pop()
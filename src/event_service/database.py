@@ -1,11 +1,16 @@
-from typing import Iterator
+from typing import AsyncIterator, Iterator, Optional
 import logging
 import os
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from event_service.core.config import settings
+from event_service.core.instrumentation import instrument_engine
+from event_service.core.query_monitor import QueryMonitor
+from event_service.core.pool import PoolMetrics, instrumented_pool_class, is_sqlite_memory, pool_options
 
 # Create engine with sqlite connect args when needed
 try:
@@ -17,10 +22,63 @@ except Exception as e:
 
 connect_args = {"check_same_thread": False} if database_url.startswith("sqlite") else {}
 
-engine = create_engine(database_url, connect_args=connect_args)
+# Pool counters and checkout wait times, exposed through GET /metrics/db-pool
+pool_metrics = PoolMetrics()
+async_pool_metrics = PoolMetrics()
+# Slow statement and per-request statement budget checks
+query_monitor = QueryMonitor.from_settings(settings)
+
+
+def _engine_kwargs(url: str, queue_pool: type, metrics: PoolMetrics) -> dict:
+    kwargs = pool_options(url, settings)
+    if not is_sqlite_memory(url):
+        kwargs["poolclass"] = instrumented_pool_class(queue_pool, metrics)
+    return kwargs
+
+
+engine = create_engine(database_url, connect_args=connect_args, **_engine_kwargs(database_url, QueuePool, pool_metrics))
+pool_metrics.attach(engine)
+instrument_engine(engine, "sync")
+query_monitor.attach(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# Async engine/session factory, created by init_async_engine when DATABASE_ASYNC is enabled
+async_engine: Optional[AsyncEngine] = None
+AsyncSessionLocal: Optional[async_sessionmaker[AsyncSession]] = None
+
+
+def async_database_url(url: str) -> str:
+    """Map a sync database URL onto the matching asyncio driver URL."""
+    scheme, sep, rest = url.partition("://")
+    if not sep or "+asyncpg" in scheme or "+aiosqlite" in scheme:
+        return url
+    if scheme.startswith("postgresql"):
+        return f"postgresql+asyncpg://{rest}"
+    if scheme.startswith("sqlite"):
+        return f"sqlite+aiosqlite://{rest}"
+    return url
+
+
+def init_async_engine(url: Optional[str] = None) -> AsyncEngine:
+    """Create the module-level AsyncEngine and AsyncSessionLocal.
+
+    Requires the asyncpg (Postgres) or aiosqlite (SQLite) driver to be installed.
+    """
+    global async_engine, AsyncSessionLocal
+    async_url = url or settings.ASYNC_DATABASE_URL or async_database_url(database_url)
+    async_engine = create_async_engine(async_url, **_engine_kwargs(async_url, AsyncAdaptedQueuePool, async_pool_metrics))
+    async_pool_metrics.attach(async_engine.sync_engine)
+    instrument_engine(async_engine.sync_engine, "async")
+    query_monitor.attach(async_engine.sync_engine)
+    # expire_on_commit=False: responses are serialized after the session is closed
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+    return async_engine
+
+
+if settings.DATABASE_ASYNC:
+    init_async_engine()
+
 
 def get_db() -> Iterator[Session]:
     db = SessionLocal()
@@ -31,3 +89,16 @@ def get_db() -> Iterator[Session]:
         raise
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database is not initialized; set DATABASE_ASYNC=true")
+    db = AsyncSessionLocal()
+    try:
+        yield db
+    except Exception as e:
+        logging.error(e, exc_info=True)
+        raise
+    finally:
+        await db.close()
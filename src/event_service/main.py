@@ -2,9 +2,23 @@ from fastapi import FastAPI
 import logging
 from contextlib import asynccontextmanager
 
+from event_service import database
 from event_service.database import engine, Base
 import event_service.models  # ensure models are imported and registered with Base
+from event_service.core.config import settings
+from event_service.core.compression import CompressionMiddleware, compressed_body_cache
+from event_service.core.instrumentation import RequestMetricsMiddleware
+from event_service.core.profiling import ProfilingMiddleware, profile_store
 from event_service.api.event import router as events_router
+from event_service.api.event_async import router as async_events_router
+from event_service.api.event_batch import router as events_batch_router
+from event_service.api.event_export import router as events_export_router
+from event_service.api.event_import import router as events_import_router
+from event_service.api.event_search import router as events_search_router
+from event_service.api.event_overlaps import router as events_overlaps_router
+from event_service.api.participant import router as participants_router
+from event_service.api.metrics import router as metrics_router
+from event_service.api.debug import router as debug_router
 
 
 @asynccontextmanager
@@ -20,11 +34,40 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logging.error(e, exc_info=True)
     yield
+    if database.async_engine is not None:
+        try:
+            await database.async_engine.dispose()
+        except Exception as e:
+            logging.error(e, exc_info=True)
 
 
 app = FastAPI(lifespan=lifespan)
 
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        cache=compressed_body_cache,
+        **CompressionMiddleware.options_from_settings(settings),
+    )
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware, store=profile_store, **ProfilingMiddleware.options_from_settings(settings))
+# Added last so it is outermost and its latency includes compression
+app.add_middleware(RequestMetricsMiddleware)
+
+if settings.DATABASE_ASYNC:
+    # Registered first so the async CRUD handlers take precedence over the sync ones
+    app.include_router(async_events_router)
+# Static /events/... paths go ahead of /events/{event_id}
+app.include_router(events_export_router)
+app.include_router(events_import_router)
+app.include_router(events_search_router)
+app.include_router(events_overlaps_router)
 app.include_router(events_router)
+app.include_router(events_batch_router)
+app.include_router(participants_router)
+app.include_router(metrics_router)
+if settings.PROFILING_ENABLED:
+    app.include_router(debug_router)
 
 
 @app.get("/")
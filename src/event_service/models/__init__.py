@@ -1,4 +1,5 @@
 from event_service.database import Base
-from .event import Event
+from .event import Event, EventParticipant
+from .notification import NotificationOutbox, NotificationDelivery
 
-__all__ = ["Base", "Event"]
+__all__ = ["Base", "Event", "EventParticipant", "NotificationOutbox", "NotificationDelivery"]
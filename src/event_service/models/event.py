@@ -1,11 +1,11 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index, ForeignKey, DDL, MetaData, event, text
 from sqlalchemy.types import TypeDecorator, JSON as SAJSON
 from sqlalchemy.dialects.postgresql import ARRAY as PG_ARRAY
 from sqlalchemy import String as SAString
 from event_service.database import Base
 from typing import Optional, List
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 
 
 class ParticipantsType(TypeDecorator):
@@ -44,6 +44,21 @@ class ParticipantsType(TypeDecorator):
             raise
 
 
+def naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Convert aware datetimes to naive UTC to match the stored DateTime columns."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def naive_utc_times(values: dict) -> dict:
+    """Event column values with start_time/end_time, where present, converted by naive_utc.
+
+    The storage rule for event times: every write path passes its values through this.
+    """
+    return {key: naive_utc(value) if key in ("start_time", "end_time") else value for key, value in values.items()}
+
+
 class Event(Base):
     __tablename__ = "events"
 
@@ -56,9 +71,189 @@ class Event(Base):
     # Dialect-aware participants column: Postgres ARRAY(String) else JSON
     participants = Column(ParticipantsType(), nullable=True)
 
-    # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Timestamps. The Python defaults keep microsecond precision (SQLite's CURRENT_TIMESTAMP
+    # has whole seconds); the server defaults match the migration for rows inserted outside the ORM.
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=text("CURRENT_TIMESTAMP"), nullable=False)
+    updated_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=text("CURRENT_TIMESTAMP"),
+        nullable=False,
+    )
+
+    # Indexes backing the GET /events filters (see alembic revision 6c5918b2d94b)
+    __table_args__ = (
+        Index("ix_events_start_time_end_time", "start_time", "end_time"),
+        Index("ix_events_location_start_time", "location", "start_time"),
+        Index("ix_events_updated_at", "updated_at"),
+        # Covers the (id, updated_at) validator queries of conditional GETs (see alembic revision d89cbf963ba3)
+        Index("ix_events_id_updated_at", "id", "updated_at"),
+        # Answers participants @> ARRAY[...] lookups on Postgres (see alembic revision db7c0d2d75f4)
+        Index("ix_events_participants_gin", "participants", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
 
     def __repr__(self) -> str:
         return f"<Event(id={self.id}, name='{self.name}')>"
+
+
+# Tables that only exist on SQLite (see alembic revision db7c0d2d75f4). They are kept out of
+# Base.metadata so create_all and autogenerate match the migrations on Postgres; Base.metadata
+# creates and drops them on SQLite through the listeners below.
+SQLITE_ONLY_METADATA = MetaData()
+
+
+class EventParticipant(Base):
+    """Normalized (event_id, email) rows mirroring Event.participants.
+
+    Used on SQLite, where participants is stored as JSON and cannot be
+    indexed by member. The rows are maintained by triggers on the events
+    table, so every write path (ORM or Core) keeps the table in sync.
+    Postgres answers the same lookup from a GIN index on the array column
+    and has no such table.
+    """
+
+    __tablename__ = "event_participants"
+    metadata = SQLITE_ONLY_METADATA
+
+    event_id = Column(Integer, ForeignKey(Event.id, ondelete="CASCADE"), primary_key=True)
+    email = Column(String, primary_key=True)
+
+    __table_args__ = (Index("ix_event_participants_email", "email", "event_id"),)
+
+    def __repr__(self) -> str:
+        return f"<EventParticipant(event_id={self.event_id}, email='{self.email}')>"
+
+
+# SQLite statements keeping event_participants in sync with events.participants,
+# run once when create_all creates the side table.
+SQLITE_EVENT_PARTICIPANTS_DDL = (
+    """
+    CREATE TRIGGER IF NOT EXISTS events_participants_ai AFTER INSERT ON events
+    BEGIN
+        INSERT OR IGNORE INTO event_participants (event_id, email)
+        SELECT NEW.id, value FROM json_each(NEW.participants) WHERE type = 'text';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_participants_au AFTER UPDATE OF participants ON events
+    BEGIN
+        DELETE FROM event_participants WHERE event_id = OLD.id;
+        INSERT OR IGNORE INTO event_participants (event_id, email)
+        SELECT NEW.id, value FROM json_each(NEW.participants) WHERE type = 'text';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_participants_ad AFTER DELETE ON events
+    BEGIN
+        DELETE FROM event_participants WHERE event_id = OLD.id;
+    END
+    """,
+    # Backfill rows for events that existed before the side table was created
+    """
+    INSERT OR IGNORE INTO event_participants (event_id, email)
+    SELECT events.id, j.value FROM events, json_each(events.participants) AS j WHERE j.type = 'text'
+    """,
+)
+
+for _statement in SQLITE_EVENT_PARTICIPANTS_DDL:
+    event.listen(EventParticipant.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_sqlite_only_tables(target, connection, **kw) -> None:
+    if connection.dialect.name == "sqlite":
+        SQLITE_ONLY_METADATA.create_all(bind=connection)
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def _drop_sqlite_only_tables(target, connection, **kw) -> None:
+    if connection.dialect.name == "sqlite":
+        SQLITE_ONLY_METADATA.drop_all(bind=connection)
+
+
+# Full-text search over name, description and location (GET /events/search, see alembic
+# revision 003ae4be3308). Postgres keeps a weighted tsvector in a generated column with a
+# GIN index; SQLite mirrors the columns into an external-content FTS5 table kept in sync
+# by triggers, so every write path (ORM, Core, batch, import) updates the index.
+SEARCH_CONFIG = "english"
+
+POSTGRES_SEARCH_DDL = (
+    f"""
+    ALTER TABLE events ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(name, '')), 'A')
+        || setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(location, '')), 'B')
+        || setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_events_search_vector ON events USING gin (search_vector)",
+)
+
+SQLITE_SEARCH_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
+        name, description, location, content='events', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_ai AFTER INSERT ON events
+    BEGIN
+        INSERT INTO events_fts (rowid, name, description, location)
+        VALUES (NEW.id, NEW.name, NEW.description, NEW.location);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_au AFTER UPDATE OF name, description, location ON events
+    BEGIN
+        INSERT INTO events_fts (events_fts, rowid, name, description, location)
+        VALUES ('delete', OLD.id, OLD.name, OLD.description, OLD.location);
+        INSERT INTO events_fts (rowid, name, description, location)
+        VALUES (NEW.id, NEW.name, NEW.description, NEW.location);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_ad AFTER DELETE ON events
+    BEGIN
+        INSERT INTO events_fts (events_fts, rowid, name, description, location)
+        VALUES ('delete', OLD.id, OLD.name, OLD.description, OLD.location);
+    END
+    """,
+)
+# Indexes the events that existed before the FTS table was created
+SQLITE_SEARCH_REBUILD = "INSERT INTO events_fts (events_fts) VALUES ('rebuild')"
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_search_index(target, connection, **kw) -> None:
+    """Add the search index on every create_all, so databases created before it get one too."""
+    if connection.dialect.name == "postgresql":
+        for statement in POSTGRES_SEARCH_DDL:
+            connection.execute(text(statement))
+    elif connection.dialect.name == "sqlite":
+        existed = connection.execute(text("SELECT 1 FROM sqlite_master WHERE name = 'events_fts'")).first()
+        for statement in SQLITE_SEARCH_DDL:
+            connection.execute(text(statement))
+        if existed is None:
+            connection.execute(text(SQLITE_SEARCH_REBUILD))
+
+
+# Time-window overlap lookups (GET /events/overlaps and create_event conflict checks, see
+# alembic revision a73772bc713e). Postgres keeps [start_time, end_time) in a generated tsrange
+# column with a GiST index, the index an EXCLUDE USING gist (... time_range WITH &&) constraint
+# would use. Events without both bounds, or with end_time <= start_time, get no range.
+# SQLite has no range type; it uses the in-memory interval tree of services.intervals.
+POSTGRES_TIME_RANGE_DDL = (
+    """
+    ALTER TABLE events ADD COLUMN IF NOT EXISTS time_range tsrange GENERATED ALWAYS AS (
+        CASE WHEN end_time > start_time THEN tsrange(start_time, end_time, '[)') END
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_events_time_range ON events USING gist (time_range)",
+)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_time_range_index(target, connection, **kw) -> None:
+    if connection.dialect.name == "postgresql":
+        for statement in POSTGRES_TIME_RANGE_DDL:
+            connection.execute(text(statement))
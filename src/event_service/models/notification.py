@@ -0,0 +1,64 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index, ForeignKey
+from event_service.database import Base
+from datetime import datetime
+
+OUTBOX_PENDING = "pending"
+# Claimed by a worker until next_attempt_at, its lease (see services.outbox._claim)
+OUTBOX_IN_PROGRESS = "in_progress"
+OUTBOX_SENT = "sent"
+OUTBOX_SKIPPED = "skipped"
+OUTBOX_FAILED = "failed"
+
+DELIVERY_SENT = "sent"
+DELIVERY_FAILED = "failed"
+
+KIND_EVENT_UPDATED = "event_updated"
+
+
+class NotificationOutbox(Base):
+    """Transactional outbox of notifications awaiting delivery.
+
+    Rows are written in the same transaction as the event change that caused
+    them and drained by the notification worker (event_service.worker), so a
+    committed change is never lost to a process restart. event_id is not a
+    foreign key: deleting an event must not be blocked by queued notifications.
+    """
+
+    __tablename__ = "notification_outbox"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    event_id = Column(Integer, nullable=False)
+    kind = Column(String, nullable=False, default=KIND_EVENT_UPDATED)
+    status = Column(String, nullable=False, default=OUTBOX_PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    sent_at = Column(DateTime, nullable=True)
+
+    # Workers poll for due pending rows in id order
+    __table_args__ = (Index("ix_notification_outbox_status_next_attempt_at", "status", "next_attempt_at"),)
+
+    def __repr__(self) -> str:
+        return f"<NotificationOutbox(id={self.id}, event_id={self.event_id}, status='{self.status}')>"
+
+
+class NotificationDelivery(Base):
+    """Per-recipient outcome of one delivery attempt of an outbox entry.
+
+    Retries of an entry skip recipients that already have a "sent" row.
+    """
+
+    __tablename__ = "notification_deliveries"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    outbox_id = Column(Integer, ForeignKey("notification_outbox.id", ondelete="CASCADE"), nullable=False)
+    recipient = Column(String, nullable=False)
+    status = Column(String, nullable=False)
+    error = Column(Text, nullable=True)
+    attempted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (Index("ix_notification_deliveries_outbox_id_status", "outbox_id", "status"),)
+
+    def __repr__(self) -> str:
+        return f"<NotificationDelivery(outbox_id={self.outbox_id}, recipient='{self.recipient}', status='{self.status}')>"
@@ -1,3 +1,31 @@
-from .event import EventBase, EventCreate, EventUpdate, EventResponse
+from .event import (
+    EventBase,
+    EventCreate,
+    EventUpdate,
+    EventPatch,
+    EventResponse,
+    EventSearchHighlights,
+    EventSearchResult,
+    EventBatchUpdate,
+    EventBatchDelete,
+    EventBatchItemResult,
+    EventBatchResponse,
+    EventImportError,
+    EventImportSummary,
+)
 
-__all__ = ["EventBase", "EventCreate", "EventUpdate", "EventResponse"]
+__all__ = [
+    "EventBase",
+    "EventCreate",
+    "EventUpdate",
+    "EventPatch",
+    "EventResponse",
+    "EventSearchHighlights",
+    "EventSearchResult",
+    "EventBatchUpdate",
+    "EventBatchDelete",
+    "EventBatchItemResult",
+    "EventBatchResponse",
+    "EventImportError",
+    "EventImportSummary",
+]
@@ -51,3 +51,77 @@ class EventResponse(EventBase):
 
     # pydantic v2 ORM support
     model_config = ConfigDict(from_attributes=True)
+
+
+class EventSearchHighlights(BaseModel):
+    """Matched terms wrapped in <mark>...</mark>; description is a snippet around the matches."""
+
+    name: Optional[str] = None
+    description: Optional[str] = None
+    location: Optional[str] = None
+
+
+class EventSearchResult(EventResponse):
+    """One GET /events/search hit: the event, its relevance (higher is better) and highlights."""
+
+    rank: float
+    highlights: EventSearchHighlights
+
+
+class EventPatch(EventUpdate):
+    """Partial update for PATCH, optionally conditional on the updated_at the client last read."""
+
+    expected_updated_at: Optional[datetime] = None
+
+
+class EventBatchUpdate(EventUpdate):
+    """One item of a batch update: the target event id plus the fields to change."""
+
+    id: int
+
+
+class EventBatchDelete(BaseModel):
+    """Request body for batch deletion."""
+
+    ids: List[int]
+
+
+class EventBatchItemResult(BaseModel):
+    """Outcome of one item of a batch request.
+
+    index is the item's position in the request; status is the HTTP status
+    the equivalent single-event call would have returned.
+    """
+
+    index: int
+    id: Optional[int] = None
+    status: int
+    event: Optional[EventResponse] = None
+    detail: Optional[str] = None
+
+
+class EventBatchResponse(BaseModel):
+    """Per-item results of a batch request, in request order."""
+
+    results: List[EventBatchItemResult]
+
+
+class EventImportError(BaseModel):
+    """A rejected line of an import; line is 1-based (the CSV header is line 1)."""
+
+    line: int
+    error: str
+
+
+class EventImportSummary(BaseModel):
+    """Outcome of POST /events/import.
+
+    errors lists at most EVENTS_IMPORT_MAX_ERRORS entries; errors_truncated
+    is set when more lines failed.
+    """
+
+    received: int
+    inserted: int
+    failed: int
+    errors: List[EventImportError]
+    errors_truncated: bool = False
@@ -1,3 +1,11 @@
-from .smtp import SMTPService, EmailSendError
+from .smtp import SMTPService, SMTPConnectionPool, EmailSendError, RECOVERABLE_SMTP_ERRORS
+from .smtp_async import AsyncSMTPService, AsyncSMTPSession
 
-__all__ = ["SMTPService", "EmailSendError"]
+__all__ = [
+    "SMTPService",
+    "SMTPConnectionPool",
+    "EmailSendError",
+    "RECOVERABLE_SMTP_ERRORS",
+    "AsyncSMTPService",
+    "AsyncSMTPSession",
+]
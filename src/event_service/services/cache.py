@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, NamedTuple, Optional, Protocol, Tuple
+
+from event_service.core.config import Settings, settings
+
+
+class CacheBackend(Protocol):
+    """Byte-value store used by EventCache; get returns None on a miss."""
+
+    def get(self, key: str) -> Optional[bytes]: ...
+
+    def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    def delete(self, *keys: str) -> None: ...
+
+
+class NullCache:
+    """Backend that stores nothing (EVENT_CACHE_BACKEND=none)."""
+
+    def get(self, key: str) -> Optional[bytes]:
+        return None
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        pass
+
+    def delete(self, *keys: str) -> None:
+        pass
+
+
+class LRUCache:
+    """Thread-safe in-process LRU with per-entry expiry.
+
+    Holds at most max_entries values, evicting the least recently used one
+    when full; expired entries are dropped when read.
+    """
+
+    def __init__(self, max_entries: int = 10000, clock: Callable[[], float] = time.monotonic) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._clock = clock
+        self._data: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at <= self._clock():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (value, self._clock() + ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+
+class RedisCache:
+    """Backend on a redis-py compatible client (get, set with px, delete).
+
+    Any object with that interface works, which lets tests pass a local fake.
+    """
+
+    def __init__(self, client: Any, prefix: str = "event-service:") -> None:
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "event-service:") -> "RedisCache":
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("EVENT_CACHE_BACKEND=redis requires the 'redis' package (install the cache extra)") from e
+        return cls(redis.Redis.from_url(url), prefix=prefix)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        # Millisecond expiry so sub-second TTLs are honoured
+        self.client.set(self.prefix + key, value, px=max(1, int(ttl * 1000)))
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self.client.delete(*(self.prefix + key for key in keys))
+
+
+class CachedEvent(NamedTuple):
+    updated_at: datetime
+    payload: bytes
+
+
+class EventCache:
+    """Read-through cache of serialized EventResponse bodies keyed by event id.
+
+    Each entry also holds the event's updated_at, so a hit yields its
+    validators without decoding the body. Backend errors and unreadable
+    entries are logged and treated as misses so the cache never fails
+    a request. Writers invalidate after committing; an entry read just before
+    a concurrent write can survive until its TTL expires.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float = 30.0) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return not isinstance(self.backend, NullCache)
+
+    @staticmethod
+    def _key(event_id: int) -> str:
+        return f"event:{event_id}"
+
+    def _incr(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def get(self, event_id: int) -> Optional[CachedEvent]:
+        if not self.enabled:
+            return None
+        entry = None
+        try:
+            value = self.backend.get(self._key(event_id))
+            if value is not None:
+                # "<updated_at>\n<body>"; encoded JSON bodies contain no raw newline
+                stamp, _, payload = value.partition(b"\n")
+                entry = CachedEvent(datetime.fromisoformat(stamp.decode("ascii")), payload)
+        except Exception as e:
+            logging.error(e, exc_info=True)
+            self._incr("errors")
+        self._incr("hits" if entry is not None else "misses")
+        return entry
+
+    def set(self, event_id: int, payload: bytes, updated_at: datetime) -> None:
+        if not self.enabled:
+            return
+        try:
+            value = updated_at.isoformat().encode("ascii") + b"\n" + payload
+            self.backend.set(self._key(event_id), value, self.ttl)
+        except Exception as e:
+            logging.error(e, exc_info=True)
+            self._incr("errors")
+
+    def invalidate(self, *event_ids: int) -> None:
+        if not self.enabled or not event_ids:
+            return
+        try:
+            self.backend.delete(*(self._key(event_id) for event_id in event_ids))
+            self._incr("invalidations", len(event_ids))
+        except Exception as e:
+            logging.error(e, exc_info=True)
+            self._incr("errors")
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.invalidations = self.errors = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            stats: Dict[str, Any] = {
+                "backend": type(self.backend).__name__,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "errors": self.errors,
+            }
+        if isinstance(self.backend, LRUCache):
+            stats["size"] = len(self.backend)
+            stats["max_entries"] = self.backend.max_entries
+            stats["evictions"] = self.backend.evictions
+        return stats
+
+
+def build_event_cache(settings: Settings) -> EventCache:
+    """Create the EventCache selected by EVENT_CACHE_BACKEND (memory, redis or none)."""
+    kind = settings.EVENT_CACHE_BACKEND
+    if kind == "memory":
+        backend: CacheBackend = LRUCache(max_entries=settings.EVENT_CACHE_MAX_ENTRIES)
+    elif kind == "redis":
+        if not settings.EVENT_CACHE_REDIS_URL:
+            raise ValueError("EVENT_CACHE_REDIS_URL is required when EVENT_CACHE_BACKEND=redis")
+        # The async handlers run the shared handler bodies on the event loop thread
+        # (AsyncSession.run_sync), where the blocking redis client would stall every request
+        if settings.DATABASE_ASYNC:
+            raise ValueError("EVENT_CACHE_BACKEND=redis is not supported with DATABASE_ASYNC; use memory or none")
+        backend = RedisCache.from_url(settings.EVENT_CACHE_REDIS_URL)
+    elif kind == "none":
+        backend = NullCache()
+    else:
+        raise ValueError(f"Unknown EVENT_CACHE_BACKEND: {kind}")
+    return EventCache(backend, ttl=settings.EVENT_CACHE_TTL)
+
+
+# Process-wide cache for GET /events/{event_id}
+event_cache = build_event_cache(settings)
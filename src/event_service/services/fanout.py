@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from event_service.services.smtp import RECOVERABLE_SMTP_ERRORS, SMTPService
+from event_service.services.smtp_async import AsyncSMTPService, AsyncSMTPSession
+
+FANOUT_SINGLE = "single"
+FANOUT_PER_RECIPIENT = "per_recipient"
+FANOUT_BCC = "bcc"
+FANOUT_MODES = (FANOUT_SINGLE, FANOUT_PER_RECIPIENT, FANOUT_BCC)
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing `rate` acquisitions per second (rate <= 0 disables it)."""
+
+    def __init__(
+        self,
+        rate: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _take(self) -> float:
+        """Take a token and return 0, or return the seconds until one is available."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while (wait := self._take()) > 0:
+            self._sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Like acquire, but waits with asyncio.sleep instead of blocking the thread."""
+        if self.rate <= 0:
+            return
+        while (wait := self._take()) > 0:
+            await asyncio.sleep(wait)
+
+
+_shared_limiters: Dict[float, RateLimiter] = {}
+_shared_limiters_lock = threading.Lock()
+
+
+def shared_rate_limiter(rate: float) -> Optional[RateLimiter]:
+    """Process-wide limiter for `rate` messages/second, so concurrent fan-outs share one budget."""
+    if rate <= 0:
+        return None
+    with _shared_limiters_lock:
+        limiter = _shared_limiters.get(rate)
+        if limiter is None:
+            limiter = _shared_limiters[rate] = RateLimiter(rate)
+        return limiter
+
+
+@dataclass
+class DeliveryReport:
+    """Per-recipient outcome of a notification send."""
+
+    sent: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+
+    def merge(self, other: "DeliveryReport") -> None:
+        self.sent.extend(other.sent)
+        self.failed.update(other.failed)
+
+
+def _chunks(recipients: List[str], mode: str, chunk_size: int) -> List[List[str]]:
+    if mode == FANOUT_SINGLE:
+        return [recipients]
+    size = 1 if mode == FANOUT_PER_RECIPIENT else max(1, chunk_size)
+    return [recipients[i : i + size] for i in range(0, len(recipients), size)]
+
+
+def _chunk_report(chunk: List[str], refused) -> DeliveryReport:
+    report = DeliveryReport()
+    if not isinstance(refused, dict):
+        refused = {}
+    for r in chunk:
+        if r in refused:
+            code, reason = refused[r]
+            report.failed[r] = f"{code} {reason.decode(errors='replace') if isinstance(reason, bytes) else reason}"
+        else:
+            report.sent.append(r)
+    return report
+
+
+def fan_out(
+    smtp_service: SMTPService,
+    recipients: List[str],
+    subject: str,
+    body: str,
+    mode: str = FANOUT_PER_RECIPIENT,
+    chunk_size: int = 50,
+    concurrency: int = 4,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> DeliveryReport:
+    """Deliver one message per recipient (or per BCC chunk) over a bounded thread pool.
+
+    Chunks are sent concurrently, by at most `concurrency` threads sharing the
+    service's SMTP pool. A failed chunk marks only its own recipients as failed,
+    and recipients refused by the server are reported one by one.
+    """
+    if mode not in FANOUT_MODES:
+        raise ValueError(f"Unknown fan-out mode: {mode}")
+
+    # de-duplicate while keeping order
+    recipients = list(dict.fromkeys(recipients))
+    chunks = _chunks(recipients, mode, chunk_size)
+
+    def _deliver(chunk: List[str]) -> DeliveryReport:
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        try:
+            if mode == FANOUT_BCC:
+                refused = smtp_service.send_bcc(chunk, subject, body)
+            else:
+                refused = smtp_service.send_email(to_emails=chunk, subject=subject, body=body)
+        except Exception as e:
+            logging.error(e, exc_info=True)
+            return DeliveryReport(failed={r: str(e) for r in chunk})
+        return _chunk_report(chunk, refused)
+
+    result = DeliveryReport()
+    if len(chunks) <= 1 or concurrency <= 1:
+        for chunk in chunks:
+            result.merge(_deliver(chunk))
+        return result
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(chunks)), thread_name_prefix="smtp-fanout") as executor:
+        for report in executor.map(_deliver, chunks):
+            result.merge(report)
+    return result
+
+
+async def fan_out_async(
+    smtp_service: AsyncSMTPService,
+    recipients: List[str],
+    subject: str,
+    body: str,
+    mode: str = FANOUT_PER_RECIPIENT,
+    chunk_size: int = 50,
+    concurrency: int = 4,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> DeliveryReport:
+    """asyncio variant of fan_out: `concurrency` tasks each reuse one SMTP session.
+
+    A task whose session breaks reconnects for its next chunk; outcomes are
+    reported exactly as in fan_out.
+    """
+    if mode not in FANOUT_MODES:
+        raise ValueError(f"Unknown fan-out mode: {mode}")
+
+    recipients = list(dict.fromkeys(recipients))
+    pending = deque(_chunks(recipients, mode, chunk_size))
+    result = DeliveryReport()
+
+    async def _worker() -> None:
+        session: Optional[AsyncSMTPSession] = None
+        try:
+            while pending:
+                chunk = pending.popleft()
+                if rate_limiter is not None:
+                    await rate_limiter.acquire_async()
+                try:
+                    if session is None or session.closed:
+                        session = await smtp_service.connect()
+                    if mode == FANOUT_BCC:
+                        refused = await smtp_service.send_bcc(chunk, subject, body, session=session)
+                    else:
+                        refused = await smtp_service.send_email(chunk, subject, body, session=session)
+                except Exception as e:
+                    logging.error(e, exc_info=True)
+                    result.failed.update({r: str(e) for r in chunk})
+                    # Refusals leave the session usable; anything else gets a fresh one
+                    cause = e.__cause__ or e
+                    if session is not None and not isinstance(cause, RECOVERABLE_SMTP_ERRORS):
+                        session.close()
+                        session = None
+                    continue
+                result.merge(_chunk_report(chunk, refused))
+        finally:
+            if session is not None:
+                await session.quit()
+
+    await asyncio.gather(*(_worker() for _ in range(max(1, min(concurrency, len(pending))))))
+    return result
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import random
+import threading
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from event_service.core.config import Settings, settings
+from event_service.models.event import Event
+
+
+class _Node:
+    __slots__ = ("start", "key", "end", "max_end", "priority", "left", "right")
+
+    def __init__(self, start: Any, key: int, end: Any) -> None:
+        self.start = start
+        self.key = key
+        self.end = end
+        self.max_end = end
+        self.priority = random.random()
+        self.left: Optional[_Node] = None
+        self.right: Optional[_Node] = None
+
+
+def _update(node: _Node) -> _Node:
+    max_end = node.end
+    if node.left is not None and node.left.max_end > max_end:
+        max_end = node.left.max_end
+    if node.right is not None and node.right.max_end > max_end:
+        max_end = node.right.max_end
+    node.max_end = max_end
+    return node
+
+
+def _split(node: Optional[_Node], start: Any, key: int) -> Tuple[Optional[_Node], Optional[_Node]]:
+    """Split into the nodes ordered before (start, key) and the rest."""
+    if node is None:
+        return None, None
+    if (node.start, node.key) < (start, key):
+        node.right, right = _split(node.right, start, key)
+        return _update(node), right
+    left, node.left = _split(node.left, start, key)
+    return left, _update(node)
+
+
+def _merge(left: Optional[_Node], right: Optional[_Node]) -> Optional[_Node]:
+    """Join two treaps where every node of `left` orders before every node of `right`."""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        return _update(left)
+    right.left = _merge(left, right.left)
+    return _update(right)
+
+
+class IntervalTree:
+    """Half-open [start, end) intervals keyed by an integer id.
+
+    A treap ordered by (start, id) whose nodes also hold the largest end in
+    their subtree, so add and discard take O(log n) and overlapping() takes
+    O(log n + k) for k results (expected). Empty intervals (end <= start)
+    overlap nothing and are not stored. Not thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._root: Optional[_Node] = None
+        self._intervals: Dict[int, Tuple[Any, Any]] = {}
+
+    @classmethod
+    def from_intervals(cls, intervals: Iterable[Tuple[int, Any, Any]]) -> "IntervalTree":
+        """Build a tree from (id, start, end) items in O(n log n), much faster than n add() calls."""
+        tree = cls()
+        for key, start, end in intervals:
+            if end > start:
+                tree._intervals[key] = (start, end)
+        ordered = sorted((start, key, end) for key, (start, end) in tree._intervals.items())
+
+        def _build(lo: int, hi: int) -> Optional[_Node]:
+            if lo >= hi:
+                return None
+            mid = (lo + hi) // 2
+            node = _Node(*ordered[mid])
+            node.left = _build(lo, mid)
+            node.right = _build(mid + 1, hi)
+            return _update(node)
+
+        tree._root = _build(0, len(ordered))
+        # A balanced shape with random priorities handed out highest first level by level
+        # is a valid treap, and later adds keep it balanced as usual
+        priorities = sorted((random.random() for _ in ordered), reverse=True)
+        level = deque([tree._root] if tree._root is not None else [])
+        for priority in priorities:
+            node = level.popleft()
+            node.priority = priority
+            level.extend(child for child in (node.left, node.right) if child is not None)
+        return tree
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._intervals
+
+    def add(self, key: int, start: Any, end: Any) -> None:
+        """Store [start, end) under key, replacing its previous interval."""
+        if self._intervals.get(key) == (start, end):
+            return
+        self.discard(key)
+        if not end > start:
+            return
+        left, right = _split(self._root, start, key)
+        self._root = _merge(_merge(left, _Node(start, key, end)), right)
+        self._intervals[key] = (start, end)
+
+    def discard(self, key: int) -> None:
+        interval = self._intervals.pop(key, None)
+        if interval is None:
+            return
+        start = interval[0]
+        left, rest = _split(self._root, start, key)
+        _, right = _split(rest, start, key + 1)
+        self._root = _merge(left, right)
+
+    def overlapping(self, start: Any, end: Any) -> List[int]:
+        """Ids of the intervals overlapping [start, end), in (start, id) order."""
+        found: List[int] = []
+        stack: List[_Node] = []
+        node = self._root
+        # In-order walk skipping subtrees that end too early or start too late
+        while stack or node is not None:
+            while node is not None and node.max_end > start:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                break
+            node = stack.pop()
+            if not node.start < end:
+                # This node and everything after it in order starts at or after `end`
+                break
+            if node.end > start:
+                found.append(node.key)
+            node = node.right
+        return found
+
+
+class EventIntervalIndex:
+    """Per-process IntervalTree over the events' [start_time, end_time).
+
+    Serves overlap queries on SQLite, which has no range type or index for
+    them. The tree is filled from the events table on first use and then
+    caught up before every query from the rows whose updated_at is newer
+    than the last sync (minus sync_lag seconds, for commits that land late
+    or come from other processes), which is an index range scan on
+    ix_events_updated_at. Deletes leave no trace in updated_at, so the
+    delete endpoints discard ids here; rows deleted elsewhere stay in the
+    tree as candidates that the caller's SQL no longer finds.
+    """
+
+    def __init__(self, sync_lag: float = 5.0) -> None:
+        self.sync_lag = timedelta(seconds=sync_lag)
+        self.tree = IntervalTree()
+        self._synced_until: Optional[datetime] = None
+        # updated_at of the row version applied per id, so a sync that read
+        # earlier but applies later cannot bring back an older interval
+        self._versions: Dict[int, datetime] = {}
+        self._lock = threading.Lock()
+
+    def sync(self, db: Session) -> int:
+        """Apply rows changed since the last sync; returns the number of rows read.
+
+        The SELECT runs without the lock: under DATABASE_ASYNC this is called
+        through AsyncSession.run_sync, where every statement yields to the
+        event loop, and a lock held across that would block the next request
+        on the loop thread. The lock only covers updating the tree.
+        """
+        with self._lock:
+            synced_until = self._synced_until
+        stmt = select(Event.id, Event.start_time, Event.end_time, Event.updated_at)
+        if synced_until is not None:
+            stmt = stmt.where(Event.updated_at >= synced_until - self.sync_lag)
+        rows = db.execute(stmt).all()
+
+        with self._lock:
+            if synced_until is not None and self._synced_until is None:
+                # reset() ran meanwhile; these rows are only a delta, so leave the full load to the next sync
+                return len(rows)
+            if synced_until is None and not self._versions:
+                # First load: one bulk build instead of an add() per row
+                self.tree = IntervalTree.from_intervals(
+                    (row.id, row.start_time, row.end_time)
+                    for row in rows
+                    if row.start_time is not None and row.end_time is not None
+                )
+                self._versions = {row.id: row.updated_at for row in rows}
+            else:
+                for row in rows:
+                    applied = self._versions.get(row.id)
+                    if applied is not None and row.updated_at < applied:
+                        continue
+                    self._versions[row.id] = row.updated_at
+                    if row.start_time is not None and row.end_time is not None:
+                        self.tree.add(row.id, row.start_time, row.end_time)
+                    else:
+                        self.tree.discard(row.id)
+            # Stays None on an empty table, so the next sync loads everything again (cheaply)
+            latest = max((row.updated_at for row in rows), default=None)
+            if latest is not None and (self._synced_until is None or latest > self._synced_until):
+                self._synced_until = latest
+        return len(rows)
+
+    def overlapping(self, start: datetime, end: datetime) -> List[int]:
+        with self._lock:
+            return self.tree.overlapping(start, end)
+
+    def discard(self, *event_ids: int) -> None:
+        with self._lock:
+            for event_id in event_ids:
+                self.tree.discard(event_id)
+                self._versions.pop(event_id, None)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.tree = IntervalTree()
+            self._synced_until = None
+            self._versions = {}
+
+
+def build_event_intervals(settings: Settings) -> EventIntervalIndex:
+    return EventIntervalIndex(sync_lag=settings.EVENT_INTERVAL_SYNC_LAG)
+
+
+# Process-wide index for overlap queries on SQLite
+event_intervals = build_event_intervals(settings)
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import logging
+from dataclasses import dataclass
+from typing import Collection, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from event_service.core.config import Settings
+from event_service.models.event import Event
+from event_service.services.smtp import SMTPService
+from event_service.services.smtp_async import AsyncSMTPService
+from event_service.services.fanout import DeliveryReport, fan_out, fan_out_async, shared_rate_limiter
+
+
+# Fields whose change triggers an update email to participants
+NOTIFY_FIELDS = ("start_time", "end_time", "location", "participants")
+
+
+def _participants_changed(orig: List[str] | None, new: List[str] | None) -> bool:
+    # Normalize None vs empty list semantics: None != []
+    try:
+        if orig is None and new is None:
+            return False
+        if orig is None and new is not None:
+            return True
+        if orig is not None and new is None:
+            return True
+        # both lists: compare sorted values
+        return sorted(orig) != sorted(new)
+    except Exception as e:
+        logging.error(e, exc_info=True)
+        # If comparison fails, assume changed to be safe
+        return True
+
+
+def _field_changed(orig, new) -> bool:
+    try:
+        return orig != new
+    except Exception as e:
+        logging.error(e, exc_info=True)
+        return True
+
+
+def snapshot_notify_fields(ev) -> dict:
+    """Copy the NOTIFY_FIELDS of an event (or any object with those attributes)."""
+    # Make deep copies of list fields to avoid mutation issues
+    return {name: copy.deepcopy(getattr(ev, name)) for name in NOTIFY_FIELDS}
+
+
+def notify_fields_changed(orig: dict, ev) -> bool:
+    """Compare a snapshot from snapshot_notify_fields with the event's current values."""
+    changed = False
+    if _field_changed(orig["start_time"], ev.start_time):
+        changed = True
+    if _field_changed(orig["end_time"], ev.end_time):
+        changed = True
+    if _field_changed(orig["location"], ev.location):
+        changed = True
+    if _participants_changed(orig["participants"], ev.participants):
+        changed = True
+    return changed
+
+
+def build_event_update_email(ev: Event, participants: List[str]) -> Tuple[str, str]:
+    """Return the (subject, body) of the update email for `ev`."""
+    subject = f"Event Update: {ev.name}"
+    # Build a concise body summarizing key fields
+    body_lines = [f"Event '{ev.name}' has been updated.", "", "Updated details:"]
+    body_lines.append(f"Description: {ev.description}")
+    body_lines.append(f"Start time: {ev.start_time}")
+    body_lines.append(f"End time: {ev.end_time}")
+    body_lines.append(f"Location: {ev.location}")
+    body_lines.append(f"Participants: {', '.join(participants)}")
+    return subject, "\n".join(body_lines)
+
+
+@dataclass
+class EventUpdateMessage:
+    """An update email built from the event's state, ready to send without the database."""
+
+    event_id: int
+    recipients: List[str]
+    subject: str
+    body: str
+
+
+def load_event_update(db: Session, event_id: int, skip: Collection[str] = ()) -> Optional[EventUpdateMessage]:
+    """Build the update email for the latest state of an event.
+
+    Recipients in `skip` (already notified by an earlier attempt) are left
+    out. Returns None when there is nothing to send (event deleted or
+    without participants).
+    """
+    stmt = select(Event).where(Event.id == event_id)
+    ev = db.execute(stmt).scalar_one_or_none()
+    if ev is None:
+        logging.info("Event not found for notification: %s", event_id)
+        return None
+
+    participants = ev.participants or []
+    if not participants:
+        logging.info("No participants to notify for event %s", event_id)
+        return None
+
+    subject, body = build_event_update_email(ev, participants)
+    recipients = [p for p in participants if p not in skip]
+    return EventUpdateMessage(event_id=event_id, recipients=recipients, subject=subject, body=body)
+
+
+def send_event_update(
+    db: Session, event_id: int, settings: Settings, skip: Collection[str] = ()
+) -> Optional[DeliveryReport]:
+    """Fetch the latest state of an event and email it to its participants.
+
+    Returns None when there is nothing to send, otherwise the per-recipient
+    DeliveryReport (see load_event_update and deliver_event_update).
+    """
+    message = load_event_update(db, event_id, skip)
+    if message is None:
+        return None
+    return deliver_event_update(message, settings)
+
+
+def deliver_event_update(message: EventUpdateMessage, settings: Settings) -> DeliveryReport:
+    """Send a loaded update email; no database access.
+
+    Messages are addressed according to NOTIFICATION_FANOUT_MODE and sent by
+    the NOTIFICATION_SMTP_BACKEND client. Raises ValueError for incomplete
+    SMTP settings.
+    """
+    use_async = settings.NOTIFICATION_SMTP_BACKEND == "async"
+    smtp_service = AsyncSMTPService.from_settings(settings) if use_async else SMTPService.from_settings(settings)
+    recipients, subject, body = message.recipients, message.subject, message.body
+    if not recipients:
+        return DeliveryReport()
+
+    options = dict(
+        mode=settings.NOTIFICATION_FANOUT_MODE,
+        chunk_size=settings.NOTIFICATION_BCC_CHUNK_SIZE,
+        concurrency=settings.NOTIFICATION_SEND_CONCURRENCY,
+        rate_limiter=shared_rate_limiter(settings.NOTIFICATION_RATE_LIMIT),
+    )
+    if use_async:
+        # Callers are sync (worker loop, background task thread), so run a private event loop
+        report = asyncio.run(fan_out_async(smtp_service, recipients, subject, body, **options))
+    else:
+        report = fan_out(smtp_service, recipients, subject, body, **options)
+    logging.info(
+        "Sent event update email for event %s to %s recipients (%s failed)",
+        message.event_id,
+        len(report.sent),
+        len(report.failed),
+    )
+    return report
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, List, Optional
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+
+from event_service.core.config import Settings
+from event_service.models.notification import (
+    DELIVERY_FAILED,
+    DELIVERY_SENT,
+    KIND_EVENT_UPDATED,
+    OUTBOX_FAILED,
+    OUTBOX_IN_PROGRESS,
+    OUTBOX_PENDING,
+    OUTBOX_SENT,
+    OUTBOX_SKIPPED,
+    NotificationDelivery,
+    NotificationOutbox,
+)
+from event_service.services.fanout import DeliveryReport
+from event_service.services.notifications import deliver_event_update, load_event_update
+
+
+def enqueue_event_update(db: Session, event_id: int) -> NotificationOutbox:
+    """Queue an update notification in the caller's transaction.
+
+    The row becomes visible to workers only when the caller commits, together
+    with the event change it describes. The entry is flushed so its id is known.
+    """
+    entry = NotificationOutbox(event_id=event_id, kind=KIND_EVENT_UPDATED, status=OUTBOX_PENDING)
+    db.add(entry)
+    db.flush()
+    return entry
+
+
+def enqueue_event_updates(db: Session, event_ids: Iterable[int]) -> List[int]:
+    """Queue update notifications for several events with one INSERT; returns the entry ids in order."""
+    rows = [{"event_id": event_id, "kind": KIND_EVENT_UPDATED, "status": OUTBOX_PENDING} for event_id in event_ids]
+    if not rows:
+        return []
+    stmt = insert(NotificationOutbox).returning(NotificationOutbox.id, sort_by_parameter_order=True)
+    return list(db.scalars(stmt, rows).all())
+
+
+def backoff_delay(attempts: int, settings: Settings) -> timedelta:
+    """Exponential backoff after `attempts` failed deliveries, capped at the configured maximum."""
+    base = settings.NOTIFICATION_OUTBOX_BACKOFF_BASE
+    seconds = min(base * (2 ** max(attempts - 1, 0)), settings.NOTIFICATION_OUTBOX_BACKOFF_MAX)
+    return timedelta(seconds=seconds)
+
+
+@dataclass
+class _Claim:
+    id: int
+    event_id: int
+    # attempts after the claim; recording an outcome requires it unchanged, so a worker
+    # whose lease expired and was re-claimed by another cannot overwrite the newer claim
+    attempts: int
+
+
+def _claim(db: Session, settings: Settings, now: datetime, limit: int, outbox_id: Optional[int] = None) -> List[_Claim]:
+    """Lease due entries to this process and commit the claim.
+
+    One conditional UPDATE ... RETURNING moves due pending entries (and
+    in_progress ones whose lease has expired) to in_progress, counts the
+    attempt and pushes next_attempt_at out by NOTIFICATION_OUTBOX_LEASE.
+    On Postgres the candidate rows are locked with FOR UPDATE SKIP LOCKED,
+    so concurrent claimers take disjoint rows without waiting; on SQLite
+    the UPDATE runs under the database write lock and its WHERE clause no
+    longer matches rows another claimer has leased.
+    """
+    due = (
+        NotificationOutbox.status.in_((OUTBOX_PENDING, OUTBOX_IN_PROGRESS)),
+        NotificationOutbox.next_attempt_at <= now,
+    )
+    candidates = select(NotificationOutbox.id).where(*due)
+    if outbox_id is not None:
+        candidates = candidates.where(NotificationOutbox.id == outbox_id)
+    candidates = candidates.order_by(NotificationOutbox.id).limit(limit).with_for_update(skip_locked=True)
+    stmt = (
+        update(NotificationOutbox)
+        .where(NotificationOutbox.id.in_(candidates), *due)
+        .values(
+            status=OUTBOX_IN_PROGRESS,
+            attempts=NotificationOutbox.attempts + 1,
+            next_attempt_at=now + timedelta(seconds=settings.NOTIFICATION_OUTBOX_LEASE),
+        )
+        .returning(NotificationOutbox.id, NotificationOutbox.event_id, NotificationOutbox.attempts)
+        .execution_options(synchronize_session=False)
+    )
+    claims = sorted((_Claim(*row) for row in db.execute(stmt)), key=lambda claim: claim.id)
+    db.commit()
+    return claims
+
+
+def _delivery_rows(claim: _Claim, report: DeliveryReport, now: datetime) -> List[dict]:
+    rows = [
+        {"outbox_id": claim.id, "recipient": r, "status": DELIVERY_SENT, "error": None, "attempted_at": now}
+        for r in report.sent
+    ]
+    rows.extend(
+        {"outbox_id": claim.id, "recipient": r, "status": DELIVERY_FAILED, "error": err[:1000], "attempted_at": now}
+        for r, err in report.failed.items()
+    )
+    return rows
+
+
+def _failure_values(claim: _Claim, error: str, settings: Settings, now: datetime) -> dict:
+    if claim.attempts >= settings.NOTIFICATION_OUTBOX_MAX_ATTEMPTS:
+        logging.error("Giving up on outbox entry %s after %s attempts", claim.id, claim.attempts)
+        return {"status": OUTBOX_FAILED, "last_error": error[:1000]}
+    return {
+        "status": OUTBOX_PENDING,
+        "last_error": error[:1000],
+        "next_attempt_at": now + backoff_delay(claim.attempts, settings),
+    }
+
+
+def _record(db: Session, claim: _Claim, values: dict, deliveries: List[dict]) -> None:
+    """Store the outcome of one claimed attempt in a short transaction of its own."""
+    if deliveries:
+        db.execute(insert(NotificationDelivery), deliveries)
+    stmt = (
+        update(NotificationOutbox)
+        .where(
+            NotificationOutbox.id == claim.id,
+            NotificationOutbox.status == OUTBOX_IN_PROGRESS,
+            NotificationOutbox.attempts == claim.attempts,
+        )
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    if db.execute(stmt).rowcount == 0:
+        logging.warning("Lease on outbox entry %s expired before its outcome was recorded", claim.id)
+    # Per-recipient results are kept either way, so a later attempt skips delivered recipients
+    db.commit()
+
+
+def _process_claim(db: Session, claim: _Claim, settings: Settings) -> None:
+    """Send one claimed entry and record the outcome.
+
+    The event is read in a short transaction that ends before any SMTP
+    traffic; nothing is locked while messages are sent.
+    """
+    try:
+        # Only retries can have earlier deliveries to skip
+        delivered = _delivered_recipients(db, claim.id) if claim.attempts > 1 else set()
+        message = load_event_update(db, claim.event_id, skip=delivered)
+    finally:
+        db.rollback()
+
+    now = datetime.utcnow()
+    if message is None:
+        _record(db, claim, {"status": OUTBOX_SKIPPED, "sent_at": now, "last_error": None}, [])
+        return
+    try:
+        report = deliver_event_update(message, settings)
+    except Exception as e:
+        logging.error(e, exc_info=True)
+        _record(db, claim, _failure_values(claim, str(e), settings, now), [])
+        return
+
+    now = datetime.utcnow()
+    if report.failed:
+        summary = "; ".join(f"{r}: {err}" for r, err in report.failed.items())
+        values = _failure_values(claim, f"{len(report.failed)} recipient(s) failed: {summary}", settings, now)
+    else:
+        values = {"status": OUTBOX_SENT, "sent_at": now, "last_error": None}
+    _record(db, claim, values, _delivery_rows(claim, report, now))
+
+
+def _delivered_recipients(db: Session, outbox_id: int) -> set:
+    stmt = select(NotificationDelivery.recipient).where(
+        NotificationDelivery.outbox_id == outbox_id, NotificationDelivery.status == DELIVERY_SENT
+    )
+    return set(db.execute(stmt).scalars().all())
+
+
+def drain_once(session_factory: Callable[[], Session], settings: Settings, batch_size: Optional[int] = None) -> int:
+    """Claim one batch of due entries, then send and record them one by one.
+
+    Returns the number of entries claimed. The claim is committed before any
+    message is sent and each outcome is committed on its own, so no lock is
+    held during SMTP traffic. Delivery is at-least-once: entries of a process
+    that dies mid-batch are retried once their lease expires.
+    """
+    batch_size = batch_size or settings.NOTIFICATION_OUTBOX_BATCH_SIZE
+    db = session_factory()
+    try:
+        claims = _claim(db, settings, datetime.utcnow(), batch_size)
+        for claim in claims:
+            _process_claim(db, claim, settings)
+        return len(claims)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def deliver_entry(session_factory: Callable[[], Session], outbox_id: int, settings: Settings) -> None:
+    """Deliver one entry right away, unless a worker has already claimed or finished it.
+
+    Used for in-process delivery after the request commits; anything this
+    misses (crash, restart, failure) is picked up by the worker later.
+    """
+    db = session_factory()
+    try:
+        for claim in _claim(db, settings, datetime.utcnow(), 1, outbox_id=outbox_id):
+            _process_claim(db, claim, settings)
+    except Exception as e:
+        logging.error(e, exc_info=True)
+        try:
+            db.rollback()
+        except Exception:
+            logging.error("Failed to rollback outbox session", exc_info=True)
+    finally:
+        db.close()
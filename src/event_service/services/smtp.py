@@ -2,22 +2,232 @@ from __future__ import annotations
 
 import logging
 import smtplib
-from typing import Callable, Optional
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Iterator, Optional, Tuple
 from email.message import EmailMessage
 
 from event_service.core.config import Settings
+from event_service.core.metrics import registry
 
 
 class EmailSendError(Exception):
     """Raised when sending an email fails."""
 
 
+# Per-message delivery time (including connect/login when not pooled) and failures, by backend
+smtp_send_seconds = registry.histogram(
+    "smtp_send_duration_seconds", "Time to deliver one message to the SMTP server.", ("backend",)
+)
+smtp_send_failures = registry.counter(
+    "smtp_send_failures_total", "Messages the SMTP server did not accept.", ("backend",)
+)
+
+
+# To header used when recipients travel only in the envelope (BCC sends)
+UNDISCLOSED_RECIPIENTS = "undisclosed-recipients:;"
+
+
+def build_message(sender: str, to_header: str, subject: str, body: str, subtype: str = "plain") -> EmailMessage:
+    """Build the message sent by the SMTP services."""
+    msg = EmailMessage()
+    msg["Subject"] = subject
+    msg["From"] = sender
+    msg["To"] = to_header
+    msg.set_content(body, subtype=subtype)
+    return msg
+
+
+# Server replied with an error but the session is still usable after RSET
+RECOVERABLE_SMTP_ERRORS = (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError)
+# The server or network dropped the session; the send is retried once on a fresh session
+_DROPPED_SESSION_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+class _PooledConnection:
+    __slots__ = ("client", "created_at", "last_used", "messages")
+
+    def __init__(self, client, now: float) -> None:
+        self.client = client
+        self.created_at = now
+        self.last_used = now
+        self.messages = 0
+
+
+class SMTPConnectionPool:
+    """Thread-safe pool of authenticated SMTP sessions.
+
+    Sessions are reused across sends and threads. A session idle for longer
+    than check_after seconds is probed with NOOP before reuse, and sessions
+    are closed (QUIT) after max_messages messages or max_age seconds.
+    connect must return a connected, authenticated client.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], smtplib.SMTP | smtplib.SMTP_SSL],
+        max_size: int = 4,
+        max_messages: int = 100,
+        max_age: float = 300.0,
+        check_after: float = 5.0,
+        acquire_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        self._connect = connect
+        self.max_size = max_size
+        self.max_messages = max_messages
+        self.max_age = max_age
+        self.check_after = check_after
+        self.acquire_timeout = acquire_timeout
+        self._clock = clock
+        self._idle: Deque[_PooledConnection] = deque()
+        self._open = 0
+        self._cond = threading.Condition()
+
+    @property
+    def open_connections(self) -> int:
+        return self._open
+
+    @contextmanager
+    def connection(self, fresh: bool = False) -> Iterator[smtplib.SMTP | smtplib.SMTP_SSL]:
+        """Check out a session for the duration of the block.
+
+        With fresh=True a new session is opened instead of reusing an idle
+        one; when the pool is full, its oldest idle session is closed to make room.
+        """
+        conn = self._acquire(fresh)
+        try:
+            yield conn.client
+        except RECOVERABLE_SMTP_ERRORS:
+            conn.messages += 1
+            try:
+                conn.client.rset()
+            except Exception:
+                self._discard(conn)
+                raise
+            self._release(conn)
+            raise
+        except BaseException:
+            self._discard(conn)
+            raise
+        else:
+            conn.messages += 1
+            self._release(conn)
+
+    def close(self) -> None:
+        """QUIT all idle sessions; sessions in use are closed when released."""
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._open -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            self._quit(conn)
+
+    def _expired(self, conn: _PooledConnection, now: float) -> bool:
+        return conn.messages >= self.max_messages or now - conn.created_at >= self.max_age
+
+    def _acquire(self, fresh: bool = False) -> _PooledConnection:
+        deadline = self._clock() + self.acquire_timeout
+        while True:
+            stale = None
+            with self._cond:
+                conn = None
+                while conn is None:
+                    if self._idle and not fresh:
+                        # LIFO keeps the hottest sessions in use and lets the rest age out
+                        conn = self._idle.pop()
+                    elif self._open < self.max_size:
+                        self._open += 1
+                        break
+                    elif self._idle:
+                        # Its slot goes to the new session, so the open count is unchanged
+                        stale = self._idle.popleft()
+                        break
+                    else:
+                        remaining = deadline - self._clock()
+                        if remaining <= 0:
+                            raise TimeoutError("Timed out waiting for an SMTP connection")
+                        self._cond.wait(remaining)
+
+            if conn is None:
+                if stale is not None:
+                    self._quit(stale)
+                try:
+                    client = self._connect()
+                except BaseException:
+                    with self._cond:
+                        self._open -= 1
+                        self._cond.notify()
+                    raise
+                return _PooledConnection(client, self._clock())
+
+            now = self._clock()
+            if self._expired(conn, now):
+                self._discard(conn)
+                continue
+            if now - conn.last_used >= self.check_after and not self._alive(conn):
+                self._discard(conn, quit=False)
+                continue
+            return conn
+
+    def _alive(self, conn: _PooledConnection) -> bool:
+        try:
+            code = conn.client.noop()[0]
+        except Exception:
+            logging.debug("SMTP NOOP failed; dropping pooled session", exc_info=True)
+            return False
+        return code == 250
+
+    def _release(self, conn: _PooledConnection) -> None:
+        conn.last_used = self._clock()
+        if self._expired(conn, conn.last_used):
+            self._discard(conn)
+            return
+        with self._cond:
+            self._idle.append(conn)
+            self._cond.notify()
+
+    def _discard(self, conn: _PooledConnection, quit: bool = True) -> None:
+        with self._cond:
+            self._open -= 1
+            self._cond.notify()
+        if quit:
+            self._quit(conn)
+        else:
+            try:
+                conn.client.close()
+            except Exception:
+                logging.debug("Failed to close SMTP session", exc_info=True)
+
+    @staticmethod
+    def _quit(conn: _PooledConnection) -> None:
+        try:
+            conn.client.quit()
+        except Exception:
+            logging.debug("SMTP QUIT failed; closing socket", exc_info=True)
+            try:
+                conn.client.close()
+            except Exception:
+                logging.debug("Failed to close SMTP session", exc_info=True)
+
+
 class SMTPService:
     """Simple SMTP email sender supporting SSL and STARTTLS.
 
     The client_factory parameter allows injecting a custom SMTP client for testing.
+    With pool_size > 0 authenticated sessions are kept in an SMTPConnectionPool
+    (created through client_factory) and reused across sends.
     """
 
+    # Services built by from_settings, shared so background tasks reuse one pool
+    _shared: Dict[Tuple, "SMTPService"] = {}
+    _shared_lock = threading.Lock()
+
     def __init__(
         self,
         host: str,
@@ -26,6 +236,10 @@ class SMTPService:
         password: str,
         client_factory: Optional[Callable[..., smtplib.SMTP | smtplib.SMTP_SSL]] = None,
         timeout: int = 10,
+        pool_size: int = 0,
+        pool_max_messages: int = 100,
+        pool_max_age: float = 300.0,
+        pool_check_after: float = 5.0,
     ) -> None:
         self.host = host
         self.port = port
@@ -33,11 +247,22 @@ class SMTPService:
         self.password = password
         self.client_factory = client_factory
         self.timeout = timeout
+        self.pool: Optional[SMTPConnectionPool] = None
+        if pool_size > 0:
+            self.pool = SMTPConnectionPool(
+                self._open_session,
+                max_size=pool_size,
+                max_messages=pool_max_messages,
+                max_age=pool_max_age,
+                check_after=pool_check_after,
+            )
 
     @classmethod
     def from_settings(cls, settings: Settings) -> "SMTPService":
         """Construct SMTPService from application Settings.
 
+        When SMTP_POOL_SIZE > 0 the same pooled instance is returned for
+        identical settings, so every caller shares its open sessions.
         Raises ValueError if required SMTP settings are missing.
         """
         try:
@@ -45,6 +270,12 @@ class SMTPService:
             port = settings.SMTP_PORT
             username = settings.SMTP_USERNAME
             password = settings.SMTP_PASSWORD
+            pool_options = {
+                "pool_size": settings.SMTP_POOL_SIZE,
+                "pool_max_messages": settings.SMTP_POOL_MAX_MESSAGES,
+                "pool_max_age": settings.SMTP_POOL_MAX_AGE,
+                "pool_check_after": settings.SMTP_POOL_CHECK_AFTER,
+            }
         except Exception as e:
             logging.error(e, exc_info=True)
             raise ValueError("Failed reading SMTP settings") from e
@@ -52,53 +283,134 @@ class SMTPService:
         if not (host and port and username and password):
             raise ValueError("Incomplete SMTP settings: SMTP_HOST/SMTP_PORT/SMTP_USERNAME/SMTP_PASSWORD required")
 
-        return cls(host=host, port=port, username=username, password=password)
+        if pool_options["pool_size"] <= 0:
+            return cls(host=host, port=port, username=username, password=password)
 
-    def send_email(self, to_emails: list[str], subject: str, body: str, subtype: str = "plain") -> None:
+        key = (host, port, username, password, *pool_options.values())
+        with cls._shared_lock:
+            service = cls._shared.get(key)
+            if service is None:
+                service = cls(host=host, port=port, username=username, password=password, **pool_options)
+                cls._shared[key] = service
+            return service
+
+    def _factory(self) -> Callable[..., smtplib.SMTP | smtplib.SMTP_SSL]:
+        # Default factory that returns an SMTP client (context manager)
+        def _default_factory(host: str, port: int, timeout: int = 10):
+            if port == 587:
+                return smtplib.SMTP(host=host, port=port, timeout=timeout)
+            return smtplib.SMTP_SSL(host=host, port=port, timeout=timeout)
+
+        return self.client_factory or _default_factory
+
+    def _handshake(self, smtp) -> None:
+        if self.port == 587:
+            # STARTTLS flow
+            try:
+                smtp.ehlo()
+                smtp.starttls()
+                smtp.ehlo()
+            except Exception:
+                # If STARTTLS fails, let login/send flow handle and be logged below
+                logging.debug("STARTTLS handshake failed or not supported", exc_info=True)
+
+        smtp.login(self.username, self.password)
+
+    def _open_session(self):
+        """Connect and authenticate a client for the pool."""
+        smtp = self._factory()(self.host, self.port, self.timeout)
+        try:
+            self._handshake(smtp)
+        except BaseException:
+            try:
+                smtp.close()
+            except Exception:
+                logging.debug("Failed to close SMTP session after handshake error", exc_info=True)
+            raise
+        return smtp
+
+    def close(self) -> None:
+        """Close pooled sessions, if any."""
+        if self.pool is not None:
+            self.pool.close()
+
+    def _send(self, msg: EmailMessage, to_addrs: Optional[list[str]] = None) -> Dict[str, Tuple[int, bytes]]:
+        """Deliver msg on a pooled or one-off session; return the refused recipients."""
+        def _submit(smtp):
+            refused = smtp.send_message(msg, to_addrs=to_addrs) if to_addrs else smtp.send_message(msg)
+            return dict(refused) if isinstance(refused, dict) else {}
+
+        started = time.perf_counter()
+        try:
+            if self.pool is not None:
+                try:
+                    with self.pool.connection() as smtp:
+                        return _submit(smtp)
+                except _DROPPED_SESSION_ERRORS:
+                    # The pool has discarded the dropped session; a reused one may have been
+                    # closed by the server between sends, so try once more on a new session
+                    logging.warning("SMTP session to %s:%s dropped; retrying on a fresh session", self.host, self.port)
+                with self.pool.connection(fresh=True) as smtp:
+                    return _submit(smtp)
+
+            # Use context manager form of SMTP/SMTP_SSL
+            with self._factory()(self.host, self.port, self.timeout) as smtp:
+                # Login and send
+                self._handshake(smtp)
+                return _submit(smtp)
+        except Exception:
+            smtp_send_failures.inc("sync")
+            raise
+        finally:
+            smtp_send_seconds.observe(time.perf_counter() - started, "sync")
+
+    def _build_message(self, to_header: str, subject: str, body: str, subtype: str) -> EmailMessage:
+        return build_message(self.username, to_header, subject, body, subtype)
+
+    def send_email(
+        self, to_emails: list[str], subject: str, body: str, subtype: str = "plain"
+    ) -> Dict[str, Tuple[int, bytes]]:
         """Send an email to one or more recipients.
 
         - Uses STARTTLS when port == 587.
         - Uses SSL (SMTP_SSL) otherwise.
+        - Reuses a pooled session when the service was created with a pool.
+        - Returns the recipients the server refused (empty when all were accepted).
         - Raises EmailSendError on failure with non-sensitive context.
         """
         if not to_emails:
             raise ValueError("to_emails must be a non-empty list of recipient addresses")
 
-        msg = EmailMessage()
-        msg["Subject"] = subject
-        msg["From"] = self.username
         # EmailMessage will accept a list for To if assigned directly, but join for clarity
-        msg["To"] = ", ".join(to_emails)
-        msg.set_content(body, subtype=subtype)
+        msg = self._build_message(", ".join(to_emails), subject, body, subtype)
 
-        # Default factory that returns an SMTP client (context manager)
-        def _default_factory(host: str, port: int, timeout: int = 10):
-            if port == 587:
-                return smtplib.SMTP(host=host, port=port, timeout=timeout)
-            return smtplib.SMTP_SSL(host=host, port=port, timeout=timeout)
+        try:
+            return self._send(msg)
+        except (smtplib.SMTPException, OSError, TimeoutError) as e:
+            # Do not log sensitive data such as password
+            logging.error(e, exc_info=True)
+            raise EmailSendError(
+                f"Failed to send email to {to_emails} using SMTP server {self.host}:{self.port} (user={self.username})"
+            ) from e
 
-        factory = self.client_factory or _default_factory
+    def send_bcc(
+        self, bcc_emails: list[str], subject: str, body: str, subtype: str = "plain"
+    ) -> Dict[str, Tuple[int, bytes]]:
+        """Send one message to bcc_emails without disclosing them to each other.
 
-        try:
-            # Use context manager form of SMTP/SMTP_SSL
-            with factory(self.host, self.port, self.timeout) as smtp:
-                if self.port == 587:
-                    # STARTTLS flow
-                    try:
-                        smtp.ehlo()
-                        smtp.starttls()
-                        smtp.ehlo()
-                    except Exception:
-                        # If STARTTLS fails, let login/send flow handle and be logged below
-                        logging.debug("STARTTLS handshake failed or not supported", exc_info=True)
+        Recipients appear only in the SMTP envelope; the To header is the
+        undisclosed-recipients group. Same return value and errors as send_email.
+        """
+        if not bcc_emails:
+            raise ValueError("bcc_emails must be a non-empty list of recipient addresses")
 
-                # Login and send
-                smtp.login(self.username, self.password)
-                smtp.send_message(msg)
+        msg = self._build_message(UNDISCLOSED_RECIPIENTS, subject, body, subtype)
 
+        try:
+            return self._send(msg, to_addrs=list(bcc_emails))
         except (smtplib.SMTPException, OSError, TimeoutError) as e:
-            # Do not log sensitive data such as password
             logging.error(e, exc_info=True)
             raise EmailSendError(
-                f"Failed to send email to {to_emails} using SMTP server {self.host}:{self.port} (user={self.username})"
+                f"Failed to send email to {len(bcc_emails)} BCC recipients using SMTP server "
+                f"{self.host}:{self.port} (user={self.username})"
             ) from e
@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import logging
+import re
+import smtplib
+import socket
+import ssl
+import time
+from contextlib import asynccontextmanager
+from email import policy
+from email.message import EmailMessage
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from event_service.core.config import Settings
+from event_service.services.smtp import (
+    UNDISCLOSED_RECIPIENTS,
+    EmailSendError,
+    build_message,
+    smtp_send_failures,
+    smtp_send_seconds,
+)
+
+_DOT_LINE = re.compile(rb"(?m)^\.")
+
+
+class AsyncSMTPSession:
+    """One connected, authenticated SMTP session on asyncio streams.
+
+    Speaks the subset of ESMTP needed for submission: EHLO, STARTTLS, AUTH
+    PLAIN/LOGIN, MAIL/RCPT/DATA, RSET, NOOP and QUIT. Server errors are
+    raised as the matching smtplib exceptions.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, timeout: float) -> None:
+        self._reader = reader
+        self._writer = writer
+        self.timeout = timeout
+        self.extensions: Dict[str, str] = {}
+        self.messages = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._writer.is_closing()
+
+    async def _read_reply(self) -> Tuple[int, bytes]:
+        lines: List[bytes] = []
+        while True:
+            try:
+                line = await asyncio.wait_for(self._reader.readline(), self.timeout)
+            except asyncio.TimeoutError as e:
+                raise smtplib.SMTPServerDisconnected("Timed out waiting for the SMTP server") from e
+            if not line:
+                self._writer.close()
+                raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+            try:
+                code = int(line[:3])
+            except ValueError as e:
+                raise smtplib.SMTPResponseException(-1, line.rstrip()) from e
+            lines.append(line[4:].rstrip(b"\r\n"))
+            if line[3:4] != b"-":
+                return code, b"\n".join(lines)
+
+    async def _write(self, data: bytes) -> None:
+        self._writer.write(data)
+        try:
+            await asyncio.wait_for(self._writer.drain(), self.timeout)
+        except asyncio.TimeoutError as e:
+            raise smtplib.SMTPServerDisconnected("Timed out writing to the SMTP server") from e
+
+    async def command(self, line: str) -> Tuple[int, bytes]:
+        await self._write(line.encode("utf-8") + b"\r\n")
+        return await self._read_reply()
+
+    async def greeting(self) -> None:
+        code, msg = await self._read_reply()
+        if code != 220:
+            raise smtplib.SMTPConnectError(code, msg)
+
+    async def ehlo(self, name: str) -> None:
+        code, msg = await self.command(f"EHLO {name}")
+        if code != 250:
+            raise smtplib.SMTPHeloError(code, msg)
+        self.extensions = {}
+        for line in msg.decode("utf-8", errors="replace").split("\n")[1:]:
+            keyword, _, params = line.partition(" ")
+            self.extensions[keyword.upper()] = params
+
+    async def starttls(self, context: ssl.SSLContext, server_hostname: str) -> None:
+        code, msg = await self.command("STARTTLS")
+        if code != 220:
+            raise smtplib.SMTPResponseException(code, msg)
+        await asyncio.wait_for(self._writer.start_tls(context, server_hostname=server_hostname), self.timeout)
+
+    async def login(self, username: str, password: str) -> None:
+        """Authenticate with AUTH PLAIN or LOGIN; raises SMTPNotSupportedError without AUTH, like smtplib."""
+        if "AUTH" not in self.extensions:
+            raise smtplib.SMTPNotSupportedError("SMTP AUTH extension not supported by server.")
+        mechanisms = self.extensions["AUTH"].upper().split()
+        if "PLAIN" in mechanisms:
+            token = base64.b64encode(f"\0{username}\0{password}".encode("utf-8")).decode("ascii")
+            code, msg = await self.command(f"AUTH PLAIN {token}")
+        elif "LOGIN" in mechanisms:
+            code, msg = await self.command("AUTH LOGIN")
+            if code == 334:
+                code, msg = await self.command(base64.b64encode(username.encode("utf-8")).decode("ascii"))
+            if code == 334:
+                code, msg = await self.command(base64.b64encode(password.encode("utf-8")).decode("ascii"))
+        else:
+            raise smtplib.SMTPNotSupportedError("No supported AUTH mechanism offered by the server")
+        # Only 235 means authenticated; a 503 (bad sequence) is not taken as success
+        if code != 235:
+            raise smtplib.SMTPAuthenticationError(code, msg)
+
+    async def send_message(self, msg: EmailMessage, to_addrs: Optional[List[str]] = None) -> Dict[str, Tuple[int, bytes]]:
+        """Send msg to to_addrs (default: its To header) and return the refused recipients.
+
+        Raises SMTPRecipientsRefused when every recipient is refused, like smtplib,
+        and ValueError when there is no recipient, before anything is sent.
+        """
+        sender = msg["From"]
+        if to_addrs is None:
+            to_addrs = [addr.strip() for addr in str(msg["To"]).split(",") if addr.strip()]
+        if not to_addrs:
+            raise ValueError("send_message needs at least one recipient")
+        code, resp = await self.command(f"MAIL FROM:<{sender}>")
+        if code != 250:
+            await self.rset()
+            raise smtplib.SMTPSenderRefused(code, resp, sender)
+
+        refused: Dict[str, Tuple[int, bytes]] = {}
+        for addr in to_addrs:
+            code, resp = await self.command(f"RCPT TO:<{addr}>")
+            if code not in (250, 251):
+                refused[addr] = (code, resp)
+        if len(refused) == len(to_addrs):
+            await self.rset()
+            raise smtplib.SMTPRecipientsRefused(refused)
+
+        code, resp = await self.command("DATA")
+        if code != 354:
+            await self.rset()
+            raise smtplib.SMTPDataError(code, resp)
+        data = msg.as_bytes(policy=policy.SMTP)
+        if not data.endswith(b"\r\n"):
+            data += b"\r\n"
+        await self._write(_DOT_LINE.sub(b"..", data) + b".\r\n")
+        code, resp = await self._read_reply()
+        if code != 250:
+            await self.rset()
+            raise smtplib.SMTPDataError(code, resp)
+        self.messages += 1
+        return refused
+
+    async def rset(self) -> None:
+        await self.command("RSET")
+
+    async def noop(self) -> int:
+        return (await self.command("NOOP"))[0]
+
+    async def quit(self) -> None:
+        try:
+            await self.command("QUIT")
+        except Exception:
+            logging.debug("SMTP QUIT failed; closing socket", exc_info=True)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class AsyncSMTPService:
+    """asyncio counterpart of SMTPService with the same from_settings/send_email surface.
+
+    Each send opens its own session, so one event loop can drive many
+    deliveries concurrently without tying up threads; use session() to send
+    several messages over one authenticated connection. By default port 587
+    uses STARTTLS and any other port implicit TLS, as in SMTPService; use_tls
+    and start_tls override that (e.g. plain connections to a local relay).
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        timeout: float = 10,
+        use_tls: Optional[bool] = None,
+        start_tls: Optional[bool] = None,
+        tls_context: Optional[ssl.SSLContext] = None,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self.use_tls = use_tls if use_tls is not None else port != 587
+        self.start_tls = start_tls
+        self.tls_context = tls_context
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "AsyncSMTPService":
+        """Construct AsyncSMTPService from application Settings.
+
+        Raises ValueError if required SMTP settings are missing.
+        """
+        try:
+            host = settings.SMTP_HOST
+            port = settings.SMTP_PORT
+            username = settings.SMTP_USERNAME
+            password = settings.SMTP_PASSWORD
+        except Exception as e:
+            logging.error(e, exc_info=True)
+            raise ValueError("Failed reading SMTP settings") from e
+
+        if not (host and port and username and password):
+            raise ValueError("Incomplete SMTP settings: SMTP_HOST/SMTP_PORT/SMTP_USERNAME/SMTP_PASSWORD required")
+
+        return cls(host=host, port=port, username=username, password=password)
+
+    def _context(self) -> ssl.SSLContext:
+        return self.tls_context or ssl.create_default_context()
+
+    async def connect(self) -> AsyncSMTPSession:
+        """Open, greet and authenticate a new session."""
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port, ssl=self._context() if self.use_tls else None),
+                self.timeout,
+            )
+        except asyncio.TimeoutError as e:
+            raise smtplib.SMTPConnectError(-1, f"Timed out connecting to {self.host}:{self.port}".encode()) from e
+        session = AsyncSMTPSession(reader, writer, self.timeout)
+        try:
+            await session.greeting()
+            local_name = socket.getfqdn()
+            await session.ehlo(local_name)
+            # None follows SMTPService: STARTTLS on 587 when offered, tolerate servers without it
+            start_tls = self.start_tls if self.start_tls is not None else (self.port == 587 and not self.use_tls)
+            if start_tls:
+                if "STARTTLS" in session.extensions:
+                    await session.starttls(self._context(), self.host)
+                    await session.ehlo(local_name)
+                elif self.start_tls:
+                    raise smtplib.SMTPNotSupportedError("STARTTLS extension not supported by server")
+                else:
+                    logging.debug("STARTTLS not offered by %s:%s", self.host, self.port)
+            await session.login(self.username, self.password)
+        except BaseException:
+            session.close()
+            raise
+        return session
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSMTPSession]:
+        """Authenticated session for the duration of the block, QUIT on exit."""
+        session = await self.connect()
+        try:
+            yield session
+        finally:
+            await session.quit()
+
+    def _error(self, description: str, e: BaseException) -> EmailSendError:
+        # Do not log sensitive data such as password
+        logging.error(e, exc_info=True)
+        return EmailSendError(
+            f"Failed to send email to {description} using SMTP server {self.host}:{self.port} (user={self.username})"
+        )
+
+    async def _send(
+        self, msg: EmailMessage, to_addrs: Optional[List[str]], session: Optional[AsyncSMTPSession]
+    ) -> Dict[str, Tuple[int, bytes]]:
+        started = time.perf_counter()
+        try:
+            if session is not None:
+                return await session.send_message(msg, to_addrs)
+            async with self.session() as own:
+                return await own.send_message(msg, to_addrs)
+        except Exception:
+            smtp_send_failures.inc("async")
+            raise
+        finally:
+            smtp_send_seconds.observe(time.perf_counter() - started, "async")
+
+    async def send_email(
+        self,
+        to_emails: list[str],
+        subject: str,
+        body: str,
+        subtype: str = "plain",
+        session: Optional[AsyncSMTPSession] = None,
+    ) -> Dict[str, Tuple[int, bytes]]:
+        """Send an email to one or more recipients; same contract as SMTPService.send_email.
+
+        Pass session to reuse an open session instead of connecting for this message.
+        """
+        if not to_emails:
+            raise ValueError("to_emails must be a non-empty list of recipient addresses")
+
+        msg = build_message(self.username, ", ".join(to_emails), subject, body, subtype)
+        try:
+            return await self._send(msg, None, session)
+        except (smtplib.SMTPException, OSError, asyncio.TimeoutError) as e:
+            raise self._error(str(to_emails), e) from e
+
+    async def send_bcc(
+        self,
+        bcc_emails: list[str],
+        subject: str,
+        body: str,
+        subtype: str = "plain",
+        session: Optional[AsyncSMTPSession] = None,
+    ) -> Dict[str, Tuple[int, bytes]]:
+        """Send one message to bcc_emails without disclosing them; see SMTPService.send_bcc."""
+        if not bcc_emails:
+            raise ValueError("bcc_emails must be a non-empty list of recipient addresses")
+
+        msg = build_message(self.username, UNDISCLOSED_RECIPIENTS, subject, body, subtype)
+        try:
+            return await self._send(msg, list(bcc_emails), session)
+        except (smtplib.SMTPException, OSError, asyncio.TimeoutError) as e:
+            raise self._error(f"{len(bcc_emails)} BCC recipients", e) from e
@@ -0,0 +1,65 @@
+"""Notification worker: drains the notification outbox.
+
+Run one or more processes with ``event-service-worker`` (or
+``python -m event_service.worker``). Workers lease due rows with one
+committed conditional UPDATE (FOR UPDATE SKIP LOCKED candidates on Postgres)
+before sending, so they can be scaled horizontally without delivering the
+same entry twice concurrently, and no lock is held during SMTP traffic.
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import threading
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from event_service.core.config import Settings, settings as default_settings
+from event_service.database import SessionLocal
+import event_service.models  # noqa: F401  ensure models are registered with Base
+from event_service.services.outbox import drain_once
+
+
+def run_worker(
+    session_factory: Callable[[], Session] = SessionLocal,
+    settings: Settings = default_settings,
+    stop_event: Optional[threading.Event] = None,
+    once: bool = False,
+) -> int:
+    """Drain the outbox until stopped; with once=True, drain until empty and return.
+
+    Returns the total number of entries processed.
+    """
+    stop_event = stop_event or threading.Event()
+    total = 0
+    while not stop_event.is_set():
+        try:
+            processed = drain_once(session_factory, settings)
+        except Exception as e:
+            logging.error(e, exc_info=True)
+            processed = 0
+        total += processed
+        # Keep draining while batches come back full; otherwise wait for new work
+        if processed < settings.NOTIFICATION_OUTBOX_BATCH_SIZE:
+            if once:
+                break
+            stop_event.wait(settings.NOTIFICATION_WORKER_POLL_INTERVAL)
+    return total
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Deliver queued event notifications")
+    parser.add_argument("--once", action="store_true", help="drain due entries and exit")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    try:
+        total = run_worker(once=args.once)
+        logging.info("Notification worker processed %s entries", total)
+    except KeyboardInterrupt:
+        logging.info("Notification worker stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,13 @@
-import pytest
-from fastapi.testclient import TestClient
-from event_service.main import app
+import os
+
+# Fail tests on requests over their statement budget (see core.query_monitor). Statement
+# timing depends on the machine, so slow-statement checks stay in tests that set their own threshold
+os.environ.setdefault("SQL_QUERY_MONITOR_STRICT", "true")
+os.environ.setdefault("SQL_SLOW_QUERY_THRESHOLD", "0")
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from event_service.main import app  # noqa: E402
 
 @pytest.fixture(scope="module")
 def client():
@@ -0,0 +1,114 @@
+import asyncio
+import json
+import uuid
+import zlib
+
+from event_service.core.compression import CompressionMiddleware, compressed_body_cache, negotiate
+from event_service.services.cache import event_cache
+
+
+def _create(client, **fields) -> dict:
+    payload = {"name": "Compressed", "description": "lorem ipsum " * 300, "location": f"loc-{uuid.uuid4().hex}"}
+    payload.update(fields)
+    res = client.post("/events", json=payload)
+    assert res.status_code == 201
+    return res.json()
+
+
+def test_negotiate_honours_q_values_and_server_order():
+    encodings = ("zstd", "br", "gzip")
+    assert negotiate("gzip, deflate", encodings) == "gzip"
+    assert negotiate("gzip;q=0.5, br", encodings) == "br"
+    assert negotiate("br, zstd", encodings) == "zstd"
+    assert negotiate("*", ("gzip",)) == "gzip"
+    assert negotiate("*, gzip;q=0", ("gzip",)) is None
+    assert negotiate("identity", encodings) is None
+    assert negotiate(None, encodings) is None
+
+
+def test_large_responses_are_gzipped_with_tagged_etag(client):
+    ev = _create(client)
+    res = client.get(f"/events/{ev['id']}", headers={"Accept-Encoding": "gzip"})
+    assert res.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in res.headers["vary"]
+    assert int(res.headers["content-length"]) < len(json.dumps(ev))
+    assert res.json() == ev
+    etag = res.headers["ETag"]
+    assert etag.endswith('-gzip"')
+
+    # the client's tag is understood and echoed back on 304
+    res = client.get(f"/events/{ev['id']}", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert res.status_code == 304
+    assert res.headers["ETag"] == etag
+    event_cache.invalidate(ev["id"])
+    res = client.get(f"/events/{ev['id']}", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert res.status_code == 304
+
+    res = client.put(f"/events/{ev['id']}", json={"name": "Renamed"}, headers={"If-Match": etag})
+    assert res.status_code == 200
+
+
+def test_small_or_unaccepted_responses_are_sent_as_is(client):
+    ev = _create(client, description=None)
+    res = client.get(f"/events/{ev['id']}", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in res.headers
+    assert "Accept-Encoding" in res.headers["vary"]
+    assert not res.headers["ETag"].endswith('-gzip"')
+
+    big = _create(client)
+    res = client.get(f"/events/{big['id']}", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in res.headers
+    assert res.json() == big
+
+
+def test_list_pages_are_compressed_once(client):
+    location = f"loc-{uuid.uuid4().hex}"
+    for _ in range(3):
+        _create(client, location=location)
+    compressed_body_cache.reset_stats()
+
+    first = client.get("/events", params={"location": location}, headers={"Accept-Encoding": "gzip"})
+    second = client.get("/events", params={"location": location}, headers={"Accept-Encoding": "gzip"})
+    assert first.headers["content-encoding"] == second.headers["content-encoding"] == "gzip"
+    assert first.content == second.content
+
+    stats = client.get("/metrics/compression").json()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+
+    # another page over the same rows is a different body
+    res = client.get("/events", params={"location": location, "limit": 2}, headers={"Accept-Encoding": "gzip"})
+    assert len(res.json()) == 2
+
+
+def test_streamed_export_is_compressed(client):
+    location = f"loc-{uuid.uuid4().hex}"
+    created = [_create(client, location=location) for _ in range(3)]
+    res = client.get("/events/export", params={"location": location}, headers={"Accept-Encoding": "gzip"})
+    assert res.headers["content-encoding"] == "gzip"
+    assert "content-length" not in res.headers
+    assert [json.loads(line) for line in res.text.splitlines()] == created
+
+
+def test_streamed_chunks_are_flushed_as_they_are_sent():
+    lines = [json.dumps({"n": i, "pad": "x" * 2000}).encode() + b"\n" for i in range(3)]
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/x-ndjson")]})
+        for line in lines:
+            await send({"type": "http.response.body", "body": line, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/stream", "query_string": b"", "headers": [(b"accept-encoding", b"gzip")]}
+    asyncio.run(CompressionMiddleware(app)(scope, None, send))
+
+    # Every chunk decodes to its line on arrival, before the stream ends
+    decoder = zlib.decompressobj(31)
+    bodies = [m["body"] for m in sent if m["type"] == "http.response.body"]
+    assert [decoder.decompress(body) for body in bodies[:3]] == lines
+    assert decoder.decompress(bodies[3]) == b"" and decoder.eof
@@ -0,0 +1,53 @@
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from event_service.core.config import settings
+from event_service.core.pool import PoolMetrics, instrumented_pool_class, pool_options, pool_status
+
+
+def test_pool_options_from_settings():
+    opts = pool_options("postgresql://u:p@h/db", settings)
+    assert opts["pool_size"] == settings.DB_POOL_SIZE
+    assert opts["max_overflow"] == settings.DB_MAX_OVERFLOW
+    assert opts["pool_timeout"] == settings.DB_POOL_TIMEOUT
+    assert opts["pool_recycle"] == settings.DB_POOL_RECYCLE
+    assert opts["pool_pre_ping"] == settings.DB_POOL_PRE_PING
+
+
+def test_pool_options_skip_sizing_for_sqlite_memory():
+    opts = pool_options("sqlite:///:memory:", settings)
+    assert "pool_size" not in opts
+    assert "max_overflow" not in opts
+
+
+def test_instrumented_pool_records_checkouts_and_wait(tmp_path):
+    metrics = PoolMetrics()
+    url = f"sqlite:///{tmp_path / 'pool.db'}"
+    engine = create_engine(url, poolclass=instrumented_pool_class(QueuePool, metrics), **pool_options(url, settings))
+    metrics.attach(engine)
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            during = pool_status(engine, metrics)
+        after = pool_status(engine, metrics)
+    finally:
+        engine.dispose()
+
+    assert during["checked_out"] == 1
+    assert after["checked_out"] == 0
+    assert after["connects"] == 1
+    assert after["checkouts"] >= 1
+    assert after["checkins"] >= 1
+    assert after["wait_seconds"]["count"] >= 1
+    assert after["wait_seconds"]["buckets"]["+Inf"] == after["wait_seconds"]["count"]
+    assert after["pool_class"] == "InstrumentedQueuePool"
+
+
+def test_db_pool_endpoint(client):
+    client.get("/events")
+    res = client.get("/metrics/db-pool")
+    assert res.status_code == 200
+    data = res.json()["sync"]
+    for key in ("checked_out", "overflow", "checkouts", "wait_seconds"):
+        assert key in data
+    assert data["checkouts"] >= 1
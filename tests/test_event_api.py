@@ -1,6 +1,8 @@
+import json
+import uuid
 from typing import Any, Dict
 from unittest.mock import patch, MagicMock
-import event_service.api.event as event_module
+from event_service.services.smtp import SMTPService
 from datetime import datetime, timezone
 
 
@@ -22,6 +24,63 @@ def test_create_event_201(client):
     assert data["name"] == payload["name"]
 
 
+def test_create_event_is_one_insert_returning(client):
+    from sqlalchemy import event as sa_event
+    from event_service.database import engine
+
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    sa_event.listen(engine, "before_cursor_execute", _record)
+    try:
+        res = client.post("/events", json=_create_payload("Returning Event"))
+    finally:
+        sa_event.remove(engine, "before_cursor_execute", _record)
+
+    assert res.status_code == 201
+    assert len(statements) == 1
+    assert statements[0].startswith("INSERT") and "RETURNING" in statements[0]
+    data = res.json()
+    assert data["created_at"] and data["updated_at"]
+    assert res.headers["ETag"]
+    assert client.get(f"/events/{data['id']}").json() == data
+
+
+def test_create_event_stores_aware_times_as_naive_utc(client):
+    payload = dict(_create_payload("Offset Event"), start_time="2030-05-01T09:00:00-04:00", end_time="2030-05-01T10:30:00+00:00")
+    res = client.post("/events", json=payload)
+    assert res.status_code == 201
+    data = res.json()
+    assert (data["start_time"], data["end_time"]) == ("2030-05-01T13:00:00", "2030-05-01T10:30:00")
+    assert client.get(f"/events/{data['id']}").json() == data
+
+
+def test_every_write_path_stores_offset_times_as_the_same_naive_utc(client):
+    times = {"start_time": "2030-05-01T09:00:00-04:00", "end_time": "2030-05-01T18:15:00+05:30"}
+    stored = ("2030-05-01T13:00:00", "2030-05-01T12:45:00")
+    location = f"utc-{uuid.uuid4().hex}"
+    plain = {"name": "UTC", "location": location}
+
+    ids = [client.post("/events", json={**plain, **times}).json()["id"]]
+    ids.append(client.post("/events:batch", json=[{**plain, **times}]).json()["results"][0]["id"])
+    line = json.dumps({**plain, **times})
+    assert client.post("/events/import", content=line, headers={"Content-Type": "application/x-ndjson"}).json()["inserted"] == 1
+
+    for method in ("put", "patch"):
+        ev = client.post("/events", json=plain).json()
+        assert getattr(client, method)(f"/events/{ev['id']}", json=times).status_code == 200
+        ids.append(ev["id"])
+    ev = client.post("/events", json=plain).json()
+    assert client.patch("/events:batch", json=[{"id": ev["id"], **times}]).json()["results"][0]["status"] == 200
+    ids.append(ev["id"])
+
+    events = client.get("/events", params={"location": location}).json()
+    assert len(events) == 6 and set(ids) <= {e["id"] for e in events}
+    assert {(e["start_time"], e["end_time"]) for e in events} == {stored}
+
+
 def test_list_events_200(client):
     payload = _create_payload("List Event")
     client.post("/events", json=payload)
@@ -93,7 +152,7 @@ def test_put_update_name_and_description_only_no_email(client):
 
     mock_smtp = MagicMock()
     # Ensure from_settings returns our mock
-    with patch.object(event_module.SMTPService, "from_settings", return_value=mock_smtp):
+    with patch.object(SMTPService, "from_settings", return_value=mock_smtp):
         res = client.put(f"/events/{ev_id}", json={"name": "New Name", "description": "New Desc"})
         assert res.status_code == 200
         # Background task should not be scheduled, so no send_email call
@@ -106,7 +165,7 @@ def test_put_update_location_triggers_email(client):
     ev_id = created["id"]
 
     mock_smtp = MagicMock()
-    with patch.object(event_module.SMTPService, "from_settings", return_value=mock_smtp):
+    with patch.object(SMTPService, "from_settings", return_value=mock_smtp):
         res = client.put(f"/events/{ev_id}", json={"location": "New Venue"})
         assert res.status_code == 200
         # BackgroundTasks run after response in TestClient; verify send_email called
@@ -130,7 +189,7 @@ def test_put_update_start_time_triggers_email(client):
     iso_time = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
     mock_smtp = MagicMock()
-    with patch.object(event_module.SMTPService, "from_settings", return_value=mock_smtp):
+    with patch.object(SMTPService, "from_settings", return_value=mock_smtp):
         res = client.put(f"/events/{ev_id}", json={"start_time": iso_time})
         assert res.status_code == 200
         assert mock_smtp.send_email.call_count == 1
@@ -149,7 +208,7 @@ def test_put_update_end_time_triggers_email(client):
     iso_time = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
     mock_smtp = MagicMock()
-    with patch.object(event_module.SMTPService, "from_settings", return_value=mock_smtp):
+    with patch.object(SMTPService, "from_settings", return_value=mock_smtp):
         res = client.put(f"/events/{ev_id}", json={"end_time": iso_time})
         assert res.status_code == 200
         assert mock_smtp.send_email.call_count == 1
@@ -167,7 +226,7 @@ def test_put_update_participants_triggers_email_to_new_list(client):
     new_participants = ["charlie@example.com", "dana@example.com"]
 
     mock_smtp = MagicMock()
-    with patch.object(event_module.SMTPService, "from_settings", return_value=mock_smtp):
+    with patch.object(SMTPService, "from_settings", return_value=mock_smtp):
         res = client.put(f"/events/{ev_id}", json={"participants": new_participants})
         assert res.status_code == 200
         assert mock_smtp.send_email.call_count == 1
@@ -185,7 +244,7 @@ def test_put_update_location_with_no_participants_sends_no_email(client):
     ev_id = created["id"]
 
     mock_smtp = MagicMock()
-    with patch.object(event_module.SMTPService, "from_settings", return_value=mock_smtp):
+    with patch.object(SMTPService, "from_settings", return_value=mock_smtp):
         res = client.put(f"/events/{ev_id}", json={"location": "Nowhere"})
         assert res.status_code == 200
         # No participants should result in no email sent
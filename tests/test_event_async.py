@@ -0,0 +1,145 @@
+import asyncio
+import inspect
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from event_service.api import event_async, event_overlaps  # noqa: E402
+from event_service.database import Base, async_database_url, get_async_db, get_db  # noqa: E402
+from event_service.services.intervals import event_intervals  # noqa: E402
+import event_service.models  # noqa: E402,F401
+
+
+@pytest.fixture(scope="module")
+def async_client():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+
+    async def _create_all():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(_create_all())
+    session_factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    async def _get_db():
+        async with session_factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(event_async.router)
+    app.dependency_overrides[get_async_db] = _get_db
+    with TestClient(app) as c:
+        yield c
+    asyncio.run(engine.dispose())
+
+
+def test_async_database_url_mapping():
+    assert async_database_url("postgresql://u:p@h/db") == "postgresql+asyncpg://u:p@h/db"
+    assert async_database_url("postgresql+psycopg2://u:p@h/db") == "postgresql+asyncpg://u:p@h/db"
+    assert async_database_url("sqlite:///local.db") == "sqlite+aiosqlite:///local.db"
+    assert async_database_url("sqlite+aiosqlite:///x.db") == "sqlite+aiosqlite:///x.db"
+
+
+def test_async_handlers_are_coroutines():
+    for name in ("create_event", "list_events", "get_event", "update_event", "patch_event", "delete_event"):
+        assert inspect.iscoroutinefunction(getattr(event_async, name))
+
+
+def test_async_crud_round_trip(async_client):
+    created = async_client.post("/events", json={"name": "Async Event", "participants": ["a@example.com"]})
+    assert created.status_code == 201
+    ev_id = created.json()["id"]
+
+    res = async_client.get(f"/events/{ev_id}")
+    assert res.status_code == 200
+    assert res.json()["name"] == "Async Event"
+
+    res = async_client.put(f"/events/{ev_id}", json={"name": "Async Renamed"})
+    assert res.status_code == 200
+    assert res.json()["name"] == "Async Renamed"
+
+    res = async_client.get("/events", params={"participant": "a@example.com"})
+    assert [item["id"] for item in res.json()] == [ev_id]
+
+    assert async_client.delete(f"/events/{ev_id}").status_code == 204
+    assert async_client.get(f"/events/{ev_id}").status_code == 404
+
+
+def test_async_list_paginates(async_client):
+    for i in range(3):
+        async_client.post("/events", json={"name": f"Async Page {i}"})
+    res = async_client.get("/events", params={"limit": 2})
+    assert res.status_code == 200
+    assert len(res.json()) == 2
+    assert "X-Next-Cursor" in res.headers
+
+
+def test_concurrent_conflict_checks_and_overlap_queries_do_not_stall_the_loop(tmp_path):
+    # A file database, so requests really run on separate connections
+    url = f"sqlite:///{tmp_path / 'overlaps.db'}"
+    sync_engine = create_engine(url, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=sync_engine)
+    engine = create_async_engine(async_database_url(url))
+    session_factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    sync_sessions = sessionmaker(bind=sync_engine, autoflush=False)
+
+    async def _get_async_db():
+        async with session_factory() as db:
+            yield db
+
+    def _get_db():
+        db = sync_sessions()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(event_overlaps.router)
+    app.include_router(event_async.router)
+    app.dependency_overrides[get_async_db] = _get_async_db
+    app.dependency_overrides[get_db] = _get_db
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            creates = [
+                client.post(
+                    "/events",
+                    params={"check_conflicts": "true"},
+                    json={
+                        "name": f"Slot {i}",
+                        "start_time": f"2040-01-01T{i:02d}:00:00",
+                        "end_time": f"2040-01-01T{i:02d}:30:00",
+                        "participants": ["async@example.com"],
+                    },
+                )
+                for i in range(20)
+            ]
+            window = {"start": "2040-01-01T00:00:00", "end": "2040-01-02T00:00:00"}
+            lists = [client.get("/events/overlaps", params=window) for _ in range(5)]
+            responses = await asyncio.wait_for(asyncio.gather(*creates, *lists), 20)
+            final = await client.get("/events/overlaps", params=window)
+            return responses, final
+
+    event_intervals.reset()
+    try:
+        responses, final = asyncio.run(scenario())
+    finally:
+        # The process-wide index must not keep this database's rows
+        event_intervals.reset()
+        asyncio.run(engine.dispose())
+        sync_engine.dispose()
+
+    assert [r.status_code for r in responses[:20]] == [201] * 20
+    assert all(r.status_code == 200 for r in responses[20:])
+    assert len(final.json()) == 20
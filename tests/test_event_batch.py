@@ -0,0 +1,112 @@
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import select
+
+from event_service.api import event as event_module
+from event_service.core.config import settings
+from event_service.database import SessionLocal
+from event_service.models.notification import NotificationOutbox
+from event_service.services.smtp import SMTPService
+
+
+def test_batch_create_returns_per_item_results(client):
+    items = [{"name": f"Batch Create {i}", "participants": [f"b{i}@example.com"]} for i in range(3)]
+    res = client.post("/events:batch", json=items)
+    assert res.status_code == 200
+    results = res.json()["results"]
+    assert [r["index"] for r in results] == [0, 1, 2]
+    assert all(r["status"] == 201 for r in results)
+    assert [r["event"]["name"] for r in results] == [item["name"] for item in items]
+    assert all(r["event"]["created_at"] for r in results)
+
+    # created rows are readable and indexed for participant lookup
+    ev_id = results[1]["id"]
+    assert client.get(f"/events/{ev_id}").json()["name"] == "Batch Create 1"
+    found = client.get("/events", params={"participant": "b1@example.com"}).json()
+    assert ev_id in {item["id"] for item in found}
+
+
+def test_batch_create_rejects_oversized_batch(client):
+    items = [{"name": "x"}] * (settings.EVENTS_BATCH_MAX_SIZE + 1)
+    res = client.post("/events:batch", json=items)
+    assert res.status_code == 413
+
+
+def test_batch_writes_larger_than_the_default_statement_budget(client):
+    # Strict mode fails any request over its budget; SQLite writes these row by row
+    count = settings.SQL_MAX_QUERIES_PER_REQUEST + 10
+    created = client.post("/events:batch", json=[{"name": f"Bulk {i}"} for i in range(count)])
+    assert created.status_code == 200
+    ids = [r["id"] for r in created.json()["results"]]
+    updated = client.patch("/events:batch", json=[{"id": ev_id, "description": "Bulk"} for ev_id in ids])
+    assert updated.status_code == 200
+    assert all(r["event"]["description"] == "Bulk" for r in updated.json()["results"])
+    deleted = client.request("DELETE", "/events:batch", json={"ids": ids})
+    assert [r["status"] for r in deleted.json()["results"]] == [204] * count
+
+
+def test_batch_update_reports_missing_and_notifies_once_per_event(client):
+    created = client.post(
+        "/events:batch",
+        json=[
+            {"name": "Batch Upd A", "participants": ["a@example.com"]},
+            {"name": "Batch Upd B", "participants": ["b@example.com"]},
+        ],
+    ).json()["results"]
+    a_id, b_id = created[0]["id"], created[1]["id"]
+
+    mock_smtp = MagicMock()
+    with patch.object(SMTPService, "from_settings", return_value=mock_smtp):
+        res = client.patch(
+            "/events:batch",
+            json=[
+                {"id": a_id, "location": "Room 1"},
+                {"id": a_id, "location": "Room 2"},
+                {"id": b_id, "name": "Batch Upd B renamed"},
+                {"id": 999999, "name": "missing"},
+            ],
+        )
+    assert res.status_code == 200
+    results = res.json()["results"]
+    assert [r["status"] for r in results] == [200, 200, 200, 404]
+    assert results[0]["event"]["location"] == "Room 2"
+    assert results[2]["event"]["name"] == "Batch Upd B renamed"
+
+    # A changed location twice (one email); B only changed its name (no email)
+    assert mock_smtp.send_email.call_count == 1
+    assert mock_smtp.send_email.call_args.kwargs["to_emails"] == ["a@example.com"]
+
+
+def test_batch_writes_store_times_as_naive_utc_and_queue_outbox_rows_together(client):
+    created = client.post(
+        "/events:batch",
+        json=[
+            {"name": "Batch TZ A", "start_time": "2030-01-01T10:00:00+02:00", "participants": ["tz-a@example.com"]},
+            {"name": "Batch TZ B", "start_time": "2030-01-01T10:00:00Z", "participants": ["tz-b@example.com"]},
+        ],
+    ).json()["results"]
+    assert [r["event"]["start_time"] for r in created] == ["2030-01-01T08:00:00", "2030-01-01T10:00:00"]
+    ids = [r["id"] for r in created]
+
+    with patch.object(event_module.settings, "NOTIFICATION_OUTBOX_INLINE", False):
+        res = client.patch("/events:batch", json=[{"id": i, "end_time": "2030-01-01T12:00:00-05:00"} for i in ids])
+    assert [r["event"]["end_time"] for r in res.json()["results"]] == ["2030-01-01T17:00:00"] * 2
+    assert client.get(f"/events/{ids[0]}").json()["end_time"] == "2030-01-01T17:00:00"
+
+    db = SessionLocal()
+    try:
+        queued = db.execute(select(NotificationOutbox.event_id).where(NotificationOutbox.event_id.in_(ids))).scalars()
+        assert sorted(queued) == sorted(ids)
+    finally:
+        db.close()
+
+
+def test_batch_delete(client):
+    created = client.post("/events:batch", json=[{"name": "Batch Del 1"}, {"name": "Batch Del 2"}]).json()["results"]
+    ids = [r["id"] for r in created]
+
+    res = client.request("DELETE", "/events:batch", json={"ids": ids + [999999]})
+    assert res.status_code == 200
+    assert [r["status"] for r in res.json()["results"]] == [204, 204, 404]
+    for ev_id in ids:
+        assert client.get(f"/events/{ev_id}").status_code == 404
@@ -0,0 +1,157 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import update
+
+from event_service.core.config import settings
+from event_service.database import SessionLocal
+from event_service.models.event import Event
+from event_service.services.cache import EventCache, LRUCache, RedisCache, build_event_cache, event_cache
+
+
+def _create(client, **fields) -> dict:
+    payload = {"name": "Cached", "location": "Room 1"}
+    payload.update(fields)
+    res = client.post("/events", json=payload)
+    assert res.status_code == 201
+    return res.json()
+
+
+def _rename_behind_cache(event_id: int, name: str) -> None:
+    db = SessionLocal()
+    try:
+        db.execute(update(Event).where(Event.id == event_id).values(name=name))
+        db.commit()
+    finally:
+        db.close()
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    event_cache.reset_stats()
+    yield
+
+
+def test_second_read_is_served_from_cache(client):
+    created = _create(client)
+    first = client.get(f"/events/{created['id']}")
+    # a change that bypasses the API is not visible until the entry is invalidated
+    _rename_behind_cache(created["id"], "Changed behind the cache")
+    second = client.get(f"/events/{created['id']}")
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json() == created
+    stats = client.get("/metrics/cache").json()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_update_invalidates_cached_event(client):
+    created = _create(client)
+    client.get(f"/events/{created['id']}")
+
+    res = client.put(f"/events/{created['id']}", json={"description": "updated"})
+    assert res.status_code == 200
+    assert client.get(f"/events/{created['id']}").json()["description"] == "updated"
+
+
+def test_cached_hit_revalidates_and_bad_entries_fall_back_to_the_database(client):
+    created = _create(client)
+    etag = client.get(f"/events/{created['id']}").headers["ETag"]
+    assert client.get(f"/events/{created['id']}", headers={"If-None-Match": etag}).status_code == 304
+
+    event_cache.backend.set(event_cache._key(created["id"]), b"not a cache entry", event_cache.ttl)
+    res = client.get(f"/events/{created['id']}")
+    assert res.status_code == 200 and res.json() == created
+    assert client.get("/metrics/cache").json()["errors"] == 1
+
+
+def test_delete_invalidates_cached_event(client):
+    created = _create(client)
+    client.get(f"/events/{created['id']}")
+
+    assert client.delete(f"/events/{created['id']}").status_code == 204
+    assert client.get(f"/events/{created['id']}").status_code == 404
+
+
+def test_batch_writes_invalidate_cached_events(client):
+    created = _create(client)
+    client.get(f"/events/{created['id']}")
+
+    res = client.patch("/events:batch", json=[{"id": created["id"], "description": "batched"}])
+    assert res.status_code == 200
+    assert client.get(f"/events/{created['id']}").json()["description"] == "batched"
+
+    res = client.request("DELETE", "/events:batch", json={"ids": [created["id"]]})
+    assert res.status_code == 200
+    assert client.get(f"/events/{created['id']}").status_code == 404
+
+
+def test_missing_events_are_not_cached(client):
+    assert client.get("/events/987654321").status_code == 404
+    assert client.get("/events/987654321").status_code == 404
+    assert client.get("/metrics/cache").json()["hits"] == 0
+
+
+def test_lru_evicts_least_recently_used_and_expires_entries():
+    now = SimpleNamespace(t=0.0)
+    lru = LRUCache(max_entries=2, clock=lambda: now.t)
+    lru.set("a", b"1", ttl=10)
+    lru.set("b", b"2", ttl=10)
+    assert lru.get("a") == b"1"
+    lru.set("c", b"3", ttl=10)
+
+    assert lru.get("b") is None
+    assert lru.evictions == 1
+    now.t = 10.0
+    assert lru.get("a") is None
+    assert len(lru) == 1
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the redis-py calls RedisCache makes."""
+
+    def __init__(self):
+        self.data = {}
+        self.down = False
+
+    def get(self, key):
+        if self.down:
+            raise ConnectionError("redis unavailable")
+        return self.data.get(key)
+
+    def set(self, key, value, px=None):
+        self.data[key] = value
+        self.expiry_ms = px
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+def test_redis_backend_roundtrip_and_errors_fall_back_to_misses():
+    client = FakeRedis()
+    cache = EventCache(RedisCache(client, prefix="test:"), ttl=0.5)
+
+    stamp = datetime(2030, 1, 2, 3, 4, 5, 678000)
+    cache.set(7, b'{"id": 7}', stamp)
+    assert client.data == {"test:event:7": b'2030-01-02T03:04:05.678000\n{"id": 7}'}
+    assert client.expiry_ms == 500
+    assert cache.get(7) == (stamp, b'{"id": 7}')
+
+    cache.invalidate(7)
+    assert cache.get(7) is None
+
+    client.down = True
+    assert cache.get(7) is None
+    stats = cache.snapshot()
+    assert (stats["hits"], stats["misses"], stats["errors"]) == (1, 2, 1)
+
+
+def test_redis_backend_is_rejected_in_async_mode():
+    redis_async = settings.model_copy(
+        update={"EVENT_CACHE_BACKEND": "redis", "EVENT_CACHE_REDIS_URL": "redis://localhost", "DATABASE_ASYNC": True}
+    )
+    with pytest.raises(ValueError, match="not supported with DATABASE_ASYNC"):
+        build_event_cache(redis_async)
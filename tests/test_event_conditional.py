@@ -0,0 +1,114 @@
+import uuid
+
+from sqlalchemy import event as sa_event
+
+from event_service.database import engine
+from event_service.services.cache import event_cache
+
+
+def _create(client, **fields) -> dict:
+    payload = {"name": "Conditional", "location": f"loc-{uuid.uuid4().hex}"}
+    payload.update(fields)
+    res = client.post("/events", json=payload)
+    assert res.status_code == 201
+    return res.json()
+
+
+class _CapturedSQL:
+    def __init__(self):
+        self.statements = []
+
+    def __enter__(self):
+        sa_event.listen(engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc):
+        sa_event.remove(engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+
+def test_get_event_returns_validators_and_304(client):
+    ev = _create(client)
+    res = client.get(f"/events/{ev['id']}")
+    etag = res.headers["ETag"]
+    assert etag.startswith('"') and not etag.startswith("W/")
+    assert res.headers["Last-Modified"].endswith("GMT")
+
+    res = client.get(f"/events/{ev['id']}", headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    assert res.content == b""
+    assert res.headers["ETag"] == etag
+
+    res = client.get(f"/events/{ev['id']}", headers={"If-None-Match": '"other", W/' + etag})
+    assert res.status_code == 304
+
+    res = client.get(f"/events/{ev['id']}", headers={"If-Modified-Since": res.headers["Last-Modified"]})
+    assert res.status_code == 304
+
+
+def test_get_event_revalidates_without_loading_the_row(client):
+    ev = _create(client, description="x" * 1000)
+    etag = client.get(f"/events/{ev['id']}").headers["ETag"]
+    event_cache.invalidate(ev["id"])
+
+    with _CapturedSQL() as captured:
+        res = client.get(f"/events/{ev['id']}", headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    assert len(captured.statements) == 1
+    assert "description" not in captured.statements[0]
+
+
+def test_etag_changes_after_update(client):
+    ev = _create(client)
+    etag = client.get(f"/events/{ev['id']}").headers["ETag"]
+
+    res = client.put(f"/events/{ev['id']}", json={"description": "changed"})
+    assert res.headers["ETag"] != etag
+
+    res = client.get(f"/events/{ev['id']}", headers={"If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.json()["description"] == "changed"
+
+
+def test_put_honours_if_match(client):
+    ev = _create(client)
+    etag = client.get(f"/events/{ev['id']}").headers["ETag"]
+
+    res = client.put(f"/events/{ev['id']}", json={"description": "first"}, headers={"If-Match": etag})
+    assert res.status_code == 200
+    new_etag = res.headers["ETag"]
+
+    # a second writer still holding the old ETag loses
+    res = client.put(f"/events/{ev['id']}", json={"description": "second"}, headers={"If-Match": etag})
+    assert res.status_code == 412
+    assert client.get(f"/events/{ev['id']}").json()["description"] == "first"
+
+    res = client.put(f"/events/{ev['id']}", json={"description": "second"}, headers={"If-Match": new_etag})
+    assert res.status_code == 200
+    assert client.put(f"/events/{ev['id']}", json={"name": "any"}, headers={"If-Match": "*"}).status_code == 200
+
+
+def test_list_events_etag_and_304(client):
+    location = f"loc-{uuid.uuid4().hex}"
+    first = _create(client, location=location)
+    second = _create(client, location=location)
+
+    res = client.get("/events", params={"location": location, "limit": 1})
+    etag = res.headers["ETag"]
+    cursor = res.headers["X-Next-Cursor"]
+    assert [item["id"] for item in res.json()] == [first["id"]]
+
+    with _CapturedSQL() as captured:
+        res = client.get("/events", params={"location": location, "limit": 1}, headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    assert res.headers["X-Next-Cursor"] == cursor
+    assert len(captured.statements) == 1
+    assert "events.name" not in captured.statements[0]
+
+    # changing a row on the page, or the row that decides the next page, changes the ETag
+    client.put(f"/events/{second['id']}", json={"description": "changed"})
+    res = client.get("/events", params={"location": location, "limit": 1}, headers={"If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.headers["ETag"] != etag
@@ -0,0 +1,67 @@
+import csv
+import io
+import json
+import uuid
+
+from event_service.api.event_export import EXPORT_COLUMNS, iter_export
+from event_service.api.filters import EventFilters
+
+
+def _seed(client, count: int) -> tuple[str, list]:
+    location = f"export-{uuid.uuid4().hex}"
+    created = []
+    for i in range(count):
+        res = client.post(
+            "/events",
+            json={
+                "name": f"Export {i}",
+                "description": 'with "quotes", commas\nand newlines' if i == 0 else None,
+                "start_time": "2025-10-01T10:00:00",
+                "location": location,
+                "participants": [f"p{i}@example.com", "shared@example.com"],
+            },
+        )
+        assert res.status_code == 201
+        created.append(res.json())
+    return location, created
+
+
+def test_export_ndjson_matches_event_responses(client):
+    location, created = _seed(client, 3)
+
+    res = client.get("/events/export", params={"format": "ndjson", "location": location})
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("application/x-ndjson")
+    assert 'filename="events.ndjson"' in res.headers["content-disposition"]
+
+    lines = res.text.splitlines()
+    assert [json.loads(line) for line in lines] == created
+
+
+def test_export_csv(client):
+    location, created = _seed(client, 2)
+
+    res = client.get("/events/export", params={"format": "csv", "location": location})
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(res.text)))
+    assert [int(row["id"]) for row in rows] == [ev["id"] for ev in created]
+    assert rows[0]["description"] == created[0]["description"]
+    assert json.loads(rows[1]["participants"]) == created[1]["participants"]
+    assert rows[1]["description"] == ""
+    assert list(rows[0]) == list(EXPORT_COLUMNS)
+
+
+def test_export_is_produced_one_partition_at_a_time(client):
+    location, created = _seed(client, 5)
+
+    chunks = iter_export("ndjson", EventFilters(location=location), batch_size=2)
+    first = next(chunks)
+    assert len(first.splitlines()) == 2
+    rest = list(chunks)
+    assert [len(chunk.splitlines()) for chunk in rest] == [2, 1]
+
+
+def test_export_rejects_unknown_format(client):
+    assert client.get("/events/export", params={"format": "xml"}).status_code == 422
@@ -0,0 +1,105 @@
+import uuid
+
+from sqlalchemy import event as sa_event
+
+from event_service.database import engine
+from event_service.services.cache import event_cache
+
+
+def _create(client, **fields) -> dict:
+    payload = {
+        "name": "Sparse",
+        "description": "d" * 500,
+        "location": f"loc-{uuid.uuid4().hex}",
+        "participants": ["a@example.com", "b@example.com"],
+        "start_time": "2030-01-01T10:00:00",
+        "end_time": "2030-01-01T11:00:00",
+    }
+    payload.update(fields)
+    res = client.post("/events", json=payload)
+    assert res.status_code == 201
+    return res.json()
+
+
+class _CapturedSQL:
+    def __init__(self):
+        self.statements = []
+
+    def __enter__(self):
+        sa_event.listen(engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc):
+        sa_event.remove(engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+
+def test_list_events_projects_fields_in_sql_and_payload(client):
+    location = f"loc-{uuid.uuid4().hex}"
+    first = _create(client, location=location)
+    second = _create(client, location=location)
+
+    with _CapturedSQL() as captured:
+        res = client.get(
+            "/events", params={"location": location, "limit": 1, "fields": "name,id,start_time,end_time"}
+        )
+    assert res.status_code == 200
+    # keys come back in EventResponse order, whatever order was asked for
+    assert res.json() == [
+        {"name": "Sparse", "start_time": first["start_time"], "end_time": first["end_time"], "id": first["id"]}
+    ]
+    assert "description" not in captured.statements[0]
+    assert "participants" not in captured.statements[0]
+
+    res = client.get(
+        "/events",
+        params={"location": location, "fields": "id", "cursor": res.headers["X-Next-Cursor"]},
+    )
+    assert res.json() == [{"id": second["id"]}]
+
+
+def test_get_event_fields(client):
+    ev = _create(client)
+    event_cache.invalidate(ev["id"])
+
+    with _CapturedSQL() as captured:
+        res = client.get(f"/events/{ev['id']}", params={"fields": "id,name"})
+    assert res.json() == {"name": "Sparse", "id": ev["id"]}
+    assert "description" not in captured.statements[0]
+
+    # projections are cut from a cached full body without touching the database
+    full = client.get(f"/events/{ev['id']}").json()
+    with _CapturedSQL() as captured:
+        res = client.get(f"/events/{ev['id']}", params={"fields": "participants,updated_at"})
+    assert captured.statements == []
+    assert res.json() == {"participants": full["participants"], "updated_at": full["updated_at"]}
+
+
+def test_fields_have_their_own_etag(client):
+    ev = _create(client)
+    full_etag = client.get(f"/events/{ev['id']}").headers["ETag"]
+    res = client.get(f"/events/{ev['id']}", params={"fields": "id,name"})
+    etag = res.headers["ETag"]
+    assert etag != full_etag
+
+    res = client.get(f"/events/{ev['id']}", params={"fields": "name,id"}, headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    res = client.get(f"/events/{ev['id']}", headers={"If-None-Match": etag})
+    assert res.status_code == 200
+
+
+def test_unknown_fields_are_rejected(client):
+    ev = _create(client)
+    res = client.get(f"/events/{ev['id']}", params={"fields": "name,secret"})
+    assert res.status_code == 400
+    assert res.json()["detail"] == "Unknown field(s): secret"
+    assert client.get("/events", params={"fields": "bogus"}).status_code == 400
+
+
+def test_participant_events_accept_fields(client):
+    email = f"{uuid.uuid4().hex}@example.com"
+    ev = _create(client, participants=[email])
+    res = client.get(f"/participants/{email}/events", params={"fields": "id,location"})
+    assert res.json() == [{"location": ev["location"], "id": ev["id"]}]
@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from event_service.database import Base
+from event_service.api.filters import EventFilters
+from event_service.models.event import Event
+
+
+def _create(client, name: str, **fields) -> dict:
+    res = client.post("/events", json={"name": name, **fields})
+    assert res.status_code == 201
+    return res.json()
+
+
+def _names(res) -> set:
+    assert res.status_code == 200
+    return {item["name"] for item in res.json()}
+
+
+def test_time_window_filters(client):
+    _create(client, "Window Early", start_time="2031-03-01T09:00:00", end_time="2031-03-01T10:00:00")
+    _create(client, "Window Inside", start_time="2031-03-05T09:00:00", end_time="2031-03-05T10:00:00")
+    _create(client, "Window Late", start_time="2031-03-20T09:00:00", end_time="2031-03-20T10:00:00")
+
+    res = client.get("/events", params={"starts_after": "2031-03-02T00:00:00", "ends_before": "2031-03-10T00:00:00"})
+    names = _names(res)
+    assert "Window Inside" in names
+    assert "Window Early" not in names
+    assert "Window Late" not in names
+
+
+def test_aware_filter_values_are_compared_in_utc(client):
+    _create(client, "Window Aware", start_time="2031-04-01T12:00:00", end_time="2031-04-01T13:00:00")
+
+    # 13:30+02:00 is 11:30 UTC, so the event starting at 12:00 matches
+    res = client.get("/events", params={"starts_after": "2031-04-01T13:30:00+02:00"})
+    assert "Window Aware" in _names(res)
+
+
+def test_location_filter(client):
+    _create(client, "Located A", location="Filter Hall A")
+    _create(client, "Located B", location="Filter Hall B")
+
+    names = _names(client.get("/events", params={"location": "Filter Hall A"}))
+    assert names == {"Located A"}
+
+
+def test_updated_since_filter(client):
+    before = datetime.now(timezone.utc) - timedelta(seconds=1)
+    created = _create(client, "Recently Updated")
+    future = datetime.now(timezone.utc) + timedelta(days=1)
+
+    assert "Recently Updated" in _names(client.get("/events", params={"updated_since": before.isoformat()}))
+    assert created["name"] not in _names(client.get("/events", params={"updated_since": future.isoformat()}))
+
+
+def test_filters_use_indexes_on_sqlite():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    stmt = EventFilters(starts_after=datetime(2031, 1, 1), location="Room").apply(select(Event.id))
+    compiled = stmt.compile(engine, compile_kwargs={"literal_binds": True})
+    with engine.connect() as conn:
+        plan = " ".join(str(row[-1]) for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}"))
+    assert "USING INDEX ix_events_location_start_time" in plan or "USING COVERING INDEX ix_events_location_start_time" in plan
@@ -0,0 +1,117 @@
+import json
+import uuid
+
+from sqlalchemy import delete
+
+from event_service.api.event_import import _copy_cell
+from event_service.core.config import settings
+from event_service.database import SessionLocal
+from event_service.models.event import Event
+
+
+def _listed(client, location: str) -> list:
+    res = client.get("/events", params={"location": location})
+    assert res.status_code == 200
+    return res.json()
+
+
+def test_import_ndjson_reports_bad_lines(client):
+    location = f"import-{uuid.uuid4().hex}"
+    lines = [
+        json.dumps({"name": "One", "location": location, "participants": ["a@example.com"]}),
+        "",
+        json.dumps({"location": location}),
+        "{not json",
+        json.dumps({"name": "Two", "location": location, "start_time": "2025-10-01T12:00:00+02:00"}),
+    ]
+    res = client.post("/events/import", content="\n".join(lines), headers={"Content-Type": "application/x-ndjson"})
+    assert res.status_code == 200
+    summary = res.json()
+    assert (summary["received"], summary["inserted"], summary["failed"]) == (4, 2, 2)
+    assert [err["line"] for err in summary["errors"]] == [3, 4]
+    assert "name" in summary["errors"][0]["error"]
+    assert summary["errors"][1]["error"].startswith("Invalid JSON")
+
+    events = _listed(client, location)
+    assert [ev["name"] for ev in events] == ["One", "Two"]
+    assert events[0]["participants"] == ["a@example.com"]
+    # aware datetimes are stored as naive UTC
+    assert events[1]["start_time"] == "2025-10-01T10:00:00"
+    assert events[0]["created_at"] is not None
+
+
+def test_import_csv_with_quoted_newlines_and_participant_lists(client):
+    location = f"import-{uuid.uuid4().hex}"
+    body = (
+        "name,description,location,participants\r\n"
+        f'Planning,"multi\nline, ""quoted""",{location},"[""a@example.com"", ""b@example.com""]"\r\n'
+        f"Retro,,{location},c@example.com; d@example.com\r\n"
+        f",missing name,{location},\r\n"
+    )
+    res = client.post("/events/import", content=body.encode(), headers={"Content-Type": "text/csv"})
+    summary = res.json()
+    assert (summary["received"], summary["inserted"], summary["failed"]) == (3, 2, 1)
+    assert summary["errors"][0]["line"] == 5
+
+    events = _listed(client, location)
+    assert events[0]["description"] == 'multi\nline, "quoted"'
+    assert events[0]["participants"] == ["a@example.com", "b@example.com"]
+    assert events[1]["description"] is None
+    assert events[1]["participants"] == ["c@example.com", "d@example.com"]
+
+
+def test_import_streams_in_chunks_and_round_trips_export(client, monkeypatch):
+    source = f"import-src-{uuid.uuid4().hex}"
+    for i in range(5):
+        client.post("/events", json={"name": f"Src {i}", "location": source, "participants": [f"p{i}@example.com"]})
+    exported = client.get("/events/export", params={"format": "ndjson", "location": source}).content
+
+    monkeypatch.setattr(settings, "EVENTS_IMPORT_CHUNK_SIZE", 2)
+
+    def body():
+        # arbitrary byte boundaries, including inside lines
+        for i in range(0, len(exported), 7):
+            yield exported[i : i + 7]
+
+    res = client.post("/events/import", params={"format": "ndjson"}, content=body())
+    assert res.json()["inserted"] == 5
+
+    imported = client.get("/events", params={"location": source}).json()
+    assert len(imported) == 10
+    originals, copies = imported[:5], imported[5:]
+    for original, copy in zip(originals, copies):
+        assert copy["id"] != original["id"]
+        assert (copy["name"], copy["participants"]) == (original["name"], original["participants"])
+
+
+def test_import_caps_reported_errors(client, monkeypatch):
+    monkeypatch.setattr(settings, "EVENTS_IMPORT_MAX_ERRORS", 2)
+    res = client.post("/events/import", params={"format": "ndjson"}, content="{}\n{}\n{}\n")
+    summary = res.json()
+    assert summary["failed"] == 3
+    assert len(summary["errors"]) == 2
+    assert summary["errors_truncated"] is True
+
+
+def test_copy_cells_encode_nulls_arrays_and_quotes():
+    assert _copy_cell(None) == ""
+    assert _copy_cell("") == '""'
+    assert _copy_cell('say "hi"') == '"say ""hi"""'
+    assert _copy_cell(['a@x.com', 'q"uote']) == '"{""a@x.com"",""q\\""uote""}"'
+
+
+def test_import_invalidates_cached_entries_of_inserted_ids(client):
+    # A row deleted outside the API leaves its cache entry behind, and SQLite reuses its id
+    created = client.post("/events", json={"name": "Deleted behind the cache"}).json()
+    assert client.get(f"/events/{created['id']}").status_code == 200
+    db = SessionLocal()
+    try:
+        db.execute(delete(Event).where(Event.id == created["id"]))
+        db.commit()
+    finally:
+        db.close()
+
+    line = json.dumps({"name": "Imported"})
+    res = client.post("/events/import", content=line, headers={"Content-Type": "application/x-ndjson"})
+    assert res.json()["inserted"] == 1
+    assert client.get(f"/events/{created['id']}").json()["name"] == "Imported"
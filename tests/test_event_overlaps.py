@@ -0,0 +1,180 @@
+import random
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from event_service.api.event_overlaps import overlapping_events
+from event_service.database import SessionLocal
+from event_service.models.event import Event
+from event_service.services.intervals import IntervalTree
+
+
+def _window() -> datetime:
+    # A day no other test schedules anything on
+    return datetime(2200, 1, 1) + timedelta(days=uuid.uuid4().int % 100000)
+
+
+def _create(client, base: datetime, start_h: float, end_h: float, **fields) -> dict:
+    payload = {
+        "name": fields.pop("name", "Slot"),
+        "start_time": (base + timedelta(hours=start_h)).isoformat(),
+        "end_time": (base + timedelta(hours=end_h)).isoformat(),
+        **fields,
+    }
+    res = client.post("/events", json=payload)
+    assert res.status_code == 201
+    return res.json()
+
+
+def _overlaps(client, base: datetime, start_h: float, end_h: float, **params) -> list:
+    params.update(start=(base + timedelta(hours=start_h)).isoformat(), end=(base + timedelta(hours=end_h)).isoformat())
+    res = client.get("/events/overlaps", params=params)
+    assert res.status_code == 200
+    return [e["id"] for e in res.json()]
+
+
+def test_interval_tree_matches_brute_force():
+    rng = random.Random(7)
+    tree, expected = IntervalTree(), {}
+    for step in range(3000):
+        key = rng.randrange(200)
+        if rng.random() < 0.7:
+            start = rng.randrange(1000)
+            end = start + rng.randrange(-5, 50)
+            tree.add(key, start, end)
+            if end > start:
+                expected[key] = (start, end)
+            else:
+                expected.pop(key, None)
+        else:
+            tree.discard(key)
+            expected.pop(key, None)
+        if step % 25 == 0:
+            lo = rng.randrange(1000)
+            hi = lo + rng.randrange(1, 80)
+            brute = sorted((s, k) for k, (s, e) in expected.items() if s < hi and e > lo)
+            assert tree.overlapping(lo, hi) == [k for _, k in brute]
+
+    bulk = IntervalTree.from_intervals((k, s, e) for k, (s, e) in expected.items())
+    assert len(bulk) == len(tree) and bulk.overlapping(0, 2000) == tree.overlapping(0, 2000)
+
+
+def test_overlaps_window_is_half_open(client):
+    base = _window()
+    morning = _create(client, base, 9, 11)["id"]
+    noon = _create(client, base, 10.5, 13)["id"]
+    evening = _create(client, base, 18, 20)["id"]
+    _create(client, base, 12, 12)  # zero-length events overlap nothing
+
+    assert _overlaps(client, base, 10, 11) == [morning, noon]
+    assert _overlaps(client, base, 11, 12) == [noon]  # morning ends exactly at 11
+    assert _overlaps(client, base, 13, 18) == []
+    assert _overlaps(client, base, 0, 24) == [morning, noon, evening]
+    assert _overlaps(client, base, 0, 24, limit=2) == [morning, noon]
+    day = {"start": base.isoformat(), "end": (base + timedelta(days=1)).isoformat()}
+    cursor = client.get("/events/overlaps", params={**day, "limit": 2}).headers["X-Next-Cursor"]
+    assert _overlaps(client, base, 0, 24, cursor=cursor) == [evening]
+
+
+def test_overlaps_by_participant_and_after_writes(client):
+    base = _window()
+    alice = f"alice-{uuid.uuid4().hex}@example.com"
+    mine = _create(client, base, 9, 10, participants=[alice])["id"]
+    other = _create(client, base, 9, 10, participants=["bob@example.com"])["id"]
+    assert _overlaps(client, base, 9, 10, participant=alice) == [mine]
+
+    # Moved to the afternoon
+    moved = {"start_time": (base + timedelta(hours=15)).isoformat(), "end_time": (base + timedelta(hours=16)).isoformat()}
+    assert client.patch(f"/events/{mine}", json=moved).status_code == 200
+    assert _overlaps(client, base, 9, 10) == [other]
+    assert _overlaps(client, base, 15.5, 15.6, participant=alice) == [mine]
+
+    assert client.delete(f"/events/{other}").status_code == 204
+    assert _overlaps(client, base, 0, 24) == [mine]
+
+
+def test_overlaps_sees_rows_written_outside_the_api(client):
+    base = _window()
+    _overlaps(client, base, 0, 24)  # the index is synced before this insert
+    db: Session = SessionLocal()
+    try:
+        stmt = insert(Event).values(name="Direct", start_time=base, end_time=base + timedelta(hours=1))
+        row_id = db.execute(stmt.returning(Event.id)).scalar_one()
+        db.commit()
+    finally:
+        db.close()
+    assert _overlaps(client, base, 0, 24) == [row_id]
+
+
+def test_create_with_check_conflicts(client):
+    base = _window()
+    carol = f"carol-{uuid.uuid4().hex}@example.com"
+    existing = _create(client, base, 9, 11, participants=[carol, "dave@example.com"])
+
+    payload = {
+        "name": "Clash",
+        "start_time": (base + timedelta(hours=10)).isoformat(),
+        "end_time": (base + timedelta(hours=12)).isoformat(),
+        "participants": ["erin@example.com", carol],
+    }
+    res = client.post("/events", params={"check_conflicts": "true"}, json=payload)
+    assert res.status_code == 409
+    body = res.json()
+    assert body["detail"] == "Event overlaps existing events of its participants"
+    assert body["conflicts"] == [existing]
+    assert _overlaps(client, base, 0, 24) == [existing["id"]]
+
+    # Without the flag, back to back, or with no shared participant, it is created
+    assert client.post("/events", json=payload).status_code == 201
+    back_to_back = dict(
+        payload, start_time=(base + timedelta(hours=12)).isoformat(), end_time=(base + timedelta(hours=13)).isoformat()
+    )
+    assert client.post("/events", params={"check_conflicts": "true"}, json=back_to_back).status_code == 201
+    stranger = dict(payload, participants=[f"frank-{uuid.uuid4().hex}@example.com"])
+    assert client.post("/events", params={"check_conflicts": "true"}, json=stranger).status_code == 201
+
+
+def test_offset_timestamps_are_compared_in_utc(client):
+    base = _window()
+    grace = f"grace-{uuid.uuid4().hex}@example.com"
+    # 09:00-10:00 at UTC-05:00 is 14:00-15:00 UTC
+    offset = {"start_time": f"{base.date()}T09:00:00-05:00", "end_time": f"{base.date()}T10:00:00-05:00"}
+    existing = client.post("/events", json={"name": "Offset", "participants": [grace], **offset}).json()
+
+    assert _overlaps(client, base, 14.5, 14.6) == [existing["id"]]
+    assert _overlaps(client, base, 9, 10) == []
+    res = client.get("/events/overlaps", params={"start": f"{base.date()}T16:30:00+02:00", "end": f"{base.date()}T17:00:00+02:00"})
+    assert [e["id"] for e in res.json()] == [existing["id"]]
+
+    # 15:30-16:00 at UTC+01:00 is 14:30-15:00 UTC, which clashes; its wall-clock time does not
+    clash = {"start_time": f"{base.date()}T15:30:00+01:00", "end_time": f"{base.date()}T16:00:00+01:00"}
+    res = client.post("/events", params={"check_conflicts": "true"}, json={"name": "Clash", "participants": [grace], **clash})
+    assert res.status_code == 409 and res.json()["conflicts"] == [existing]
+    later = {"start_time": f"{base.date()}T09:00:00-06:00", "end_time": f"{base.date()}T10:00:00-06:00"}
+    res = client.post("/events", params={"check_conflicts": "true"}, json={"name": "Later", "participants": [grace], **later})
+    assert res.status_code == 201
+
+
+def test_overlaps_rejects_empty_windows(client):
+    base = _window()
+    res = client.get("/events/overlaps", params={"start": base.isoformat(), "end": base.isoformat()})
+    assert res.status_code == 400 and res.json() == {"detail": "end must be after start"}
+    assert client.get("/events/overlaps", params={"start": base.isoformat()}).status_code == 422
+
+
+def test_postgres_overlap_uses_the_range_column():
+    class _Bind:
+        dialect = postgresql.dialect()
+
+    class _Db:
+        def get_bind(self):
+            return _Bind()
+
+    start = datetime(2030, 1, 1, 9)
+    stmt = overlapping_events(_Db(), start, start + timedelta(hours=1), ["a@example.com"])
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "events.time_range && tsrange(" in sql
+    assert "events.participants && CAST(" in sql
@@ -0,0 +1,59 @@
+from event_service.api.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from event_service.core.config import settings
+
+
+def _create(client, name: str) -> int:
+    res = client.post("/events", json={"name": name})
+    assert res.status_code == 201
+    return res.json()["id"]
+
+
+def test_cursor_round_trip():
+    token = encode_cursor(42)
+    assert "42" not in token
+    assert decode_cursor(token) == 42
+
+
+def test_list_events_pages_follow_cursor(client):
+    created = [_create(client, f"Page Event {i}") for i in range(5)]
+
+    # start just before our events so the walk is independent of earlier rows
+    cursor = encode_cursor(created[0] - 1)
+    seen = []
+    pages = 0
+    while cursor is not None:
+        res = client.get("/events", params={"limit": 2, "cursor": cursor})
+        assert res.status_code == 200
+        page = res.json()
+        assert len(page) <= 2
+        seen.extend(item["id"] for item in page)
+        cursor = res.headers.get(NEXT_CURSOR_HEADER)
+        pages += 1
+
+    assert seen == sorted(seen)
+    assert seen[: len(created)] == created
+    assert pages >= 3
+
+
+def test_list_events_last_page_has_no_cursor(client):
+    last_id = _create(client, "Last Page Event")
+    res = client.get("/events", params={"cursor": encode_cursor(last_id - 1)})
+    assert res.status_code == 200
+    assert [item["id"] for item in res.json()] == [last_id]
+    assert NEXT_CURSOR_HEADER not in res.headers
+
+
+def test_list_events_limit_is_clamped(client):
+    res = client.get("/events", params={"limit": settings.EVENTS_PAGE_SIZE_MAX + 1000})
+    assert res.status_code == 200
+    assert len(res.json()) <= settings.EVENTS_PAGE_SIZE_MAX
+
+
+def test_list_events_invalid_cursor_400(client):
+    res = client.get("/events", params={"cursor": "not-a-cursor"})
+    assert res.status_code == 400
+
+
+def test_list_events_invalid_limit_422(client):
+    res = client.get("/events", params={"limit": 0})
+    assert res.status_code == 422
@@ -0,0 +1,155 @@
+from unittest.mock import MagicMock
+
+from sqlalchemy import event as sa_event, func, select
+
+from event_service.api import event as event_module
+from event_service.database import SessionLocal, engine
+from event_service.models.notification import NotificationOutbox
+from event_service.schemas.event import EventPatch
+
+
+def _create(client) -> dict:
+    res = client.post(
+        "/events",
+        json={
+            "name": "Patch Me",
+            "description": "original",
+            "location": "Room 1",
+            "start_time": "2030-01-01T10:00:00",
+            "participants": ["alice@example.com", "bob@example.com"],
+        },
+    )
+    assert res.status_code == 201
+    return res.json()
+
+
+def _outbox_count(event_id: int) -> int:
+    db = SessionLocal()
+    try:
+        return db.execute(select(func.count()).where(NotificationOutbox.event_id == event_id)).scalar_one()
+    finally:
+        db.close()
+
+
+def _patch(event_id: int, **fields):
+    background_tasks = MagicMock()
+    db = SessionLocal()
+    try:
+        res = event_module.patch_event(event_id, EventPatch(**fields), background_tasks, db=db)
+    finally:
+        db.close()
+    return res, background_tasks
+
+
+def test_patch_updates_only_given_fields_in_one_update(client):
+    ev = _create(client)
+    client.get(f"/events/{ev['id']}")  # warm the cache
+
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    sa_event.listen(engine, "before_cursor_execute", _record)
+    try:
+        res = client.patch(f"/events/{ev['id']}", json={"name": "Patched"})
+    finally:
+        sa_event.remove(engine, "before_cursor_execute", _record)
+
+    assert res.status_code == 200
+    body = res.json()
+    assert body["name"] == "Patched"
+    assert body["description"] == "original"
+    assert body["participants"] == ev["participants"]
+    assert body["updated_at"] > ev["updated_at"]
+    assert res.headers["ETag"]
+    # a narrow SELECT of the notification fields, then UPDATE ... RETURNING; no refresh
+    assert len(statements) == 2
+    assert statements[1].startswith("UPDATE") and "RETURNING" in statements[1]
+
+    assert client.get(f"/events/{ev['id']}").json() == body
+
+
+def test_patch_queues_notification_only_for_relevant_changes(client):
+    ev = _create(client)
+
+    _, background_tasks = _patch(ev["id"], description="new text")
+    assert _outbox_count(ev["id"]) == 0
+
+    _, background_tasks = _patch(ev["id"], participants=["bob@example.com", "alice@example.com"])
+    assert _outbox_count(ev["id"]) == 0
+
+    res, background_tasks = _patch(ev["id"], location="Room 2")
+    assert res.status_code == 200
+    assert _outbox_count(ev["id"]) == 1
+    assert background_tasks.add_task.call_count == 1
+
+
+def test_patch_with_expected_version(client):
+    ev = _create(client)
+
+    res = client.patch(f"/events/{ev['id']}", json={"name": "First", "expected_updated_at": ev["updated_at"]})
+    assert res.status_code == 200
+
+    # a second writer still holding the old version loses
+    res = client.patch(f"/events/{ev['id']}", json={"name": "Second", "expected_updated_at": ev["updated_at"]})
+    assert res.status_code == 409
+    assert res.json()["detail"] == "Event has been modified"
+    assert client.get(f"/events/{ev['id']}").json()["name"] == "First"
+
+
+def test_patch_missing_event_and_aware_datetimes(client):
+    res = client.patch("/events/999999999", json={"name": "Nobody"})
+    assert res.status_code == 404
+
+    ev = _create(client)
+    res = client.patch(f"/events/{ev['id']}", json={"start_time": "2030-01-01T10:00:00+02:00"})
+    assert res.json()["start_time"] == "2030-01-01T08:00:00"
+
+
+def test_patch_null_clears_nullable_fields(client):
+    ev = _create(client)
+    res = client.patch(f"/events/{ev['id']}", json={"description": None, "participants": None})
+    assert res.status_code == 200
+    body = res.json()
+    assert body["description"] is None and body["participants"] is None
+    assert body["location"] == "Room 1"
+
+    res = client.patch(f"/events/{ev['id']}", json={"name": None})
+    assert res.status_code == 400 and res.json() == {"detail": "name cannot be null"}
+
+
+def _patch_with_a_write_in_between(client, event_id, body):
+    pending = [event_id]
+
+    def _concurrent_write(conn, cursor, statement, *args):
+        # Another write lands between the PATCH's read and its UPDATE
+        if statement.startswith("UPDATE events") and pending:
+            cursor.execute(
+                "UPDATE events SET location = 'Elsewhere', updated_at = '2031-01-01 00:00:00.000000' WHERE id = ?",
+                (pending.pop(),),
+            )
+
+    sa_event.listen(engine, "before_cursor_execute", _concurrent_write)
+    try:
+        return client.patch(f"/events/{event_id}", json=body)
+    finally:
+        sa_event.remove(engine, "before_cursor_execute", _concurrent_write)
+
+
+def test_patch_retries_after_a_write_between_its_read_and_update(client):
+    ev = _create(client)
+    res = _patch_with_a_write_in_between(client, ev["id"], {"name": "Late"})
+    assert res.status_code == 200
+    body = client.get(f"/events/{ev['id']}").json()
+    assert body["name"] == "Late"
+    assert body["location"] == "Elsewhere"
+
+
+def test_patch_with_expected_version_loses_to_a_write_between_its_read_and_update(client):
+    ev = _create(client)
+    res = _patch_with_a_write_in_between(
+        client, ev["id"], {"name": "Late", "expected_updated_at": ev["updated_at"]}
+    )
+    assert res.status_code == 409
+    assert client.get(f"/events/{ev['id']}").json()["name"] == "Patch Me"
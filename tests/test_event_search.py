@@ -0,0 +1,85 @@
+import uuid
+
+from sqlalchemy.dialects import postgresql
+
+from event_service.api.event_search import _postgres_search
+
+
+def _word() -> str:
+    # A token no other test uses, so results only contain this test's events
+    return f"kw{uuid.uuid4().hex[:12]}"
+
+
+def _create(client, **fields) -> dict:
+    res = client.post("/events", json=fields)
+    assert res.status_code == 201
+    return res.json()
+
+
+def test_search_ranks_name_matches_first_and_highlights(client):
+    word = _word()
+    in_description = _create(client, name="Quarterly review", description=f"Agenda covers {word} and budgets")
+    in_name = _create(client, name=f"{word} workshop", location="Room 4")
+    in_location = _create(client, name="Standup", location=f"{word} hall")
+    _create(client, name="Unrelated", description="nothing to see")
+
+    res = client.get("/events/search", params={"q": word})
+    assert res.status_code == 200
+    hits = res.json()
+    assert [h["id"] for h in hits] == [in_name["id"], in_location["id"], in_description["id"]]
+    assert hits[0]["rank"] > hits[1]["rank"] > hits[2]["rank"]
+    assert hits[0]["highlights"]["name"] == f"<mark>{word}</mark> workshop"
+    assert hits[1]["highlights"]["location"] == f"<mark>{word}</mark> hall"
+    assert f"<mark>{word}</mark>" in hits[2]["highlights"]["description"]
+    assert {k: hits[0][k] for k in in_name} == in_name
+
+
+def test_search_requires_every_word_and_pages_by_rank(client):
+    word = _word()
+    ids = [_create(client, name=f"{word} session {i}", description="python" if i % 2 else None)["id"] for i in range(5)]
+
+    res = client.get("/events/search", params={"q": f"{word} python"})
+    assert sorted(h["id"] for h in res.json()) == [ids[1], ids[3]]
+
+    seen, cursor = [], None
+    while True:
+        params = {"q": word, "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        res = client.get("/events/search", params=params)
+        assert res.status_code == 200 and len(res.json()) <= 2
+        seen += [h["id"] for h in res.json()]
+        cursor = res.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert sorted(seen) == ids and len(seen) == len(set(seen))
+
+
+def test_search_follows_updates_and_deletes(client):
+    old, new = _word(), _word()
+    event = _create(client, name=f"{old} meetup")
+    assert client.patch(f"/events/{event['id']}", json={"name": f"{new} meetup"}).status_code == 200
+
+    assert client.get("/events/search", params={"q": old}).json() == []
+    assert [h["id"] for h in client.get("/events/search", params={"q": new}).json()] == [event["id"]]
+
+    assert client.delete(f"/events/{event['id']}").status_code == 204
+    assert client.get("/events/search", params={"q": new}).json() == []
+
+
+def test_search_rejects_bad_input(client):
+    assert client.get("/events/search", params={"q": "*()"}).status_code == 400
+    assert client.get("/events/search").status_code == 422
+    assert client.get("/events/search", params={"q": "x", "cursor": "garbage"}).json() == {"detail": "Invalid cursor"}
+    # FTS5 syntax in the query is matched literally, not parsed
+    assert client.get("/events/search", params={"q": 'NEAR( "a" OR'}).status_code == 200
+
+
+def test_postgres_query_highlights_only_the_page():
+    sql = str(_postgres_search("python meetup", 21, (0.5, 10)).compile(dialect=postgresql.dialect()))
+    assert "websearch_to_tsquery('english'::regconfig" in sql
+    assert "events.search_vector @@" in sql
+    # ts_headline runs in the outer query, over the LIMITed subquery
+    outer, inner = sql.split("FROM (", 1)
+    assert outer.count("ts_headline(") == 3 and "ts_headline(" not in inner
+    assert "LIMIT" in inner
@@ -0,0 +1,60 @@
+import json
+import uuid
+from datetime import datetime
+
+from event_service.api import serialization
+from event_service.api.serialization import EVENT_FIELDS, EventRow, dump_event, dump_events
+from event_service.schemas.event import EventResponse
+
+
+def _row(**overrides):
+    values = {
+        "name": 'Quarterly "review" é',
+        "description": None,
+        "start_time": datetime(2025, 10, 1, 10, 0, 0, 123),
+        "end_time": datetime(2025, 10, 1, 11, 0),
+        "location": "Room 1",
+        "participants": ["a@example.com", "b@example.com"],
+        "id": 7,
+        "created_at": datetime(2025, 9, 1, 12, 0),
+        "updated_at": datetime(2025, 9, 2, 8, 30, 15, 999999),
+    }
+    values.update(overrides)
+    return tuple(values[name] for name in EVENT_FIELDS)
+
+
+def _via_response_model(row) -> bytes:
+    return EventResponse.model_validate(dict(zip(EVENT_FIELDS, row))).model_dump_json().encode()
+
+
+def test_event_row_mirrors_event_response():
+    assert tuple(EventRow.__annotations__) == tuple(EventResponse.model_fields)
+
+
+def test_fast_encoding_is_byte_identical_to_response_model(monkeypatch):
+    rows = [_row(), _row(id=8, participants=None, start_time=None)]
+    expected = b"[" + b",".join(_via_response_model(row) for row in rows) + b"]"
+
+    assert dump_event(rows[0]) == _via_response_model(rows[0])
+    assert dump_events(rows) == expected
+
+    # fallback when orjson is not installed
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert dump_event(rows[0]) == _via_response_model(rows[0])
+    assert dump_events(rows) == expected
+
+
+def test_list_and_get_keep_the_response_schema(client):
+    location = f"serial-{uuid.uuid4().hex}"
+    created = client.post(
+        "/events", json={"name": "Serialized", "location": location, "start_time": "2025-10-01T10:00:00"}
+    ).json()
+
+    listed = client.get("/events", params={"location": location})
+    assert listed.headers["content-type"] == "application/json"
+    assert listed.json() == [created]
+    assert list(listed.json()[0]) == list(EventResponse.model_fields)
+
+    single = client.get(f"/events/{created['id']}")
+    assert single.json() == created
+    assert json.loads(single.content) == created
@@ -1,8 +1,13 @@
 from unittest.mock import MagicMock, patch
+from fastapi import Response
 from event_service.schemas.event import EventUpdate
 from event_service.database import SessionLocal
 from event_service.core.config import settings
 from event_service.api import event as event_module
+from event_service.models.notification import NotificationOutbox
+from event_service.services.notifications import send_event_update
+from event_service.services.outbox import deliver_entry
+from event_service.services.smtp import SMTPService
 
 
 def _create_payload(name: str = "Test Event") -> dict:
@@ -23,7 +28,7 @@ def test_no_email_for_name_or_description_change(client):
     mock_bg = MagicMock()
     db = SessionLocal()
     try:
-        event_module.update_event(ev_id, update, db=db, background_tasks=mock_bg)
+        event_module.update_event(ev_id, update, db=db, background_tasks=mock_bg, response=Response())
     finally:
         db.close()
 
@@ -41,24 +46,32 @@ def test_email_scheduled_on_relevant_changes(client):
     mock_bg = MagicMock()
     db = SessionLocal()
     try:
-        event_module.update_event(ev_id, update, db=db, background_tasks=mock_bg)
+        event_module.update_event(ev_id, update, db=db, background_tasks=mock_bg, response=Response())
     finally:
         db.close()
 
-    # add_task should be scheduled once with our helper and args
+    # add_task should be scheduled once to deliver the outbox entry committed with the update
     assert mock_bg.add_task.call_count == 1
     call_args = mock_bg.add_task.call_args[0]
-    # first arg is the callable helper
-    assert call_args[0] is event_module._send_event_update_email_task
-    # second arg is the event id
-    assert call_args[1] == ev_id
-    # third arg is a Session-like object
-    assert hasattr(call_args[2], "commit") or hasattr(call_args[2], "execute")
+    # first arg is the outbox delivery helper
+    assert call_args[0] is deliver_entry
+    # second arg is the session factory for the background task
+    assert call_args[1] is SessionLocal
     # fourth arg is settings instance
     assert call_args[3] is settings
 
+    # third arg is the id of a pending outbox entry for this event
+    db = SessionLocal()
+    try:
+        entry = db.get(NotificationOutbox, call_args[2])
+        assert entry is not None
+        assert entry.event_id == ev_id
+        assert entry.status == "pending"
+    finally:
+        db.close()
+
 
-def test_background_task_sends_email(client):
+def test_send_event_update_emails_current_participants(client):
     payload = _create_payload("EmailTask Event")
     created = client.post("/events", json=payload).json()
     ev_id = created["id"]
@@ -67,16 +80,12 @@ def test_background_task_sends_email(client):
     mock_smtp = MagicMock()
 
     # Patch the classmethod from_settings to return our mock instance
-    with patch.object(event_module.SMTPService, "from_settings", return_value=mock_smtp):
-        db_task = SessionLocal()
+    with patch.object(SMTPService, "from_settings", return_value=mock_smtp):
+        db = SessionLocal()
         try:
-            event_module._send_event_update_email_task(ev_id, db_task, settings)
+            send_event_update(db, ev_id, settings)
         finally:
-            # helper should close the db passed in finally, but ensure safety
-            try:
-                db_task.close()
-            except Exception:
-                pass
+            db.close()
 
     # send_email should have been called once with the current participants
     assert mock_smtp.send_email.call_count == 1
@@ -0,0 +1,105 @@
+import re
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from event_service.core.metrics import Gauge, Registry
+from event_service.services.smtp import EmailSendError, SMTPService
+
+
+def _sample(text: str, name: str, default=None, **labels) -> float:
+    """Value of the sample `name` whose labels include `labels`."""
+    for line in text.splitlines():
+        match = re.match(r"^([a-zA-Z_:][\w:]*)(?:\{(.*)\})? (\S+)$", line)
+        if not match or match.group(1) != name:
+            continue
+        found = dict(re.findall(r'(\w+)="((?:[^"\\]|\\.)*)"', match.group(2) or ""))
+        if all(found.get(k) == str(v) for k, v in labels.items()):
+            return float(match.group(3))
+    if default is not None:
+        return default
+    raise AssertionError(f"no sample {name} {labels}")
+
+
+def test_registry_renders_the_text_format():
+    registry = Registry()
+    requests = registry.counter("requests_total", "Requests.", ("route",))
+    latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    requests.inc('/a "quoted"')
+    requests.inc('/a "quoted"', amount=2)
+    latency.observe(0.05)
+    latency.observe(0.5)
+    registry.register_collector(lambda: [_gauge()])
+
+    text = registry.render()
+    assert "# TYPE requests_total counter" in text
+    assert 'requests_total{route="/a \\"quoted\\""} 3' in text
+    assert 'latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 2' in text
+    assert "latency_seconds_count 2" in text
+    assert "# TYPE depth gauge" in text and "depth 7" in text
+    # the same family is returned when registered twice, a conflicting one is refused
+    assert registry.counter("requests_total", "Requests.", ("route",)) is requests
+    with pytest.raises(ValueError):
+        registry.histogram("requests_total", "Requests.")
+    with pytest.raises(ValueError):
+        requests.inc()
+
+
+def _gauge() -> Gauge:
+    gauge = Gauge("depth", "Depth.")
+    gauge.set(7)
+    return gauge
+
+
+def test_failing_collector_does_not_hide_other_metrics():
+    registry = Registry()
+    registry.counter("ok_total", "Ok.").inc()
+
+    def _broken():
+        raise RuntimeError("database is down")
+
+    registry.register_collector(_broken)
+    assert "ok_total 1" in registry.render()
+
+
+def test_requests_are_labelled_by_route_template_with_sql_totals(client):
+    res = client.post("/events", json={"name": "Metered"})
+    assert res.status_code == 201
+    event_id = res.json()["id"]
+    assert client.get(f"/events/{event_id}").status_code == 200
+    assert client.get("/events/999999999").status_code == 404
+    assert client.get("/no-such-path").status_code == 404
+
+    res = client.get("/metrics")
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = res.text
+    route = "/events/{event_id}"
+    assert _sample(text, "http_requests_total", method="GET", route=route, status=200) >= 1
+    assert _sample(text, "http_requests_total", method="GET", route=route, status=404) >= 1
+    assert _sample(text, "http_requests_total", method="GET", route="<unmatched>", status=404) >= 1
+    assert f"/events/{event_id}\"" not in text
+    assert _sample(text, "http_request_duration_seconds_count", method="POST", route="/events", status=201) >= 1
+    # the create is one INSERT ... RETURNING
+    assert _sample(text, "http_request_db_queries_count", method="POST", route="/events") >= 1
+    assert _sample(text, "http_request_db_queries_bucket", method="POST", route="/events", le="0") == 0
+    assert _sample(text, "db_query_duration_seconds_count", engine="sync") >= 1
+    assert _sample(text, "notification_outbox_entries", status="pending") >= 0
+    assert _sample(text, "notification_outbox_oldest_due_seconds") >= 0
+    assert "db_pool_checkout_wait_seconds" in text
+
+
+def test_smtp_send_latency_and_failures_are_counted(client):
+    service = SMTPService(host="smtp.example.com", port=465, username="sender@example.com", password="s3cr3t")
+    before = _sample(client.get("/metrics").text, "smtp_send_duration_seconds_count", 0, backend="sync")
+    with patch("smtplib.SMTP_SSL") as smtp_cls:
+        smtp_cls.return_value.__enter__.return_value = MagicMock()
+        service.send_email(["a@example.com"], "Subject", "Body")
+        smtp_cls.return_value.__enter__.side_effect = OSError("connection refused")
+        with pytest.raises(EmailSendError):
+            service.send_email(["a@example.com"], "Subject", "Body")
+
+    text = client.get("/metrics").text
+    assert _sample(text, "smtp_send_duration_seconds_count", backend="sync") == before + 2
+    assert _sample(text, "smtp_send_failures_total", backend="sync") >= 1
@@ -0,0 +1,180 @@
+import smtplib
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from event_service.core.config import settings
+from event_service.database import Base
+from event_service.models.event import Event
+from event_service.models.notification import NotificationDelivery, NotificationOutbox
+from event_service.services import outbox
+from event_service.services.fanout import DeliveryReport, RateLimiter, fan_out
+from event_service.services.smtp import SMTPService
+
+
+class RecordingSMTP:
+    """SMTP client stand-in that records envelopes and can refuse addresses."""
+
+    lock = threading.Lock()
+    envelopes: list = []
+    refuse: set = set()
+    explode: set = set()
+
+    def __init__(self, host, port, timeout=10):
+        pass
+
+    def login(self, username, password):
+        pass
+
+    def noop(self):
+        return (250, b"ok")
+
+    def rset(self):
+        return (250, b"ok")
+
+    def send_message(self, msg, to_addrs=None):
+        to_addrs = list(to_addrs or [a.strip() for a in msg["To"].split(",")])
+        if self.explode & set(to_addrs):
+            raise smtplib.SMTPServerDisconnected("connection lost")
+        with self.lock:
+            RecordingSMTP.envelopes.append((msg, to_addrs))
+        return {a: (550, b"mailbox unavailable") for a in to_addrs if a in self.refuse}
+
+    def quit(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def _reset_recorder():
+    RecordingSMTP.envelopes = []
+    RecordingSMTP.refuse = set()
+    RecordingSMTP.explode = set()
+    yield
+
+
+def _service() -> SMTPService:
+    return SMTPService(
+        host="smtp.fanout", port=465, username="events@example.com", password="pw",
+        client_factory=RecordingSMTP, pool_size=4,
+    )
+
+
+def test_per_recipient_mode_sends_one_message_each():
+    recipients = [f"user{i}@example.com" for i in range(10)]
+    report = fan_out(_service(), recipients, "s", "b", mode="per_recipient", concurrency=4)
+
+    assert sorted(report.sent) == sorted(recipients)
+    assert report.failed == {}
+    assert len(RecordingSMTP.envelopes) == 10
+    for msg, to_addrs in RecordingSMTP.envelopes:
+        assert to_addrs == [msg["To"]]
+
+
+def test_bcc_mode_chunks_and_hides_recipients():
+    recipients = [f"user{i}@example.com" for i in range(5)]
+    report = fan_out(_service(), recipients, "s", "b", mode="bcc", chunk_size=2, concurrency=2)
+
+    assert sorted(report.sent) == sorted(recipients)
+    assert sorted(len(to) for _, to in RecordingSMTP.envelopes) == [1, 2, 2]
+    for msg, _ in RecordingSMTP.envelopes:
+        assert msg["To"] == "undisclosed-recipients:;"
+        assert msg["Bcc"] is None
+        assert "user" not in msg.as_string().split("\n\n", 1)[0]
+
+
+def test_refused_and_failed_recipients_are_reported_individually():
+    RecordingSMTP.refuse = {"bad@example.com"}
+    RecordingSMTP.explode = {"down@example.com"}
+    recipients = ["ok@example.com", "bad@example.com", "down@example.com", "ok2@example.com"]
+
+    report = fan_out(_service(), recipients, "s", "b", mode="per_recipient", concurrency=2)
+
+    assert sorted(report.sent) == ["ok2@example.com", "ok@example.com"]
+    assert set(report.failed) == {"bad@example.com", "down@example.com"}
+    assert report.failed["bad@example.com"].startswith("550")
+
+
+def test_duplicate_recipients_are_sent_once():
+    report = fan_out(_service(), ["a@example.com", "a@example.com"], "s", "b", mode="per_recipient")
+    assert report.sent == ["a@example.com"]
+    assert len(RecordingSMTP.envelopes) == 1
+
+
+def test_rate_limiter_spaces_acquisitions():
+    now = SimpleNamespace(t=0.0)
+    sleeps = []
+
+    def _sleep(seconds):
+        sleeps.append(seconds)
+        now.t += seconds
+
+    limiter = RateLimiter(2.0, clock=lambda: now.t, sleep=_sleep)
+    for _ in range(4):
+        limiter.acquire()
+
+    # the burst capacity (2) passes immediately, then one token every 0.5s
+    assert now.t == pytest.approx(1.0)
+
+
+def test_outbox_records_deliveries_and_retries_only_failed_recipients():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine, autoflush=False)
+
+    db = factory()
+    ev = Event(name="Fanout", participants=["a@example.com", "b@example.com", "c@example.com"])
+    db.add(ev)
+    db.flush()
+    entry_id = outbox.enqueue_event_update(db, ev.id).id
+    db.commit()
+    db.close()
+
+    first = MagicMock()
+    first.send_email.side_effect = lambda to_emails, subject, body: (
+        {"b@example.com": (450, b"try later")} if "b@example.com" in to_emails else {}
+    )
+    per_recipient = settings.model_copy(update={"NOTIFICATION_FANOUT_MODE": "per_recipient"})
+
+    with patch.object(SMTPService, "from_settings", return_value=first):
+        outbox.drain_once(factory, per_recipient)
+
+    db = factory()
+    entry = db.get(NotificationOutbox, entry_id)
+    assert entry.status == "pending"
+    assert "b@example.com" in entry.last_error
+    statuses = {
+        (d.recipient, d.status)
+        for d in db.execute(select(NotificationDelivery).where(NotificationDelivery.outbox_id == entry_id)).scalars()
+    }
+    assert statuses == {("a@example.com", "sent"), ("b@example.com", "failed"), ("c@example.com", "sent")}
+    # make the retry due now
+    entry.next_attempt_at = entry.created_at
+    db.commit()
+    db.close()
+
+    second = MagicMock()
+    second.send_email.return_value = {}
+    with patch.object(SMTPService, "from_settings", return_value=second):
+        outbox.drain_once(factory, per_recipient)
+
+    retried = [call.kwargs["to_emails"] for call in second.send_email.call_args_list]
+    assert retried == [["b@example.com"]]
+    db = factory()
+    assert db.get(NotificationOutbox, entry_id).status == "sent"
+    db.close()
+    engine.dispose()
+
+
+def test_delivery_report_merge():
+    report = DeliveryReport(sent=["a"])
+    report.merge(DeliveryReport(sent=["b"], failed={"c": "550"}))
+    assert report.sent == ["a", "b"]
+    assert report.failed == {"c": "550"}
@@ -0,0 +1,178 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from event_service.core.config import settings
+from event_service.database import Base, SessionLocal
+from event_service.models.event import Event
+from event_service.models.notification import NotificationOutbox
+from event_service.services import outbox
+from event_service.services.smtp import EmailSendError, SMTPService
+from event_service.worker import run_worker
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(bind=engine, autoflush=False)
+    engine.dispose()
+
+
+def _event_with_outbox_entry(session_factory, participants=("a@example.com",)) -> int:
+    db = session_factory()
+    try:
+        ev = Event(name="Outbox Event", location="Room", participants=list(participants))
+        db.add(ev)
+        db.flush()
+        entry = outbox.enqueue_event_update(db, ev.id)
+        db.commit()
+        return entry.id
+    finally:
+        db.close()
+
+
+def _entry(session_factory, entry_id: int) -> NotificationOutbox:
+    db = session_factory()
+    try:
+        return db.get(NotificationOutbox, entry_id)
+    finally:
+        db.close()
+
+
+def test_put_writes_outbox_entry_and_delivers_inline(client):
+    created = client.post("/events", json={"name": "Outbox PUT", "participants": ["p@example.com"]}).json()
+
+    mock_smtp = MagicMock()
+    with patch.object(SMTPService, "from_settings", return_value=mock_smtp):
+        res = client.put(f"/events/{created['id']}", json={"location": "Elsewhere"})
+    assert res.status_code == 200
+    assert mock_smtp.send_email.call_count == 1
+
+    db = SessionLocal()
+    try:
+        stmt = select(NotificationOutbox).where(NotificationOutbox.event_id == created["id"])
+        entries = db.execute(stmt).scalars().all()
+    finally:
+        db.close()
+    assert [e.status for e in entries] == ["sent"]
+    assert entries[0].attempts == 1
+
+
+def test_drain_once_sends_and_marks_entries(session_factory):
+    entry_id = _event_with_outbox_entry(session_factory)
+
+    mock_smtp = MagicMock()
+    with patch.object(SMTPService, "from_settings", return_value=mock_smtp):
+        assert outbox.drain_once(session_factory, settings) == 1
+        # nothing left to do
+        assert outbox.drain_once(session_factory, settings) == 0
+
+    assert mock_smtp.send_email.call_count == 1
+    entry = _entry(session_factory, entry_id)
+    assert entry.status == "sent"
+    assert entry.sent_at is not None
+
+
+def test_failed_delivery_is_retried_with_backoff(session_factory):
+    entry_id = _event_with_outbox_entry(session_factory)
+
+    failing = MagicMock()
+    failing.send_email.side_effect = EmailSendError("smtp down")
+    with patch.object(SMTPService, "from_settings", return_value=failing):
+        assert outbox.drain_once(session_factory, settings) == 1
+        # not due again until the backoff elapses
+        assert outbox.drain_once(session_factory, settings) == 0
+
+    entry = _entry(session_factory, entry_id)
+    assert entry.status == "pending"
+    assert entry.attempts == 1
+    assert "smtp down" in entry.last_error
+    assert entry.next_attempt_at > datetime.utcnow() + timedelta(seconds=settings.NOTIFICATION_OUTBOX_BACKOFF_BASE / 2)
+
+
+def test_delivery_gives_up_after_max_attempts(session_factory):
+    entry_id = _event_with_outbox_entry(session_factory)
+    db = session_factory()
+    entry = db.get(NotificationOutbox, entry_id)
+    entry.attempts = settings.NOTIFICATION_OUTBOX_MAX_ATTEMPTS - 1
+    db.commit()
+    db.close()
+
+    failing = MagicMock()
+    failing.send_email.side_effect = EmailSendError("still down")
+    with patch.object(SMTPService, "from_settings", return_value=failing):
+        outbox.drain_once(session_factory, settings)
+
+    assert _entry(session_factory, entry_id).status == "failed"
+
+
+def test_entry_for_event_without_participants_is_skipped(session_factory):
+    entry_id = _event_with_outbox_entry(session_factory, participants=())
+    mock_smtp = MagicMock()
+    with patch.object(SMTPService, "from_settings", return_value=mock_smtp):
+        outbox.drain_once(session_factory, settings)
+    assert mock_smtp.send_email.call_count == 0
+    assert _entry(session_factory, entry_id).status == "skipped"
+
+
+def test_backoff_delay_is_exponential_and_capped():
+    assert outbox.backoff_delay(1, settings) == timedelta(seconds=settings.NOTIFICATION_OUTBOX_BACKOFF_BASE)
+    assert outbox.backoff_delay(2, settings) == timedelta(seconds=2 * settings.NOTIFICATION_OUTBOX_BACKOFF_BASE)
+    assert outbox.backoff_delay(100, settings) == timedelta(seconds=settings.NOTIFICATION_OUTBOX_BACKOFF_MAX)
+
+
+def test_run_worker_once_drains_queue(session_factory):
+    ids = [_event_with_outbox_entry(session_factory) for _ in range(3)]
+    mock_smtp = MagicMock()
+    with patch.object(SMTPService, "from_settings", return_value=mock_smtp):
+        assert run_worker(session_factory, settings, once=True) == 3
+    assert all(_entry(session_factory, i).status == "sent" for i in ids)
+
+
+def test_claim_is_committed_before_sending_and_leased(session_factory):
+    entry_id = _event_with_outbox_entry(session_factory)
+    seen = []
+
+    def _send(*args, **kwargs):
+        # Mid-send, the claim is visible to other sessions and no one else can take the entry
+        seen.append(_entry(session_factory, entry_id).status)
+        assert outbox.drain_once(session_factory, settings) == 0
+
+    mock_smtp = MagicMock()
+    mock_smtp.send_email.side_effect = _send
+    with patch.object(SMTPService, "from_settings", return_value=mock_smtp):
+        assert outbox.drain_once(session_factory, settings) == 1
+    assert seen == ["in_progress"]
+    assert mock_smtp.send_email.call_count == 1
+    assert _entry(session_factory, entry_id).status == "sent"
+
+
+def test_expired_lease_is_reclaimed_and_stale_outcome_dropped(session_factory):
+    entry_id = _event_with_outbox_entry(session_factory)
+    db = session_factory()
+    try:
+        # A worker claimed the entry and died; its lease has run out
+        [stale] = outbox._claim(db, settings, datetime.utcnow(), 10)
+        db.get(NotificationOutbox, entry_id).next_attempt_at = datetime.utcnow() - timedelta(seconds=1)
+        db.commit()
+    finally:
+        db.close()
+
+    mock_smtp = MagicMock()
+    with patch.object(SMTPService, "from_settings", return_value=mock_smtp):
+        assert outbox.drain_once(session_factory, settings) == 1
+    entry = _entry(session_factory, entry_id)
+    assert (entry.status, entry.attempts) == ("sent", 2)
+
+    # The first worker's late outcome no longer matches the entry's claim
+    db = session_factory()
+    try:
+        outbox._record(db, stale, {"status": "failed", "last_error": "late"}, [])
+    finally:
+        db.close()
+    assert _entry(session_factory, entry_id).status == "sent"
@@ -0,0 +1,78 @@
+import uuid
+
+from sqlalchemy import create_mock_engine, select
+from sqlalchemy.dialects import postgresql
+
+from event_service.api.filters import participant_predicate
+from event_service.database import SessionLocal
+from event_service.models import Base
+from event_service.models.event import Event, EventParticipant
+
+
+def _create(client, name: str, participants) -> int:
+    res = client.post("/events", json={"name": name, "participants": participants})
+    assert res.status_code == 201
+    return res.json()["id"]
+
+
+def _side_table_emails(event_id: int) -> set:
+    db = SessionLocal()
+    try:
+        stmt = select(EventParticipant.email).where(EventParticipant.event_id == event_id)
+        return set(db.execute(stmt).scalars().all())
+    finally:
+        db.close()
+
+
+def test_list_events_participant_filter(client):
+    hit = _create(client, "Lookup Hit", ["lookup-a@example.com", "lookup-b@example.com"])
+    miss = _create(client, "Lookup Miss", ["lookup-c@example.com"])
+
+    res = client.get("/events", params={"participant": "lookup-a@example.com"})
+    assert res.status_code == 200
+    ids = {item["id"] for item in res.json()}
+    assert hit in ids
+    assert miss not in ids
+
+
+def test_participant_events_endpoint(client):
+    # unique address so reruns against a persistent database see only this event
+    email = f"lookup-{uuid.uuid4().hex}@example.com"
+    ev_id = _create(client, "Lookup Endpoint", [email])
+
+    res = client.get(f"/participants/{email}/events")
+    assert res.status_code == 200
+    assert [item["id"] for item in res.json()] == [ev_id]
+
+    res = client.get("/participants/nobody-lookup@example.com/events")
+    assert res.status_code == 200
+    assert res.json() == []
+
+
+def test_side_table_follows_updates_and_deletes(client):
+    ev_id = _create(client, "Lookup Sync", ["sync-a@example.com", "sync-a@example.com", "sync-b@example.com"])
+    assert _side_table_emails(ev_id) == {"sync-a@example.com", "sync-b@example.com"}
+
+    client.put(f"/events/{ev_id}", json={"participants": ["sync-c@example.com"]})
+    assert _side_table_emails(ev_id) == {"sync-c@example.com"}
+    res = client.get("/events", params={"participant": "sync-a@example.com"})
+    assert ev_id not in {item["id"] for item in res.json()}
+
+    client.delete(f"/events/{ev_id}")
+    assert _side_table_emails(ev_id) == set()
+
+
+def test_postgres_predicate_uses_array_containment():
+    stmt = select(Event.id).where(participant_predicate("x@y.com", "postgresql"))
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "@>" in sql
+    assert "event_participants" not in sql
+
+
+def test_create_all_leaves_out_the_side_table_on_postgres():
+    # Matches alembic revision db7c0d2d75f4, which only creates it on SQLite
+    statements = []
+    mock = create_mock_engine("postgresql://", lambda sql, *args, **kw: statements.append(str(sql)))
+    Base.metadata.create_all(mock, checkfirst=False)
+    assert any("CREATE TABLE events" in sql for sql in statements)
+    assert not any("event_participants" in sql for sql in statements)
@@ -0,0 +1,76 @@
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from event_service.api.debug import router as debug_router
+from event_service.api.event import router as events_router
+from event_service.core.instrumentation import RequestMetricsMiddleware
+from event_service.core.profiling import PROFILE_ID_HEADER, ProfilingMiddleware, profile_store
+
+
+def _busy_handler():
+    time.sleep(0.05)
+    return {"ok": True}
+
+
+@pytest.fixture()
+def profiled(client):
+    """The events API with profiling on; `client` makes sure the tables exist."""
+    app = FastAPI()
+    app.include_router(events_router)
+    app.include_router(debug_router)
+    app.add_api_route("/busy", _busy_handler)
+    app.add_middleware(ProfilingMiddleware, store=profile_store, sample_rate=0.0, interval=0.001, slow_threshold=0.5)
+    app.add_middleware(RequestMetricsMiddleware)
+    profile_store.clear()
+    with TestClient(app) as c:
+        yield c
+    profile_store.clear()
+
+
+def test_unsampled_requests_are_not_profiled(profiled):
+    res = profiled.get("/busy")
+    assert res.status_code == 200
+    assert PROFILE_ID_HEADER not in res.headers
+    assert profiled.get("/debug/profiles").json() == []
+
+
+def test_header_requested_profile_records_stacks(profiled):
+    res = profiled.get("/busy", headers={"X-Profile": "1"})
+    profile_id = res.headers[PROFILE_ID_HEADER]
+
+    summaries = profiled.get("/debug/profiles").json()
+    assert [s["id"] for s in summaries] == [profile_id]
+    assert summaries[0]["route"] == "/busy" and summaries[0]["status"] == 200
+
+    report = profiled.get(f"/debug/profiles/{profile_id}", params={"top": 5}).json()
+    assert report["samples"] > 0
+    assert 0 < len(report["stacks"]) <= 5
+    assert any("_busy_handler" in s["stack"] for s in report["stacks"])
+    assert profiled.get("/debug/profiles/nope").status_code == 404
+
+
+def test_update_event_profile_lists_sql_without_parameters(profiled):
+    event_id = profiled.post("/events", json={"name": "Profiled", "location": "secret-room"}).json()["id"]
+    res = profiled.put(f"/events/{event_id}", json={"name": "Renamed"}, headers={"X-Profile": "true"})
+    assert res.status_code == 200
+
+    report = profiled.get(f"/debug/profiles/{res.headers[PROFILE_ID_HEADER]}").json()
+    assert report["route"] == "/events/{event_id}"
+    assert report["statement_count"] == len(report["statements"]) >= 2
+    assert any(s["statement"].startswith("UPDATE events") for s in report["statements"])
+    assert all("Renamed" not in s["statement"] for s in report["statements"])
+
+
+def test_fast_sampled_requests_below_the_threshold_are_dropped(client):
+    app = FastAPI()
+    app.add_api_route("/fast", lambda: {"ok": True})
+    app.add_middleware(ProfilingMiddleware, store=profile_store, sample_rate=1.0, header=None, slow_threshold=10.0)
+    app.add_middleware(RequestMetricsMiddleware)
+    profile_store.clear()
+    with TestClient(app) as c:
+        res = c.get("/fast", headers={"X-Profile": "1"})
+    assert PROFILE_ID_HEADER in res.headers
+    assert profile_store.list() == []
@@ -0,0 +1,92 @@
+import logging
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from event_service import database
+from event_service.core.instrumentation import RequestMetricsMiddleware, instrument_engine
+from event_service.core.query_monitor import (
+    QueryMonitor,
+    QueryPolicyViolation,
+    normalize_sql,
+    query_budget,
+    redact_parameters,
+)
+
+
+def _app(engine, *dependencies) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}", dependencies=list(dependencies))
+    def read_item(item_id: int, statements: int = 1):
+        with engine.connect() as conn:
+            for _ in range(statements):
+                conn.execute(text("SELECT :id, 'secret'"), {"id": item_id}).all()
+        return {"id": item_id}
+
+    app.add_middleware(RequestMetricsMiddleware)
+    return app
+
+
+@pytest.fixture()
+def lenient_engine():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine, "test")
+    QueryMonitor(slow_threshold=0, max_queries=3, strict=False).attach(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_normalize_and_redact():
+    sql = "SELECT *\n  FROM events WHERE id IN (?, ?, ?) AND name = 'bob' AND n > 10"
+    assert normalize_sql(sql) == "SELECT * FROM events WHERE id IN (...) AND name = ? AND n > ?"
+    assert normalize_sql("SELECT a FROM t WHERE b = %(b_1)s LIMIT %(param_1)s") == (
+        "SELECT a FROM t WHERE b = %(b_1)s LIMIT %(param_1)s"
+    )
+    assert redact_parameters({"email": "a@example.com", "id": 3}) == {"email": "str", "id": "int"}
+    assert redact_parameters(("a@example.com",)) == ["str"]
+    assert redact_parameters([("x", 1), ("y", 2)], executemany=True) == {"rows": 2, "first": ["str", "int"]}
+
+
+def test_request_over_its_budget_is_logged_with_route(lenient_engine, caplog):
+    with TestClient(_app(lenient_engine, Depends(query_budget(2)))) as client, caplog.at_level(logging.WARNING):
+        assert client.get("/items/7", params={"statements": 2}).status_code == 200
+        assert not caplog.records
+        assert client.get("/items/7", params={"statements": 4}).status_code == 200
+    messages = [r.getMessage() for r in caplog.records]
+    assert len(messages) == 1
+    assert "GET /items/{item_id} exceeded its budget of 2 SQL statements" in messages[0]
+    assert "SELECT ?, ? params=['int']" in messages[0]
+    assert "secret" not in messages[0]
+
+
+def test_default_budget_applies_without_a_route_budget(lenient_engine, caplog):
+    with TestClient(_app(lenient_engine)) as client, caplog.at_level(logging.WARNING):
+        client.get("/items/1", params={"statements": 4})
+    assert "exceeded its budget of 3" in caplog.text
+
+    caplog.clear()
+    with TestClient(_app(lenient_engine, Depends(query_budget(None)))) as client, caplog.at_level(logging.WARNING):
+        client.get("/items/1", params={"statements": 4})
+    assert not caplog.records
+
+
+def test_slow_statements_are_logged(caplog):
+    engine = create_engine("sqlite://")
+    QueryMonitor(slow_threshold=1e-9, max_queries=None).attach(engine)
+    with caplog.at_level(logging.WARNING), engine.connect() as conn:
+        conn.execute(text("SELECT 1")).all()
+    engine.dispose()
+    assert "Slow SQL statement" in caplog.text and "on no request: SELECT ?" in caplog.text
+
+
+def test_strict_mode_fails_the_request():
+    # The suite runs with SQL_QUERY_MONITOR_STRICT, as CI does, and only budgets are enforced
+    assert database.query_monitor.strict
+    assert not database.query_monitor.slow_threshold
+    with TestClient(_app(database.engine, Depends(query_budget(1)))) as client:
+        assert client.get("/items/1").status_code == 200
+        with pytest.raises(QueryPolicyViolation, match="exceeded its budget of 1"):
+            client.get("/items/1", params={"statements": 2})
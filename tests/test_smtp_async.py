@@ -0,0 +1,272 @@
+import asyncio
+import base64
+import email
+import smtplib
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from event_service.core.config import settings
+from event_service.database import Base
+from event_service.models.event import Event
+from event_service.models.notification import NotificationOutbox
+from event_service.services import outbox
+from event_service.services.fanout import fan_out_async
+from event_service.services.smtp import EmailSendError, build_message
+from event_service.services.smtp_async import AsyncSMTPService
+
+
+class StandInSMTPServer:
+    """Minimal in-process ESMTP server on asyncio streams recording what it receives."""
+
+    def __init__(self, username="events@example.com", password="pw", auth="PLAIN LOGIN", delay=0.0):
+        self.username = username
+        self.password = password
+        self.auth = auth
+        self.delay = delay
+        self.refuse = set()
+        # Overrides the reply to AUTH, e.g. a 503
+        self.auth_reply = None
+        self.messages = []
+        self.connections = 0
+        self.active = 0
+        self.max_active = 0
+        self._server = None
+        self.port = None
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc):
+        self._server.close()
+        await self._server.wait_closed()
+
+    def service(self, **kwargs) -> AsyncSMTPService:
+        options = dict(username=self.username, password=self.password, use_tls=False, start_tls=False, timeout=5)
+        options.update(kwargs)
+        return AsyncSMTPService(host="127.0.0.1", port=self.port, **options)
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        authed = False
+        mail_from, rcpts = None, []
+
+        async def reply(line):
+            writer.write(line.encode() + b"\r\n")
+            await writer.drain()
+
+        await reply("220 stand-in ESMTP")
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                verb, _, arg = line.decode().rstrip("\r\n").partition(" ")
+                verb = verb.upper()
+                if verb == "EHLO":
+                    if self.auth is None:
+                        await reply("250 stand-in")
+                    else:
+                        await reply("250-stand-in")
+                        await reply(f"250 AUTH {self.auth}")
+                elif verb == "AUTH":
+                    mech, _, token = arg.partition(" ")
+                    if mech == "PLAIN":
+                        _, user, password = base64.b64decode(token).decode().split("\0")
+                    else:
+                        await reply("334 VXNlcm5hbWU6")
+                        user = base64.b64decode(await reader.readline()).decode()
+                        await reply("334 UGFzc3dvcmQ6")
+                        password = base64.b64decode(await reader.readline()).decode()
+                    if self.auth_reply is not None:
+                        await reply(self.auth_reply)
+                        continue
+                    authed = (user, password) == (self.username, self.password)
+                    await reply("235 ok" if authed else "535 bad credentials")
+                elif verb == "MAIL":
+                    if not authed:
+                        await reply("530 authentication required")
+                        continue
+                    mail_from, rcpts = arg[len("FROM:"):].strip("<>"), []
+                    await reply("250 ok")
+                elif verb == "RCPT":
+                    addr = arg[len("TO:"):].strip("<>")
+                    if addr in self.refuse:
+                        await reply("550 mailbox unavailable")
+                    else:
+                        rcpts.append(addr)
+                        await reply("250 ok")
+                elif verb == "DATA":
+                    await reply("354 go ahead")
+                    lines = []
+                    while (data := await reader.readline()) != b".\r\n":
+                        lines.append(data[1:] if data.startswith(b"..") else data)
+                    self.active += 1
+                    self.max_active = max(self.max_active, self.active)
+                    await asyncio.sleep(self.delay)
+                    self.active -= 1
+                    self.messages.append((mail_from, rcpts, email.message_from_bytes(b"".join(lines))))
+                    await reply("250 queued")
+                elif verb in ("RSET", "NOOP"):
+                    mail_from, rcpts = None, []
+                    await reply("250 ok")
+                elif verb == "QUIT":
+                    await reply("221 bye")
+                    break
+                else:
+                    await reply("502 not implemented")
+        finally:
+            writer.close()
+
+
+def test_send_email_delivers_over_plain_session():
+    async def scenario():
+        async with StandInSMTPServer() as server:
+            refused = await server.service().send_email(["a@example.com", "b@example.com"], "Hi", "line\n.dot line")
+            return server, refused
+
+    server, refused = asyncio.run(scenario())
+    assert refused == {}
+    assert len(server.messages) == 1
+    sender, rcpts, msg = server.messages[0]
+    assert sender == "events@example.com"
+    assert rcpts == ["a@example.com", "b@example.com"]
+    assert msg["Subject"] == "Hi"
+    # leading dots survive the transparency procedure
+    assert ".dot line" in msg.get_payload()
+
+
+def test_auth_login_and_bad_credentials():
+    async def scenario():
+        async with StandInSMTPServer(auth="LOGIN") as server:
+            await server.service().send_email(["a@example.com"], "s", "b")
+            with pytest.raises(EmailSendError):
+                await server.service(password="wrong").send_email(["a@example.com"], "s", "b")
+            return server
+
+    server = asyncio.run(scenario())
+    assert len(server.messages) == 1
+
+
+def test_login_requires_auth_and_a_235_reply():
+    async def scenario():
+        async with StandInSMTPServer(auth=None) as server:
+            with pytest.raises(EmailSendError) as no_auth:
+                await server.service().send_email(["a@example.com"], "s", "b")
+        async with StandInSMTPServer() as server:
+            server.auth_reply = "503 bad sequence of commands"
+            with pytest.raises(EmailSendError) as bad_sequence:
+                await server.service().send_email(["a@example.com"], "s", "b")
+            return server, no_auth.value, bad_sequence.value
+
+    server, no_auth, bad_sequence = asyncio.run(scenario())
+    assert isinstance(no_auth.__cause__, smtplib.SMTPNotSupportedError)
+    assert isinstance(bad_sequence.__cause__, smtplib.SMTPAuthenticationError)
+    assert server.messages == []
+
+
+def test_send_message_without_recipients_sends_nothing():
+    async def scenario():
+        async with StandInSMTPServer() as server:
+            async with server.service().session() as session:
+                with pytest.raises(ValueError):
+                    await session.send_message(build_message("events@example.com", "", "s", "b"))
+                with pytest.raises(ValueError):
+                    await session.send_message(build_message("events@example.com", "a@example.com", "s", "b"), [])
+            return server
+
+    assert asyncio.run(scenario()).messages == []
+
+
+def test_partially_refused_recipients_are_returned():
+    async def scenario():
+        async with StandInSMTPServer() as server:
+            server.refuse = {"gone@example.com"}
+            refused = await server.service().send_bcc(["a@example.com", "gone@example.com"], "s", "b")
+            with pytest.raises(EmailSendError):
+                await server.service().send_email(["gone@example.com"], "s", "b")
+            return server, refused
+
+    server, refused = asyncio.run(scenario())
+    assert refused["gone@example.com"][0] == 550
+    _, rcpts, msg = server.messages[0]
+    assert rcpts == ["a@example.com"]
+    assert msg["To"] == "undisclosed-recipients:;"
+
+
+def test_session_reuses_one_connection():
+    async def scenario():
+        async with StandInSMTPServer() as server:
+            service = server.service()
+            async with service.session() as session:
+                for i in range(3):
+                    await service.send_email([f"r{i}@example.com"], "s", "b", session=session)
+            return server
+
+    server = asyncio.run(scenario())
+    assert server.connections == 1
+    assert len(server.messages) == 3
+
+
+def test_fan_out_async_runs_deliveries_concurrently():
+    recipients = [f"user{i}@example.com" for i in range(20)]
+
+    async def scenario():
+        async with StandInSMTPServer(delay=0.05) as server:
+            server.refuse = {"user3@example.com"}
+            started = time.monotonic()
+            report = await fan_out_async(server.service(), recipients, "s", "b", mode="per_recipient", concurrency=10)
+            return server, report, time.monotonic() - started
+
+    server, report, elapsed = asyncio.run(scenario())
+    assert sorted(report.sent) == sorted(r for r in recipients if r != "user3@example.com")
+    assert list(report.failed) == ["user3@example.com"]
+    # ten sessions, each reused for its share of the messages
+    assert server.connections == 10
+    assert server.max_active > 1
+    assert elapsed < 20 * 0.05
+
+
+def test_outbox_delivers_with_async_backend():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine, autoflush=False)
+
+    db = factory()
+    ev = Event(name="Async SMTP", participants=["a@example.com", "b@example.com"])
+    db.add(ev)
+    db.flush()
+    entry_id = outbox.enqueue_event_update(db, ev.id).id
+    db.commit()
+    db.close()
+
+    async_settings = settings.model_copy(
+        update={"NOTIFICATION_SMTP_BACKEND": "async", "NOTIFICATION_FANOUT_MODE": "per_recipient"}
+    )
+    # The outbox runs its own event loop, so serve from a loop in a background thread
+    server = StandInSMTPServer()
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(server.__aenter__())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        with patch.object(AsyncSMTPService, "from_settings", return_value=server.service()):
+            assert outbox.drain_once(factory, async_settings) == 1
+    finally:
+        asyncio.run_coroutine_threadsafe(server.__aexit__(None, None, None), loop).result(5)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(5)
+        loop.close()
+
+    db = factory()
+    assert db.get(NotificationOutbox, entry_id).status == "sent"
+    db.close()
+    engine.dispose()
+    assert sorted(r for _, rcpts, _ in server.messages for r in rcpts) == ["a@example.com", "b@example.com"]
@@ -0,0 +1,199 @@
+import smtplib
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from event_service.services.smtp import EmailSendError, SMTPConnectionPool, SMTPService
+
+
+class FakeSMTP:
+    """Stand-in SMTP client recording the calls made on it."""
+
+    instances: list = []
+
+    def __init__(self, host, port, timeout=10):
+        self.host = host
+        self.port = port
+        self.logins = 0
+        self.sent = []
+        self.noops = 0
+        self.noop_code = 250
+        self.quit_called = False
+        FakeSMTP.instances.append(self)
+
+    def ehlo(self):
+        return (250, b"ok")
+
+    def starttls(self):
+        return (220, b"ready")
+
+    def login(self, username, password):
+        self.logins += 1
+
+    def noop(self):
+        self.noops += 1
+        if self.noop_code is None:
+            raise smtplib.SMTPServerDisconnected("gone")
+        return (self.noop_code, b"ok")
+
+    def rset(self):
+        return (250, b"ok")
+
+    def send_message(self, msg):
+        self.sent.append(msg)
+        return {}
+
+    def quit(self):
+        self.quit_called = True
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def _reset_instances():
+    FakeSMTP.instances = []
+    yield
+
+
+def _service(**kwargs) -> SMTPService:
+    return SMTPService(host="smtp.pool", port=465, username="u@example.com", password="pw", client_factory=FakeSMTP, **kwargs)
+
+
+def test_pooled_sends_reuse_one_authenticated_session():
+    service = _service(pool_size=2)
+    for i in range(3):
+        service.send_email(["r@example.com"], f"s{i}", "b")
+
+    assert len(FakeSMTP.instances) == 1
+    client = FakeSMTP.instances[0]
+    assert client.logins == 1
+    assert len(client.sent) == 3
+
+
+def test_session_recycled_after_max_messages():
+    service = _service(pool_size=1, pool_max_messages=2)
+    for i in range(3):
+        service.send_email(["r@example.com"], f"s{i}", "b")
+
+    assert len(FakeSMTP.instances) == 2
+    assert FakeSMTP.instances[0].quit_called
+    assert len(FakeSMTP.instances[0].sent) == 2
+
+
+def test_session_recycled_after_max_age():
+    now = SimpleNamespace(t=0.0)
+    pool = SMTPConnectionPool(lambda: FakeSMTP("h", 465), max_size=1, max_age=60.0, clock=lambda: now.t)
+
+    with pool.connection():
+        pass
+    now.t = 61.0
+    with pool.connection():
+        pass
+
+    assert len(FakeSMTP.instances) == 2
+    assert FakeSMTP.instances[0].quit_called
+
+
+def test_idle_session_checked_with_noop_and_replaced_when_dead():
+    now = SimpleNamespace(t=0.0)
+    pool = SMTPConnectionPool(lambda: FakeSMTP("h", 465), max_size=1, check_after=5.0, clock=lambda: now.t)
+
+    with pool.connection():
+        pass
+    # recently used: no NOOP
+    now.t = 1.0
+    with pool.connection():
+        pass
+    assert FakeSMTP.instances[0].noops == 0
+
+    # idle past check_after and the server dropped us
+    now.t = 10.0
+    FakeSMTP.instances[0].noop_code = None
+    with pool.connection() as client:
+        assert client is FakeSMTP.instances[1]
+    assert FakeSMTP.instances[0].noops == 1
+    assert pool.open_connections == 1
+
+
+def _drop(msg):
+    raise smtplib.SMTPServerDisconnected("dropped")
+
+
+def test_dropped_session_is_discarded_and_send_retried_on_a_fresh_one():
+    service = _service(pool_size=1)
+    service.send_email(["r@example.com"], "s", "b")
+
+    FakeSMTP.instances[0].send_message = _drop
+    service.send_email(["r@example.com"], "s", "b")
+    assert len(FakeSMTP.instances) == 2
+    assert len(FakeSMTP.instances[1].sent) == 1
+    assert service.pool.open_connections == 1
+
+
+def test_fresh_session_replaces_an_idle_one_when_the_pool_is_full():
+    pool = SMTPConnectionPool(lambda: FakeSMTP("h", 465), max_size=1)
+    with pool.connection():
+        pass
+    with pool.connection(fresh=True) as client:
+        assert client is FakeSMTP.instances[1]
+    assert FakeSMTP.instances[0].quit_called
+    assert pool.open_connections == 1
+
+
+def test_failed_retry_discards_session_and_raises():
+    class DroppingSMTP(FakeSMTP):
+        send_message = staticmethod(_drop)
+
+    service = SMTPService(
+        host="smtp.pool", port=465, username="u@example.com", password="pw", client_factory=DroppingSMTP, pool_size=1
+    )
+    with pytest.raises(EmailSendError):
+        service.send_email(["r@example.com"], "s", "b")
+    assert len(FakeSMTP.instances) == 2
+    assert service.pool.open_connections == 0
+
+
+def test_pool_is_thread_safe_and_bounded():
+    # high message limit so recycling does not open extra sessions
+    service = _service(pool_size=2, pool_max_messages=1000)
+    errors = []
+
+    def _worker():
+        try:
+            for _ in range(20):
+                service.send_email(["r@example.com"], "s", "b")
+        except Exception as e:  # pragma: no cover - surfaced by the assertion below
+            errors.append(e)
+
+    threads = [threading.Thread(target=_worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert len(FakeSMTP.instances) <= 2
+    assert sum(len(c.sent) for c in FakeSMTP.instances) == 160
+
+
+def test_from_settings_shares_pooled_service():
+    settings = SimpleNamespace(
+        SMTP_HOST="smtp.shared",
+        SMTP_PORT=465,
+        SMTP_USERNAME="u",
+        SMTP_PASSWORD="p",
+        SMTP_POOL_SIZE=3,
+        SMTP_POOL_MAX_MESSAGES=100,
+        SMTP_POOL_MAX_AGE=300.0,
+        SMTP_POOL_CHECK_AFTER=5.0,
+    )
+    first = SMTPService.from_settings(settings)
+    second = SMTPService.from_settings(settings)
+    assert first is second
+    assert first.pool is not None and first.pool.max_size == 3
+
+    settings.SMTP_POOL_SIZE = 0
+    unpooled = SMTPService.from_settings(settings)
+    assert unpooled.pool is None